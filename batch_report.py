@@ -0,0 +1,143 @@
+import argparse
+import html
+import json
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from dashboard_analysis.figure_io import UNPACK_JS, default_template, pack_figures
+from dashboard_analysis.headless import TAB_MODULES
+
+# Headless batch report: renders every dashboard tab in a process pool and writes a
+# self-contained HTML page (one shared plotly.js bundle) plus a JSON dump of the same content.
+# Figures arrive compact (typed arrays, no template); the page stores every distinct array
+# and the template once for the whole report.
+#
+#   python batch_report.py --out reports/            # all tabs, all cores
+#   python batch_report.py monetary_policy --workers 1
+
+TAB_TITLES = {
+    "summary": "Summary",
+    "monetary_policy": "Monetary & Inflation",
+    "fiscal_n_debt": "Fiscal & Debt",
+    "nps_analysis": "NPS Analysis",
+    "market_performance": "Market Performance",
+    "housing": "Housing",
+    "consumer_sentiment": "Consumer Sentiment",
+    "npish": "NPISH Consumption",
+}
+
+
+def render_tab_json(name):
+    # Runs inside a worker: DATA is loaded once per process on first use
+    from data_pipeline.data_cleaning import DATA
+    from dashboard_analysis.headless import run_tab
+
+    blocks = []
+    for block in run_tab(name, DATA):
+        if block["type"] == "plotly_chart":
+            block = {"type": "plotly_chart", "figure": json.loads(block["figure"].to_json())}
+        elif block["type"] == "dataframe":
+            block = {"type": "dataframe", "html": block["data"].to_html()}
+        blocks.append(block)
+    return name, blocks
+
+
+def render_all(names, workers=None):
+    if workers == 1:
+        return dict(map(render_tab_json, names))
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return dict(pool.map(render_tab_json, names))
+
+
+# --------------------------------------------
+# Output writers
+def block_html(block, fig_id):
+    kind = block["type"]
+    if kind == "plotly_chart":
+        return f'<div id="{fig_id}" class="chart"></div>'
+    if kind == "divider":
+        return "<hr>"
+    if kind == "metric":
+        delta = f'<div class="delta">{html.escape(block["delta"])}</div>' if block["delta"] else ""
+        return (f'<div class="metric"><div class="label">{html.escape(block["label"])}</div>'
+                f'<div class="value">{html.escape(block["value"])}</div>{delta}</div>')
+    if kind == "dataframe":
+        return block["html"]
+    tag = {"title": "h1", "header": "h2", "subheader": "h3"}.get(kind, "div")
+    return f'<{tag} class="{kind}">{html.escape(block["text"].strip())}</{tag}>'
+
+
+def write_html(report, path):
+    from plotly.offline import get_plotlyjs
+
+    sections, figures = [], {}
+    for name, blocks in report["tabs"].items():
+        body = []
+        for i, block in enumerate(blocks):
+            fig_id = f"{name}-{i}"
+            body.append(block_html(block, fig_id))
+            if block["type"] == "plotly_chart":
+                figures[fig_id] = block["figure"]
+        sections.append(f'<section id="{name}"><h2 class="tab">{TAB_TITLES[name]}</h2>{"".join(body)}</section>')
+
+    nav = " · ".join(f'<a href="#{name}">{TAB_TITLES[name]}</a>' for name in report["tabs"])
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<title>South Korea Macroeconomic Dashboard — {report["generated_at"]}</title>
+<script type="text/javascript">{get_plotlyjs()}</script>
+<style>
+body {{ font-family: sans-serif; max-width: 1200px; margin: auto; padding: 1em; }}
+.caption {{ color: #666; font-size: 0.9em; white-space: pre-line; }}
+.markdown, .info, .success, .warning, .error {{ white-space: pre-line; padding: 0.5em; border-radius: 4px; }}
+.info {{ background: #e8f0fe; }} .success {{ background: #e6f4ea; }}
+.warning {{ background: #fef7e0; }} .error {{ background: #fce8e6; }}
+.metric {{ display: inline-block; margin: 0.5em 2em 0.5em 0; }}
+.metric .value {{ font-size: 1.6em; }}
+</style></head>
+<body><h1>🇰🇷 South Korea Macroeconomic Dashboard</h1>
+<p>Generated {report["generated_at"]} · {nav}</p>
+{"".join(sections)}
+<script>
+{UNPACK_JS}
+const BUNDLE = {json.dumps(pack_figures(list(figures.values()), default_template()), separators=(",", ":"))};
+const IDS = {json.dumps(list(figures))};
+unpackFigures(BUNDLE).forEach((fig, i) => Plotly.newPlot(IDS[i], fig.data, fig.layout, {{responsive: true}}));
+</script>
+</body></html>"""
+    Path(path).write_text(page, encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all dashboard tabs to a static HTML/JSON report")
+    parser.add_argument("tabs", nargs="*", help=f"tabs to render (default: all of {', '.join(TAB_MODULES)})")
+    parser.add_argument("--out", default="reports", help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: all cores)")
+    args = parser.parse_args()
+
+    unknown = set(args.tabs) - set(TAB_MODULES)
+    if unknown:
+        parser.error(f"unknown tabs: {', '.join(sorted(unknown))}")
+
+    t0 = time.perf_counter()
+    names = args.tabs or list(TAB_MODULES)
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "tabs": render_all(names, args.workers),
+    }
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d")
+    (out / f"report_{stamp}.json").write_text(json.dumps(report), encoding="utf-8")
+    write_html(report, out / f"report_{stamp}.html")
+
+    n_figs = sum(b["type"] == "plotly_chart" for blocks in report["tabs"].values() for b in blocks)
+    print(f"{len(names)} tabs, {n_figs} figures -> {out} in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,23 @@
+import os
+
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import os
-import sys
 
-from data_pipeline.data_cleaning import DATA
+from data_pipeline.data_cleaning import DATA_VERSION
+from data_pipeline.date_range import data_span, month_range
+
+from dashboard_analysis.app_cache import data_view, load_data, vintage_data, vintages
 
 from dashboard_analysis.summary import summary_tab
 from dashboard_analysis.monetary_policy import monetary_policy_tab
 from dashboard_analysis.fiscal_n_debt import fiscal_and_debt_tab
 from dashboard_analysis.market_performance import market_performance_tab
+from dashboard_analysis.housing import housing_tab
+from dashboard_analysis.consumer_sentiment import consumer_sentiment_tab
+from dashboard_analysis.npish import npish_tab
 from dashboard_analysis.nps_analysis import nps_analysis_tab
+from dashboard_analysis.diagnostics import diagnostics_tab
+from dashboard_analysis.memory_profile import profile_render
 
 # Page configuration
 st.set_page_config(
@@ -19,39 +25,100 @@ st.set_page_config(
     layout="wide"
 )
 
-st.title("🇰🇷 South Korea Macroeconomic Dashboard (2018–2025)")
+title = st.empty()
 st.caption("Macro transmission–based analysis")
 
-# Load data
-@st.cache_data
-def load_data():
-    return DATA
-
+# Load data (cached loaders live in app_cache, shared with the warm-up)
 DATA = load_data()
 
+VINTAGES = vintages(DATA_VERSION)
+col_range, col_asof = st.columns([4, 1])
+as_of = col_asof.selectbox(
+    "Data as of",
+    options=list(VINTAGES) or [None],
+    format_func=lambda t: "Latest" if VINTAGES.get(t, DATA_VERSION) == DATA_VERSION else t.replace("T", " "),
+)
+version = VINTAGES.get(as_of, DATA_VERSION)
+if version != DATA_VERSION:
+    DATA = vintage_data(as_of)
+
+# Global date range: one slice of every frame, shared by all tabs
+MONTHS = month_range(*data_span(DATA))
+
+start, end = col_range.select_slider(
+    "Period",
+    options=MONTHS,
+    value=(MONTHS[0], MONTHS[-1]),
+    format_func=lambda d: f"{d:%Y-%m}",
+)
+
+# Tabs compare against 12-month lookbacks and latest readings: keep at least two years
+MIN_MONTHS = 24
+i, j = MONTHS.index(start), MONTHS.index(end)
+if j - i + 1 < MIN_MONTHS:
+    i = max(0, min(i, j - MIN_MONTHS + 1))
+    j = min(len(MONTHS) - 1, i + MIN_MONTHS - 1)
+    start, end = MONTHS[i], MONTHS[j]
+    st.caption(f"Period widened to the {MIN_MONTHS}-month minimum: {start:%Y-%m} – {end:%Y-%m}")
+title.title(f"🇰🇷 South Korea Macroeconomic Dashboard ({start.year}–{end.year})")
+
+# A slider end left at its limit means an open range: longer histories (NPS since 1988)
+# and provisional nowcasts past the last month stay in
+start = None if start == MONTHS[0] else start
+end = None if end == MONTHS[-1] else end + pd.offsets.MonthEnd(0)
+
+DATA = data_view(start, end, version, DATA)
+
+# Memory diagnostics page: profiles every session's tab renders, so it is a server-side
+# switch (DASHBOARD_DIAGNOSTICS=1 in the server's environment), never a visitor's choice
+DIAGNOSTICS = os.environ.get("DASHBOARD_DIAGNOSTICS") == "1"
+profiles = {}
+
+def render(label, tab, DATA):
+    if DIAGNOSTICS:
+        profiles[label] = profile_render(tab, DATA)
+    else:
+        tab(DATA)
+
 # Tabs (Macro Transmission Channels)
 tabs = st.tabs([
     "🟦 Monetary & Inflation",
     "🟩 Fiscal & Debt",
     "🟧 NPS Analysis",
     "🟨 Market Performance",
-    
+    "🏠 Housing",
+    "💬 Consumer Sentiment",
+    "🤝 NPISH",
+    *(["🛠 Diagnostics"] if DIAGNOSTICS else []),
 ])
  
 ## Tab 1: Monetary & Inflation
 with tabs[0]:
-    monetary_policy_tab(DATA)
+    render("monetary_policy", monetary_policy_tab, DATA)
 
 ## Tab 2: Fiscal & Government Debt
 with tabs[1]:
-    fiscal_and_debt_tab(DATA)   
+    render("fiscal_n_debt", fiscal_and_debt_tab, DATA)
 
 ## Tab 3: NPS Analysis
 with tabs[2]:
-    nps_analysis_tab(DATA)
+    render("nps_analysis", nps_analysis_tab, DATA)
 
 ## Tab 4: Market Performance 
 with tabs[3]:
-    market_performance_tab(DATA)
+    render("market_performance", market_performance_tab, DATA)
+
+## Indicator tabs (declared as chart specs)
+with tabs[4]:
+    render("housing", housing_tab, DATA)
+
+with tabs[5]:
+    render("consumer_sentiment", consumer_sentiment_tab, DATA)
 
+with tabs[6]:
+    render("npish", npish_tab, DATA)
 
+## Diagnostics
+if DIAGNOSTICS:
+    with tabs[7]:
+        diagnostics_tab(DATA, profiles)
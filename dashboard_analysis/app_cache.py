@@ -0,0 +1,41 @@
+import streamlit as st
+
+from data_pipeline.date_range import read_data, slice_data, store_version
+from data_pipeline.vintage import data_as_of, list_vintages, record_vintage
+
+# The dashboard's process-wide caches, importable so a warm-up can fill the same entries
+# the first session would (st.cache_* entries are keyed by function, not by caller).
+
+
+@st.cache_data
+def load_data():
+    from data_pipeline.data_cleaning import DATA
+    return DATA
+
+
+# Point-in-time: snapshot each new data version once, then let users pick a past vintage
+@st.cache_resource
+def vintages(version):
+    from data_pipeline.data_cleaning import frames
+    try:
+        record_vintage(frames, version)
+    except (OSError, ValueError):
+        pass  # read-only deployment or unreadable history: serve whatever history exists
+    return {v["recorded_at"]: v["version"] for v in reversed(list_vintages())}
+
+
+@st.cache_resource(max_entries=8)
+def vintage_data(recorded_at):
+    return data_as_of(recorded_at)
+
+
+# Views are cached per range (cache_resource: no pickling, the slices stay views).
+# When the published columnar store is current, the range is pushed down into its reads.
+@st.cache_resource(max_entries=32)
+def data_view(start, end, version, _data):
+    if store_version() == version:
+        view = read_data(start, end)
+        # Nowcasts, forecasts and the derived layer are not published: slice them in memory
+        view.update(slice_data({b: f for b, f in _data.items() if b not in view}, start, end))
+        return view
+    return slice_data(_data, start, end)
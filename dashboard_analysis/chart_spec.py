@@ -0,0 +1,274 @@
+import hashlib
+
+import pandas as pd
+import streamlit as st
+
+from dashboard_analysis.figure_io import compact_figure
+
+# Declarative charts: a chart is a dict of series, transforms, axes and annotations, built
+# into a Plotly figure by one shared, cached render path.
+#
+#   {"title": "...", "x": "Date", "y": "Index", "y2": "Base Rate (%)",
+#    "series": [{"source": "monthly/house_price", "column": "Apartment(Seoul)",
+#                "transform": "yoy", "name": "Seoul Apartments (YoY %)",
+#                "kind": "line" | "markers" | "bar" | "area", "axis": "y" | "y2",
+#                "dash": "dot", "color": "orange", "opacity": 0.65, "forecast": True}],
+#    "events": ["covid"], "hlines": [{"y": 0, "line_dash": "dash"}], "legend": "top"}
+#
+# A series without "source" reads `column` from the frame passed to figure() (for charts of
+# columns a tab derives itself; its periods per year come from the spacing of the frame's dates). Transformed series
+# are cached on the content of the frame they come from, figures on the spec and the content
+# of their inputs, so both are computed once per data version and period and shared across
+# reruns, sessions and tabs. A monthly level series with "forecast" is continued by its
+# forecast cone (data_pipeline.forecast) when one is loaded.
+#
+# A tab declared as {"title": ..., "sections": [...]} is rendered by render_tab; each section
+# may have a subheader, info, metrics ({"label", "series", "format", "delta"}: latest value and
+# change on the previous observation), charts (side by side with "columns") and a caption.
+
+# Shaded periods shared by every chart that names them
+EVENTS = {
+    "covid": {"x0": "2020-01-01", "x1": "2022-03-01", "label": "COVID-19 Pandemic"},
+}
+
+LEGENDS = {
+    "top": dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+}
+
+PERIODS_PER_YEAR = {"daily": 252, "monthly": 12, "quarterly": 4, "yearly": 1}
+
+# name -> f(series, periods per year)
+TRANSFORMS = {
+    "level": lambda s, n: s,
+    "change": lambda s, n: s.diff(),
+    "pct_change": lambda s, n: s.pct_change(fill_method=None) * 100,
+    "change_bp": lambda s, n: s.diff() * 100,
+    "yoy": lambda s, n: s.pct_change(n, fill_method=None) * 100,
+    "yoy_change": lambda s, n: s.diff(n),
+    "rebased": lambda s, n: s / s.dropna().iloc[0] * 100,
+    "yearly_mean": lambda s, n: s.resample("YS").mean(),
+}
+
+
+def frame_key(df):
+    # Content hash of a frame (index, values and column names)
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(repr(list(df.columns)).encode())
+    return digest.hexdigest()[:16]
+
+
+def frame_periods(index):
+    # Periods per year of a frame a tab derives itself, from the median spacing of its dates
+    if len(index) < 2:
+        return 1
+    days = pd.Series(index).diff().median().days
+    bucket = "daily" if days <= 4 else "monthly" if days <= 31 else "quarterly" if days <= 92 else "yearly"
+    return PERIODS_PER_YEAR[bucket]
+
+
+def source_frame(DATA, source):
+    bucket, name = source.split("/")
+    return DATA[bucket][name]
+
+
+def _key(DATA, source, keys):
+    if source not in keys:
+        keys[source] = frame_key(source_frame(DATA, source))
+    return keys[source]
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def transformed(source, column, transform, key, _DATA):
+    bucket = source.split("/")[0]
+    s = source_frame(_DATA, source)[column].sort_index()
+    return TRANSFORMS[transform](s, PERIODS_PER_YEAR[bucket])
+
+
+def series(spec, DATA, frame=None, keys=None):
+    # The values of one series spec, transformed
+    keys = {} if keys is None else keys
+    transform = spec.get("transform", "level")
+    if "source" not in spec:
+        return TRANSFORMS[transform](frame[spec["column"]], frame_periods(frame.index))
+    return transformed(spec["source"], spec["column"], transform, _key(DATA, spec["source"], keys), DATA)
+
+
+def latest(spec, DATA, keys=None):
+    # -> (latest value, change vs the previous observation, its date) or None
+    s = series(spec, DATA, keys=keys).dropna()
+    if s.empty:
+        return None
+    return s.iloc[-1], (s.iloc[-1] - s.iloc[-2]) if len(s) > 1 else None, s.index[-1]
+
+
+def period_label(date, source):
+    bucket = source.split("/")[0]
+    if bucket == "quarterly":
+        return f"{date.year} Q{date.quarter}"
+    return date.strftime("%Y" if bucket == "yearly" else "%b %Y")
+
+
+def add_event(fig, name, x_range=None):
+    # Shades a named period, only where it overlaps the charted dates
+    event = EVENTS[name]
+    if x_range is not None and (pd.Timestamp(event["x1"]) < x_range[0] or pd.Timestamp(event["x0"]) > x_range[1]):
+        return fig
+    fig.add_vrect(
+        x0=event["x0"], x1=event["x1"], fillcolor="gray", opacity=0.1, layer="below",
+        annotation_text=event["label"], annotation_position="top left",
+    )
+    return fig
+
+
+def forecast_cone(DATA, source, column):
+    # Saved forecast of a monthly series (mean and interval bands by future month), or None
+    bucket, name = source.split("/")
+    df = DATA.get("forecast", {}).get(name) if bucket == "monthly" else None
+    if df is None or column not in df.columns.get_level_values("column"):
+        return None
+    cone = df[column].dropna()
+    return None if cone.empty else cone
+
+
+def _forecasts(spec):
+    return spec.get("forecast") and "source" in spec and spec.get("transform", "level") == "level"
+
+
+def _rgba(color, alpha):
+    from plotly.colors import hex_to_rgb
+
+    r, g, b = hex_to_rgb(color) if color and color.startswith("#") else (128, 128, 128)
+    return f"rgba({r},{g},{b},{alpha})"
+
+
+def add_cone(fig, cone, name, color=None, anchor=None, yaxis="y"):
+    # Dashed mean and shaded 95% / 80% bands; `anchor` (the last observation, a one-row
+    # Series) joins the cone to the line it continues
+    import plotly.graph_objects as go
+
+    if anchor is not None and len(anchor):
+        start = pd.DataFrame({c: anchor.iloc[-1] for c in cone.columns}, index=anchor.index[-1:])
+        cone = pd.concat([start, cone])
+    x = list(cone.index)
+    for level, alpha in [(95, 0.12), (80, 0.22)]:
+        fig.add_trace(go.Scatter(x=x + x[::-1], y=[*cone[f"upper_{level}"], *cone[f"lower_{level}"][::-1]],
+                                 fill="toself", fillcolor=_rgba(color, alpha), line=dict(width=0),
+                                 hoverinfo="skip", showlegend=False, legendgroup=name, yaxis=yaxis))
+    fig.add_trace(go.Scatter(x=x, y=cone["mean"].to_numpy(), name=f"{name} — Forecast (80/95% bands)",
+                             mode="lines", line=dict(color=color or "gray", dash="dash"), legendgroup=name, yaxis=yaxis))
+    return fig
+
+
+def _trace(spec, s):
+    import plotly.graph_objects as go
+
+    common = dict(x=s.index, y=s.to_numpy(), name=spec.get("name", spec["column"]),
+                  yaxis="y2" if spec.get("axis") == "y2" else "y")
+    if spec.get("opacity") is not None:
+        common["opacity"] = spec["opacity"]
+    kind = spec.get("kind", "line")
+    if kind == "bar":
+        return go.Bar(**common, marker_color=spec.get("color"))
+    line = dict(color=spec.get("color"), dash=spec.get("dash"))
+    if kind == "area":
+        return go.Scatter(**common, mode="lines", stackgroup=spec.get("stack", "one"), line=line)
+    return go.Scatter(**common, mode="lines+markers" if kind == "markers" else "lines", line=line)
+
+
+def build_figure(spec, DATA, frame=None, keys=None):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    x_min = x_max = None
+    for s_spec in spec["series"]:
+        s = series(s_spec, DATA, frame, keys)
+        fig.add_trace(_trace(s_spec, s))
+        cone = forecast_cone(DATA, s_spec["source"], s_spec["column"]) if _forecasts(s_spec) else None
+        if cone is not None:
+            add_cone(fig, cone, s_spec.get("name", s_spec["column"]), s_spec.get("color"), s.dropna().iloc[-1:],
+                     "y2" if s_spec.get("axis") == "y2" else "y")
+        if len(s):
+            x_min = s.index[0] if x_min is None else min(x_min, s.index[0])
+            x_max = s.index[-1] if x_max is None else max(x_max, s.index[-1])
+
+    layout = dict(
+        title=spec["title"],
+        xaxis_title=spec.get("x"),
+        yaxis=dict(title=spec.get("y"), zeroline=True),
+        legend=LEGENDS[spec.get("legend", "top")],
+    )
+    if any(s.get("axis") == "y2" for s in spec["series"]):
+        layout["yaxis2"] = dict(title=spec.get("y2"), overlaying="y", side="right", zeroline=False, showgrid=False)
+    if any(s.get("kind") == "bar" for s in spec["series"]):
+        layout["barmode"] = spec.get("barmode", "relative")
+    fig.update_layout(**layout)
+
+    for h in spec.get("hlines", []):
+        fig.add_hline(**{"line_dash": "dash", "line_color": "gray", **h})
+    for name in spec.get("events", []):
+        add_event(fig, name, None if x_min is None else (x_min, x_max))
+    return compact_figure(fig)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_figure(spec, keys, _DATA, _frame):
+    return build_figure(spec, _DATA, _frame)
+
+
+def figure(spec, DATA, frame=None, keys=None):
+    # Cached on the spec plus the content of every frame the chart reads
+    keys = {} if keys is None else keys
+    sources = {s["source"] for s in spec["series"] if "source" in s}
+    sources |= {f"forecast/{s['source'].split('/')[1]}" for s in spec["series"] if _forecasts(s)
+                and s["source"].split("/")[1] in DATA.get("forecast", {})}
+    inputs = tuple(sorted({_key(DATA, source, keys) for source in sources}))
+    if frame is not None:
+        inputs += (frame_key(frame),)
+    return _cached_figure(spec, inputs, DATA, frame)
+
+
+def has_data(spec, DATA):
+    # Every DATA source of the spec present and non-empty in the current view
+    for s in spec["series"]:
+        if "source" not in s:
+            continue
+        bucket, name = s["source"].split("/")
+        df = DATA.get(bucket, {}).get(name)
+        if df is None or s["column"] not in df.columns or df[s["column"]].dropna().empty:
+            return False
+    return True
+
+
+def render_tab(tab, DATA, out):
+    # Renders a declared tab through `out` (the calling tab module's `st`, so headless runs
+    # can swap it)
+    keys = {}
+    out.title(tab["title"])
+    for section in tab["sections"]:
+        if "subheader" in section:
+            out.subheader(section["subheader"])
+        if "info" in section:
+            out.info(section["info"])
+
+        metrics = [m for m in section.get("metrics", []) if has_data({"series": [m["series"]]}, DATA)]
+        readings = [r for r in (latest(m["series"], DATA, keys) for m in metrics) if r is not None]
+        if metrics and len(readings) == len(metrics):
+            for col, metric, (value, delta, date) in zip(out.columns(len(metrics)), metrics, readings):
+                fmt = metric.get("format", ",.2f")
+                col.metric(
+                    f"{metric['label']} ({period_label(date, metric['series']['source'])})", format(value, fmt),
+                    None if delta is None else f"{delta:+{fmt}} {metric.get('delta', '')}".rstrip(),
+                )
+
+        charts = [c for c in section.get("charts", []) if has_data(c, DATA)]
+        n = section.get("columns", 1)
+        for i in range(0, len(charts), n):
+            row = charts[i:i + n]
+            targets = out.columns(len(row)) if n > 1 else [out]
+            for target, chart in zip(targets, row):
+                target.plotly_chart(figure(chart, DATA, keys=keys), use_container_width=True)
+
+        if "caption" in section:
+            out.caption(section["caption"])
+        if section.get("divider", True):
+            out.divider()
@@ -0,0 +1,115 @@
+import streamlit as st
+
+from dashboard_analysis.chart_spec import render_tab
+
+CTS = "monthly/cts"
+NEUTRAL = [{"y": 100, "annotation_text": "Neutral (100)"}]
+
+TAB = {
+    "title": "💬 Consumer Sentiment",
+    "sections": [
+        {
+            "subheader": "Composite Consumer Sentiment",
+            "info": (
+                "Consumer Tendency Survey indices are balances of household answers: above 100 "
+                "more households are optimistic than pessimistic, below 100 the reverse."
+            ),
+            "metrics": [
+                {"label": "Composite Sentiment (CCSI)",
+                 "series": {"source": CTS, "column": "Composite Consumer Sentiment Index"}, "format": ".1f",
+                 "delta": "MoM"},
+                {"label": "Living Standard Outlook",
+                 "series": {"source": CTS, "column": "Expectations of Living Standard of Household"},
+                 "format": ".0f", "delta": "MoM"},
+                {"label": "Interest Rate Expectations",
+                 "series": {"source": CTS, "column": "Expectations of Interest Rates"}, "format": ".0f",
+                 "delta": "MoM"},
+            ],
+            "charts": [
+                {
+                    "title": "Composite Consumer Sentiment Index (CCSI)",
+                    "y": "Index",
+                    "series": [{"source": CTS, "column": "Composite Consumer Sentiment Index", "name": "CCSI",
+                                "forecast": True}],
+                    "hlines": NEUTRAL,
+                    "events": ["covid"],
+                },
+            ],
+        },
+        {
+            "subheader": "Current Conditions vs Expectations",
+            "columns": 2,
+            "charts": [
+                {
+                    "title": "Domestic Economy: Current vs Expected",
+                    "y": "Index",
+                    "series": [
+                        {"source": CTS, "column": "Domestic Economic Situation", "name": "Current"},
+                        {"source": CTS, "column": "Expectations of Domestic Economic Situation", "name": "Expected",
+                         "dash": "dot"},
+                    ],
+                    "hlines": NEUTRAL,
+                },
+                {
+                    "title": "Household Living Standard: Current vs Expected",
+                    "y": "Index",
+                    "series": [
+                        {"source": CTS, "column": "Living Standard of Household", "name": "Current"},
+                        {"source": CTS, "column": "Expectations of Living Standard of Household", "name": "Expected",
+                         "dash": "dot"},
+                    ],
+                    "hlines": NEUTRAL,
+                },
+                {
+                    "title": "Labour Market Expectations",
+                    "y": "Index",
+                    "series": [
+                        {"source": CTS, "column": "Expectations of Employment Situation", "name": "Employment"},
+                        {"source": CTS, "column": "Expectations of Wages", "name": "Wages", "dash": "dot"},
+                    ],
+                    "hlines": NEUTRAL,
+                },
+                {
+                    "title": "Household Balance Sheets: Saving and Debt",
+                    "y": "Index",
+                    "series": [
+                        {"source": CTS, "column": "Present Saving of Household", "name": "Saving (current)"},
+                        {"source": CTS, "column": "Expectations of Household Saving", "name": "Saving (expected)",
+                         "dash": "dot"},
+                        {"source": CTS, "column": "Present Debt of Household", "name": "Debt (current)"},
+                        {"source": CTS, "column": "Expectations of Household Debt", "name": "Debt (expected)",
+                         "dash": "dot"},
+                    ],
+                    "hlines": NEUTRAL,
+                },
+            ],
+            "caption": (
+                "Expectations running below current conditions signal that households expect things "
+                "to worsen; the gap tends to open ahead of slowdowns in private consumption."
+            ),
+        },
+        {
+            "subheader": "Interest Rate Expectations vs Policy",
+            "charts": [
+                {
+                    "title": "Households' Interest Rate Expectations vs BOK Base Rate",
+                    "y": "CSI", "y2": "Base Rate (%)",
+                    "series": [
+                        {"source": CTS, "column": "Expectations of Interest Rates", "name": "Interest Rate Expectations (CSI)"},
+                        {"source": "monthly/bok_rate", "column": "base_rate", "name": "BOK Base Rate (%)",
+                         "axis": "y2", "kind": "markers"},
+                    ],
+                    "hlines": NEUTRAL,
+                },
+            ],
+            "caption": (
+                "Rate expectations lead the policy rate: they peak ahead of the end of a hiking "
+                "cycle and fall below 100 once households price in cuts."
+            ),
+        },
+    ],
+}
+
+
+def consumer_sentiment_tab(DATA):
+    render_tab(TAB, DATA, st)
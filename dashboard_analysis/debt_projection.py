@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+# Debt dynamics (all ratios as share of GDP):
+#   d_t = d_{t-1} * (1 + r_t) / (1 + g_t) - pb_t
+# d  = gross external debt: the data has no central-government debt stock, so the stock is
+#      a proxy and the tab labels it as such
+# r  = government borrowing rate, the yearly average 10-year KTB yield (central-government
+#      interest payments over external debt would mix a fiscal flow with a mostly private stock)
+# g  = nominal GDP growth
+# pb = central-government primary balance (surplus > 0)
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+# --------------------------------------------
+# Calibration from the fiscal tab's derived series
+def debt_dynamics_inputs(df_fisc, df_debt_gdp_year, ktb_10y):
+    # Fiscal series are year-to-date cumulative, so December is the full-year flow
+    annual = df_fisc[df_fisc.index.month == 12][["primary_balance"]]
+    annual.index = annual.index.to_period("Y").to_timestamp()
+    # Yields in %, averaged over the year
+    annual["r"] = ktb_10y.resample("YS").mean() / 100
+
+    df = df_debt_gdp_year[["Gross External Debt", "GDP"]].join(annual, how="inner")
+
+    ratios = pd.DataFrame({
+        "r": df["r"],
+        "g": df["GDP"].pct_change(),
+        "pb": df["primary_balance"] / df["GDP"],
+    }).dropna()
+    if len(ratios) < 2:
+        return None
+
+    latest = df_debt_gdp_year.dropna().iloc[-1]
+
+    return {
+        "base_year": df_debt_gdp_year.dropna().index[-1].year,
+        "d0": latest["Gross External Debt"] / latest["GDP"],
+        "r_mean": ratios["r"].mean(), "r_std": ratios["r"].std(),
+        "g_mean": ratios["g"].mean(), "g_std": ratios["g"].std(),
+        "pb_mean": ratios["pb"].mean(), "pb_std": ratios["pb"].std(),
+    }
+
+
+# --------------------------------------------
+# Monte Carlo engine
+#
+# Shocks are drawn per block of SEED_BLOCK paths, each from its own child seed, and a chunk
+# (the unit of work of a process-pool worker) is a run of whole blocks, so a seed gives the
+# same paths for any chunk size or worker count.
+#
+# fan_chart_bands takes exact percentiles over every path, so the float32 matrix of all
+# paths is held at once: n_paths * (horizon + 1) * 4 bytes (2.2 MB for the tab's 50,000
+# paths over 10 years). Shock draws only live for one chunk. MAX_PATHS_BYTES caps the matrix.
+SEED_BLOCK = 1_000
+MAX_PATHS_BYTES = 256 * 1024 ** 2
+
+
+def _simulate_chunk(args):
+    blocks, horizon, d0, r_mean, r_std, g_mean, g_std, pb_mean, pb_std = args
+
+    draws = []
+    for seed, n in blocks:
+        rng = np.random.default_rng(seed)
+        draws.append((
+            rng.normal(r_mean, r_std, size=(n, horizon)),
+            rng.normal(g_mean, g_std, size=(n, horizon)),
+            rng.normal(pb_mean, pb_std, size=(n, horizon)),
+        ))
+    r, g, pb = (np.concatenate(d) for d in zip(*draws))
+
+    # Closed form of the recursion: d_t = A_t * (d0 - sum_{k<=t} pb_k / A_k)
+    # with A_t the cumulative (1 + r) / (1 + g) factor, so no Python loop over paths or years
+    a = np.cumprod((1 + r) / (1 + g), axis=1)
+    paths = a * (d0 - np.cumsum(pb / a, axis=1))
+
+    out = np.empty((len(r), horizon + 1), dtype=np.float32)
+    out[:, 0] = d0
+    out[:, 1:] = paths
+    return out
+
+
+def simulate_debt_paths(inputs, horizon=10, n_paths=50_000, chunk_size=10_000, workers=1, seed=0):
+    # workers > 1 runs the chunks in spawned processes (the caller may be a threaded server
+    # process, which must not fork); chunk_size is rounded up to whole seed blocks
+    size = n_paths * (horizon + 1) * np.dtype(np.float32).itemsize
+    if size > MAX_PATHS_BYTES:
+        raise ValueError(f"{n_paths} paths over {horizon} years need {size / 1024 ** 2:.0f} MB, above MAX_PATHS_BYTES")
+
+    n_blocks = -(-n_paths // SEED_BLOCK)
+    seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+    blocks = [(s, min(SEED_BLOCK, n_paths - i * SEED_BLOCK)) for i, s in enumerate(seeds)]
+    per_chunk = max(1, -(-chunk_size // SEED_BLOCK))
+
+    params = (
+        inputs["d0"],
+        inputs["r_mean"], inputs["r_std"],
+        inputs["g_mean"], inputs["g_std"],
+        inputs["pb_mean"], inputs["pb_std"],
+    )
+    tasks = [(blocks[i:i + per_chunk], horizon) + params for i in range(0, n_blocks, per_chunk)]
+
+    paths = np.empty((n_paths, horizon + 1), dtype=np.float32)
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            chunks = pool.map(_simulate_chunk, tasks)
+            start = 0
+            for chunk in chunks:
+                paths[start:start + len(chunk)] = chunk
+                start += len(chunk)
+    else:
+        start = 0
+        for task in tasks:
+            chunk = _simulate_chunk(task)
+            paths[start:start + len(chunk)] = chunk
+            start += len(chunk)
+    return paths
+
+
+def fan_chart_bands(paths, base_year, percentiles=PERCENTILES):
+    bands = np.percentile(paths, percentiles, axis=0).T * 100
+    index = pd.to_datetime([f"{base_year + h}-01-01" for h in range(paths.shape[1])])
+    index.name = "date"
+    return pd.DataFrame(bands, index=index, columns=[f"p{p}" for p in percentiles])
+
+
+def project_debt(inputs, horizon=10, n_paths=50_000, chunk_size=10_000, workers=1, seed=0):
+    paths = simulate_debt_paths(
+        inputs, horizon=horizon, n_paths=n_paths, chunk_size=chunk_size, workers=workers, seed=seed
+    )
+    return fan_chart_bands(paths, inputs["base_year"])
@@ -0,0 +1,56 @@
+import streamlit as st
+import pandas as pd
+
+from dashboard_analysis.memory_profile import MB, frame_memory
+
+
+# Runtime memory diagnostics (server started with DASHBOARD_DIAGNOSTICS=1).
+# profiles: {tab label: profile_render result} from this session's renders
+def diagnostics_tab(DATA, profiles):
+
+    st.title("🛠 Memory Diagnostics")
+
+    frames = frame_memory(DATA)
+    peaks = [p["peak"] for p in profiles.values()]
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Shared panel (DATA)", f"{frames['bytes'].sum() / MB:.2f} MB")
+    c2.metric("Largest tab render peak", f"{max(peaks, default=0) / MB:.2f} MB")
+    c3.metric("Frames", len(frames))
+
+    st.caption(
+        "DATA is cached once per process and shared by every session; each session adds its "
+        "render peaks on top. Peaks are measured with tracemalloc during this run and include "
+        "the copies held for the audit below, so they overstate a normal render slightly."
+    )
+
+    st.subheader("Cleaned panel: deep memory per frame")
+    st.dataframe(
+        frames.assign(MB=frames["bytes"] / MB).sort_values("bytes", ascending=False),
+        hide_index=True, use_container_width=True,
+    )
+
+    st.subheader("Tab renders")
+    rows = []
+    for tab, profile in profiles.items():
+        copies = profile["copies"]
+        rows.append({
+            "tab": tab,
+            "peak MB": profile["peak"] / MB,
+            "retained MB": profile["retained"] / MB,
+            "copies": int(copies["copies"].sum()),
+            "copied MB": copies["bytes"].sum() / MB,
+            "avoidable MB": copies.loc[copies["avoidable"], "bytes"].sum() / MB,
+        })
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+    avoidable = [
+        c.assign(tab=tab) for tab, p in profiles.items()
+        for c in [p["copies"][p["copies"]["avoidable"]]] if len(c)
+    ]
+    if avoidable:
+        st.warning("Copies never modified after they were made: read the original frame instead.")
+        st.dataframe(pd.concat(avoidable, ignore_index=True)[["tab", "site", "copies", "bytes"]],
+                     hide_index=True, use_container_width=True)
+    else:
+        st.success("No avoidable copies in this run.")
@@ -0,0 +1,196 @@
+import base64
+import json
+
+import numpy as np
+
+# Compact serialization of Plotly figures.
+#
+# - numeric and date arrays are sent as Plotly typed arrays ({"dtype", "bdata"} base64)
+#   instead of JSON number / ISO date lists; dates become epoch milliseconds on a date axis
+# - values are rounded to display precision first, so whole-number series fit int16/int32
+#   and everything else fits float32
+# - the layout template (several KB per figure) is dropped where the renderer supplies its own
+#   (Streamlit's theme), or sent once per bundle by pack_figures
+# - pack_figures also stores identical arrays once, e.g. the index shared by every trace
+#   of a dual-axis chart or by all figures of a tab
+
+SIGNIFICANT_DIGITS = 5
+ARRAY_KEYS = ("x", "y", "base", "customdata")
+
+
+def typed_array(values, significant=SIGNIFICANT_DIGITS):
+    arr = np.asarray(values)
+
+    if np.issubdtype(arr.dtype, np.datetime64):
+        ms = arr.astype("datetime64[ms]")
+        out = ms.astype("int64").astype("float64")
+        out[np.isnat(ms)] = np.nan
+        return {"dtype": "f8", "bdata": base64.b64encode(out.tobytes()).decode()}, True
+
+    if arr.dtype.kind not in "iuf" or arr.ndim != 1:
+        return None, False
+
+    arr = arr.astype("float64")
+    finite = np.isfinite(arr)
+    if finite.any():
+        top = np.abs(arr[finite]).max()
+        decimals = significant - 1 - (int(np.floor(np.log10(top))) if top > 0 else 0)
+        arr = np.round(arr, decimals)
+
+    if finite.all() and np.array_equal(arr, np.round(arr)):
+        for dtype, info in (("i2", np.iinfo(np.int16)), ("i4", np.iinfo(np.int32))):
+            if arr.min(initial=0) >= info.min and arr.max(initial=0) <= info.max:
+                data = arr.astype(dtype.replace("i", "<i"))
+                return {"dtype": dtype, "bdata": base64.b64encode(data.tobytes()).decode()}, False
+
+    return {"dtype": "f4", "bdata": base64.b64encode(arr.astype("<f4").tobytes()).decode()}, False
+
+
+def compact_figure(fig, significant=SIGNIFICANT_DIGITS, strip_template=True):
+    import plotly.graph_objects as go
+
+    spec = fig.to_plotly_json() if isinstance(fig, go.Figure) else fig
+    data, layout = [], dict(spec.get("layout", {}))
+    if strip_template:
+        layout.pop("template", None)
+
+    date_axes = set()
+    for trace in spec.get("data", []):
+        trace = dict(trace)
+        for key in ARRAY_KEYS:
+            values = trace.get(key)
+            if isinstance(values, dict) and "bdata" in values and "shape" not in values:
+                # plotly.py already base64-encodes numpy arrays, but at full float64 precision
+                values = np.frombuffer(base64.b64decode(values["bdata"]), dtype=values["dtype"])
+            if values is None or isinstance(values, (dict, str)) or np.ndim(values) != 1:
+                continue
+            if isinstance(values, (list, tuple)) and values and hasattr(values[0], "to_datetime64"):
+                values = np.array([v.to_datetime64() for v in values])
+            encoded, is_date = typed_array(values, significant)
+            if encoded is not None:
+                trace[key] = encoded
+                if is_date and key in ("x", "y"):
+                    ref = trace.get(f"{key}axis", key)
+                    date_axes.add(f"{key}axis{ref[1:]}")
+        data.append(trace)
+
+    for axis in date_axes:
+        layout[axis] = {**layout.get(axis, {}), "type": "date"}
+
+    out = go.Figure({"data": data, "layout": layout}, skip_invalid=True)
+    if strip_template:
+        # go.Figure fills in the default template on construction; drop it again
+        out.layout.template = None
+    return out
+
+
+def to_compact_json(fig, significant=SIGNIFICANT_DIGITS, strip_template=True):
+    return compact_figure(fig, significant, strip_template).to_json(validate=False)
+
+
+def payload_size(fig):
+    import plotly.graph_objects as go
+
+    return len(fig.to_json().encode()) if isinstance(fig, go.Figure) else len(json.dumps(fig).encode())
+
+
+# --------------------------------------------
+# Bundles: shared arrays and template stored once
+def default_template():
+    # What plotly.py would have embedded in every figure before compact_figure stripped it
+    import plotly.io as pio
+    return pio.templates[pio.templates.default].to_plotly_json()
+
+
+def pack_figures(figures, template=None):
+    arrays, index, packed = [], {}, []
+
+    def ref(value):
+        if isinstance(value, dict) and "bdata" in value:
+            key = (value["dtype"], value["bdata"])
+            if key not in index:
+                index[key] = len(arrays)
+                arrays.append(value)
+            return {"$ref": index[key]}
+        return value
+
+    for fig in figures:
+        fig = json.loads(fig) if isinstance(fig, str) else fig
+        packed.append({
+            "data": [{key: ref(value) for key, value in trace.items()} for trace in fig.get("data", [])],
+            "layout": fig.get("layout", {}),
+        })
+
+    return {"arrays": arrays, "template": template, "figures": packed}
+
+
+# Resolves a pack_figures bundle in the browser: unpackFigures(bundle) -> [{data, layout}]
+UNPACK_JS = """
+function unpackFigures(bundle) {
+    const resolve = v => (v && v["$ref"] !== undefined) ? bundle.arrays[v["$ref"]] : v;
+    return bundle.figures.map(fig => ({
+        data: fig.data.map(trace => Object.fromEntries(Object.entries(trace).map(([k, v]) => [k, resolve(v)]))),
+        layout: bundle.template ? Object.assign({template: bundle.template}, fig.layout) : fig.layout,
+    }));
+}
+"""
+
+
+# --------------------------------------------
+# Payload check: python -m dashboard_analysis.figure_io --min-ratio 2 --max-bytes 12000
+# (the 2x floor also runs in the test suite: tests/test_figure_io.py)
+def measure_tabs():
+    import importlib
+    from data_pipeline.data_cleaning import DATA
+    from dashboard_analysis.headless import TAB_MODULES, run_tab
+
+    from dashboard_analysis import chart_spec
+
+    rows = []
+    for tab, (module_name, _) in TAB_MODULES.items():
+        # Render with compaction switched off to get the raw figures plotly.py would send: in
+        # the tab module and in the chart-spec engine, whose cached figures are dropped so
+        # none built compact is reused (and none built raw outlives the measurement)
+        modules = [m for m in (importlib.import_module(module_name), chart_spec) if hasattr(m, "compact_figure")]
+        saved = {m: m.compact_figure for m in modules}
+        for m in modules:
+            m.compact_figure = lambda fig, *args, **kwargs: fig
+        chart_spec._cached_figure.clear()
+        try:
+            blocks = run_tab(tab, DATA)
+        finally:
+            for m, compact in saved.items():
+                m.compact_figure = compact
+            chart_spec._cached_figure.clear()
+        for i, block in enumerate(b for b in blocks if b["type"] == "plotly_chart"):
+            rows.append((tab, i, payload_size(block["figure"]), payload_size(compact_figure(block["figure"]))))
+    return rows
+
+
+def main():
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Compare raw and compact Plotly payload sizes per chart")
+    parser.add_argument("--min-ratio", type=float, default=2.0, help="fail if total raw/compact is below this")
+    parser.add_argument("--max-bytes", type=int, default=None, help="fail if any compact chart exceeds this")
+    args = parser.parse_args()
+
+    rows = measure_tabs()
+    for tab, i, raw, small in rows:
+        print(f"{tab:<20} #{i:<2} {raw:>9,} -> {small:>8,} bytes  ({raw / small:4.1f}x)")
+    raw_total, small_total = sum(r[2] for r in rows), sum(r[3] for r in rows)
+    ratio = raw_total / small_total
+    print(f"{'total':<24} {raw_total:>9,} -> {small_total:>8,} bytes  ({ratio:4.1f}x)")
+
+    failures = []
+    if ratio < args.min_ratio:
+        failures.append(f"total ratio {ratio:.2f} below {args.min_ratio}")
+    if args.max_bytes:
+        failures += [f"{tab} #{i}: {small:,} bytes" for tab, i, _, small in rows if small > args.max_bytes]
+    if failures:
+        sys.exit("payload check failed: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
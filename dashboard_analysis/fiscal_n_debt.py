@@ -1,11 +1,95 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import sys
 
+from dashboard_analysis.chart_spec import LEGENDS, add_event
+from dashboard_analysis.debt_projection import debt_dynamics_inputs, project_debt
+from dashboard_analysis.figure_io import compact_figure
+
+
+# Percentile bands are cached on the scenario inputs, so reruns only redraw the chart.
+# One process: 50,000 paths take tens of milliseconds, less than spawning a worker pool.
+@st.cache_data(show_spinner="Simulating debt paths...")
+def debt_fan_bands(inputs, horizon, n_paths):
+    return project_debt(inputs, horizon=horizon, n_paths=n_paths)
+
+
+# Calibrated on the yearly history in the selected period
+def debt_projection_section(df_fisc, df_debt_gdp_year, ktb_10y):
+    import plotly.graph_objects as go
+
+    inputs = debt_dynamics_inputs(df_fisc, df_debt_gdp_year, ktb_10y)
+    if inputs is None:
+        st.info("The projection is calibrated on yearly history: select a period covering at least three years.")
+        return
+
+    st.info(
+        "Debt dynamics: d(t) = d(t-1) × (1 + r) / (1 + g) − pb. "
+        "r is the government borrowing rate (yearly average 10-year KTB yield), "
+        "pb is the central-government primary balance (% of GDP) and g is nominal GDP growth. "
+        "Each simulated path draws yearly shocks around the historical averages.\n\n"
+        "**Proxy:** the debt stock d is Korea's gross external debt (public and private), the only "
+        "debt stock in this dataset, not central-government debt. The fan is an illustration "
+        "of the r − g − pb mechanics, not a projection of government debt."
+    )
+
+    c1, c2, c3 = st.columns(3)
+    g_mean = c1.number_input(
+        "Nominal GDP growth (% p.a.)", value=round(inputs["g_mean"] * 100, 2), step=0.25
+    ) / 100
+    pb_mean = c2.number_input(
+        "Primary balance (% of GDP)", value=round(inputs["pb_mean"] * 100, 2), step=0.25
+    ) / 100
+    horizon = c3.slider("Horizon (years)", min_value=3, max_value=20, value=10)
+
+    inputs.update(g_mean=g_mean, pb_mean=pb_mean)
+    bands = debt_fan_bands(inputs, horizon, 50_000)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=bands.index, y=bands["p95"], line=dict(width=0), showlegend=False, hoverinfo="skip"
+    ))
+    fig.add_trace(go.Scatter(
+        x=bands.index, y=bands["p5"], fill="tonexty", fillcolor="rgba(255,105,180,0.15)",
+        line=dict(width=0), name="5th–95th percentile"
+    ))
+    fig.add_trace(go.Scatter(
+        x=bands.index, y=bands["p75"], line=dict(width=0), showlegend=False, hoverinfo="skip"
+    ))
+    fig.add_trace(go.Scatter(
+        x=bands.index, y=bands["p25"], fill="tonexty", fillcolor="rgba(255,105,180,0.35)",
+        line=dict(width=0), name="25th–75th percentile"
+    ))
+    fig.add_trace(go.Scatter(
+        x=bands.index, y=bands["p50"], line_color="deeppink", name="Median path"
+    ))
+    fig.add_trace(go.Scatter(
+        x=df_debt_gdp_year.index, y=df_debt_gdp_year["debt_to_gdp"],
+        line_color="pink", name="Historical"
+    ))
+
+    fig.update_layout(
+        title="Gross External Debt-to-GDP (Proxy) Projection (%) — 50,000 Simulated Paths",
+        xaxis_title="Date",
+        yaxis_title="Percent",
+        legend=LEGENDS["top"]
+    )
+
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+    terminal = bands.iloc[-1]
+    st.caption(
+        f"By {bands.index[-1].year}, the median path reaches {terminal['p50']:.1f}% of GDP "
+        f"(90% band: {terminal['p5']:.1f}% – {terminal['p95']:.1f}%). "
+        "The ratio keeps rising while primary deficits persist and the interest rate exceeds nominal growth, "
+        "so the width of the fan reflects how sensitive sustainability is to growth shocks."
+    )
+
+
 def fiscal_and_debt_tab(DATA):
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
 
     st.title("🏛️ Fiscal Policy & Debt Sustainability")
 
@@ -73,17 +157,9 @@ def fiscal_and_debt_tab(DATA):
             line_color="red",
         )
     
-    fig.add_vrect(
-        x0="2020-01-01", 
-        x1="2022-03-01", 
-        fillcolor="gray", 
-        opacity=0.1, 
-        layer="below", 
-        annotation_text="COVID-19 Pandemic", 
-        annotation_position="top left"
-    )
+    add_event(fig, "covid")
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     
     latest = df_fisc.iloc[-1]
@@ -155,7 +231,7 @@ def fiscal_and_debt_tab(DATA):
         annotation_text="Net borrowing (+) vs Net lending (–)"
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     st.caption(
         """Negative values for the Rest of the World reflect Korea’s net lending position vs foreign economies. 
@@ -169,7 +245,8 @@ def fiscal_and_debt_tab(DATA):
         / df_debt_gdp_year["GDP"]
     ) * 100
 
-    covid_start_val_debt_gdp_y = df_debt_gdp_year.loc["2020-01-01", "debt_to_gdp"]
+    # Pre-COVID reference only when the selected period includes it
+    covid_start_val_debt_gdp_y = df_debt_gdp_year["debt_to_gdp"].get(pd.Timestamp("2020-01-01"))
 
     col1, col2 = st.columns(2)
     with col1: 
@@ -179,25 +256,18 @@ def fiscal_and_debt_tab(DATA):
             labels={"value": "Percent", "date": "Date"},
             color_discrete_sequence=["pink"] 
         )
-        fig.add_vrect(
-            x0="2020-01-01", 
-            x1="2022-03-01", 
-            fillcolor="gray", 
-            opacity=0.1, 
-            layer="below", 
-            annotation_text="COVID-19 Pandemic", 
-            annotation_position="top left"
-        )
+        add_event(fig, "covid")
 
-        fig.add_hline(
-            y=covid_start_val_debt_gdp_y, 
-            line_dash="dash", 
-            line_color="red", 
-            annotation_text=f"Pre-COVID Level ({covid_start_val_debt_gdp_y:.1f}%)",
-            annotation_position="bottom right"
-        )
+        if covid_start_val_debt_gdp_y is not None:
+            fig.add_hline(
+                y=covid_start_val_debt_gdp_y, 
+                line_dash="dash", 
+                line_color="red", 
+                annotation_text=f"Pre-COVID Level ({covid_start_val_debt_gdp_y:.1f}%)",
+                annotation_position="bottom right"
+            )
 
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     with col2: 
         # Create figure with secondary y-axis
@@ -230,24 +300,16 @@ def fiscal_and_debt_tab(DATA):
         fig.update_layout(
             title_text="Dual Axis: Household Debt / Income (%) vs. Total Household Debt (Trillion Won) (Quarterly)",
             margin=dict(t=100, l=40, r=40, b=30), 
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+            legend=LEGENDS["top"]
         )
 
-        fig.add_vrect(
-            x0="2020-01-01", 
-            x1="2022-03-01", 
-            fillcolor="gray", 
-            opacity=0.1, 
-            layer="below", 
-            annotation_text="COVID-19 Pandemic", 
-            annotation_position="top left"
-        )
+        add_event(fig, "covid")
         
         # Set y-axes titles
         fig.update_yaxes(title_text="Debt-to-GDP Ratio (%)", secondary_y=False)
         fig.update_yaxes(title_text="Total Household Debt (Trn KRW)", secondary_y=True)
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     st.info(
         """
@@ -272,3 +334,13 @@ def fiscal_and_debt_tab(DATA):
     st.divider()
 
 
+    # ==========================================================
+    # SECTION 5: DEBT PROJECTION (MONTE CARLO)
+    # ==========================================================
+    st.subheader("Debt-to-GDP Projection: Monte Carlo Fan Chart")
+
+    debt_projection_section(
+        df_fisc, df_debt_gdp_year, DATA["monthly"]["nps_market"]["Yields of Treasury Bonds(10-year)"]
+    )
+
+    st.divider()
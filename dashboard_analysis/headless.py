@@ -0,0 +1,145 @@
+import contextvars
+import importlib
+import threading
+
+# Run the dashboard tabs without a Streamlit session.
+# Each tab module does `import streamlit as st`; the first run_tab of a module replaces that
+# `st`, once and for good, with a proxy that hands every call to the collector of the
+# headless run in the current context, and to Streamlit itself everywhere else. The
+# collector records text, metrics and figures in call order and answers widgets with their
+# default values. Nothing is swapped per run, so a warm-up rendering tabs inside the server
+# never captures a visitor's session rendering the same tab.
+
+TAB_MODULES = {
+    "summary": ("dashboard_analysis.summary", "summary_tab"),
+    "monetary_policy": ("dashboard_analysis.monetary_policy", "monetary_policy_tab"),
+    "fiscal_n_debt": ("dashboard_analysis.fiscal_n_debt", "fiscal_and_debt_tab"),
+    "nps_analysis": ("dashboard_analysis.nps_analysis", "nps_analysis_tab"),
+    "market_performance": ("dashboard_analysis.market_performance", "market_performance_tab"),
+    "housing": ("dashboard_analysis.housing", "housing_tab"),
+    "consumer_sentiment": ("dashboard_analysis.consumer_sentiment", "consumer_sentiment_tab"),
+    "npish": ("dashboard_analysis.npish", "npish_tab"),
+}
+
+TEXT_ELEMENTS = {
+    "title", "header", "subheader", "markdown", "caption", "text", "write",
+    "info", "success", "warning", "error",
+}
+
+
+class StreamlitCollector:
+
+    def __init__(self, blocks=None):
+        self.blocks = [] if blocks is None else blocks
+
+    # ---- layout
+    def columns(self, spec, **kwargs):
+        n = spec if isinstance(spec, int) else len(spec)
+        return [StreamlitCollector(self.blocks) for _ in range(n)]
+
+    def tabs(self, labels):
+        return [StreamlitCollector(self.blocks) for _ in labels]
+
+    def expander(self, label, **kwargs):
+        self.blocks.append({"type": "subheader", "text": label})
+        return self
+
+    def container(self, **kwargs):
+        return self
+
+    @property
+    def sidebar(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    # ---- output elements
+    def plotly_chart(self, fig, **kwargs):
+        self.blocks.append({"type": "plotly_chart", "figure": fig})
+
+    def metric(self, label, value, delta=None, **kwargs):
+        self.blocks.append({"type": "metric", "label": label, "value": str(value),
+                            "delta": None if delta is None else str(delta)})
+
+    def divider(self):
+        self.blocks.append({"type": "divider"})
+
+    def dataframe(self, data, **kwargs):
+        self.blocks.append({"type": "dataframe", "data": data})
+
+    # ---- widgets answer with their defaults
+    def number_input(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return value if value is not None else (min_value if min_value is not None else 0.0)
+
+    def slider(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return value if value is not None else min_value
+
+    def selectbox(self, label, options, index=0, **kwargs):
+        options = list(options)
+        return options[index] if options and index is not None else None
+
+    def radio(self, label, options, index=0, **kwargs):
+        return self.selectbox(label, options, index)
+
+    def checkbox(self, label, value=False, **kwargs):
+        return value
+
+    def toggle(self, label, value=False, **kwargs):
+        return value
+
+    def date_input(self, label, value=None, **kwargs):
+        return value
+
+    def __getattr__(self, name):
+        if name in TEXT_ELEMENTS:
+            def element(body="", *args, **kwargs):
+                self.blocks.append({"type": name, "text": str(body)})
+            return element
+
+        # Anything else (spinners, page config, ...) is a no-op
+        def noop(*args, **kwargs):
+            return self
+        return noop
+
+
+_collector = contextvars.ContextVar("headless_collector", default=None)
+_install_lock = threading.Lock()
+
+
+class _StreamlitProxy:
+
+    def __init__(self, st):
+        self._st = st
+
+    def __getattr__(self, name):
+        collector = _collector.get()
+        return getattr(self._st if collector is None else collector, name)
+
+
+def _install_proxy(module):
+    with _install_lock:
+        if not isinstance(module.st, _StreamlitProxy):
+            module.st = _StreamlitProxy(module.st)
+
+
+def run_tab(name, DATA):
+    module_name, func_name = TAB_MODULES[name]
+    module = importlib.import_module(module_name)
+
+    # Bare-mode Streamlit warns on every cached call; keep headless runs quiet
+    from streamlit import config, logger
+    config.set_option("global.showWarningOnDirectExecution", False)
+    logger.set_log_level("error")
+
+    _install_proxy(module)
+    collector = StreamlitCollector()
+    token = _collector.set(collector)
+    try:
+        getattr(module, func_name)(DATA)
+    finally:
+        _collector.reset(token)
+    return collector.blocks
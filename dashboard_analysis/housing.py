@@ -0,0 +1,83 @@
+import streamlit as st
+
+from dashboard_analysis.chart_spec import render_tab
+
+HPI = "monthly/house_price"
+
+TAB = {
+    "title": "🏠 Housing Market",
+    "sections": [
+        {
+            "subheader": "KB House Price Index",
+            "metrics": [
+                {"label": "All Groups (YoY %)", "series": {"source": HPI, "column": "All Groups", "transform": "yoy"},
+                 "format": ".2f", "delta": "pp"},
+                {"label": "Seoul Apartments (YoY %)", "series": {"source": HPI, "column": "Apartment(Seoul)", "transform": "yoy"},
+                 "format": ".2f", "delta": "pp"},
+                {"label": "Seoul Apartments (MoM %)", "series": {"source": HPI, "column": "Apartment(Seoul)", "transform": "pct_change"},
+                 "format": ".2f", "delta": "pp"},
+            ],
+            "charts": [
+                {
+                    "title": "KB House Price Index by Dwelling Type",
+                    "y": "Index",
+                    "series": [
+                        {"source": HPI, "column": col, "forecast": col == "All Groups"}
+                        for col in ["All Groups", "Apartment", "Detached Dwelling", "Row House"]
+                    ],
+                    "events": ["covid"],
+                },
+                {
+                    "title": "Seoul vs Nationwide House Prices (YoY %)",
+                    "y": "YoY (%)",
+                    "series": [
+                        {"source": HPI, "column": "Apartment(Seoul)", "transform": "yoy", "name": "Seoul Apartments"},
+                        {"source": HPI, "column": "All Groups(Seoul)", "transform": "yoy", "name": "Seoul All Groups"},
+                        {"source": HPI, "column": "All Groups", "transform": "yoy", "name": "Nationwide All Groups",
+                         "dash": "dot"},
+                    ],
+                    "hlines": [{"y": 0}],
+                    "events": ["covid"],
+                },
+            ],
+            "caption": (
+                "Seoul apartments lead the national cycle: they react first to credit conditions and "
+                "carry the largest swings, while detached and row houses move slowly."
+            ),
+        },
+        {
+            "subheader": "Rates, Expectations and House Prices",
+            "charts": [
+                {
+                    "title": "Seoul Apartment Prices (YoY %) vs BOK Base Rate",
+                    "y": "YoY (%)", "y2": "Base Rate (%)",
+                    "series": [
+                        {"source": HPI, "column": "Apartment(Seoul)", "transform": "yoy", "name": "Seoul Apartments (YoY %)",
+                         "kind": "bar", "opacity": 0.65},
+                        {"source": "monthly/bok_rate", "column": "base_rate", "name": "BOK Base Rate (%)",
+                         "axis": "y2", "kind": "markers"},
+                    ],
+                },
+                {
+                    "title": "House Price Expectations (CSI) vs Realized Price Growth",
+                    "y": "YoY (%)", "y2": "CSI (100 = neutral)",
+                    "series": [
+                        {"source": HPI, "column": "All Groups", "transform": "yoy", "name": "Nationwide All Groups (YoY %)"},
+                        {"source": "monthly/cts", "column": "Expectations of Housing Prices",
+                         "name": "Expectations of Housing Prices", "axis": "y2", "dash": "dot"},
+                    ],
+                    "hlines": [{"y": 0}],
+                },
+            ],
+            "caption": (
+                "Rate cuts have historically been followed by faster Seoul price growth with a lag of "
+                "several quarters. Households' price expectations (above 100 = more expect rises) "
+                "tend to turn before realized prices do."
+            ),
+        },
+    ],
+}
+
+
+def housing_tab(DATA):
+    render_tab(TAB, DATA, st)
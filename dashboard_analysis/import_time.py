@@ -0,0 +1,115 @@
+import ast
+import re
+import subprocess
+import sys
+
+from pathlib import Path
+
+# Import-time benchmark: runs `python -X importtime` for each entry point in a fresh
+# interpreter and fails if startup exceeds its budget or pulls in a module it should not.
+#
+#   python -m dashboard_analysis.import_time [--repeat 5] [--top 10] [--max-ms 1500]
+#
+# The dashboard target imports what dashboard.py imports (it cannot be imported itself:
+# it renders on import). Numbers are the best of `repeat` runs, after one warm-up run
+# that fills the bytecode and OS file caches.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DASHBOARD = BASE_DIR / "dashboard.py"
+
+# target -> max cumulative import time (ms) and modules that must stay out of startup;
+# scipy / statsmodels load only inside the analytics that use them, plotly.express inside the
+# tabs (streamlit itself brings in plotly.graph_objects for st.plotly_chart)
+BUDGETS = {
+    "dashboard": {"max_ms": 2500, "forbidden": ["scipy", "statsmodels", "plotly.express"]},
+    "query_service": {"max_ms": 1200, "forbidden": ["scipy", "statsmodels", "plotly", "streamlit"]},
+    "data_pipeline.alerts": {"max_ms": 1000, "forbidden": ["scipy", "statsmodels", "plotly", "streamlit", "requests"]},
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def dashboard_imports(path=DASHBOARD):
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def target_modules(target):
+    return dashboard_imports() if target == "dashboard" else [target]
+
+
+def parse_importtime(stderr):
+    # -> [(module, self_us, cumulative_us, depth)] in the order the imports completed
+    rows = []
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+    return rows
+
+
+def measure(modules, repeat=5):
+    code = "; ".join(f"import {m}" for m in modules)
+    cmd = [sys.executable, "-X", "importtime", "-c", code]
+    best = None
+    for i in range(repeat + 1):
+        proc = subprocess.run(cmd, cwd=BASE_DIR, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"import failed: {code}\n{proc.stderr[-2000:]}")
+        rows = parse_importtime(proc.stderr)
+        total = sum(us for _, _, us, depth in rows if depth == 0)
+        if i and (best is None or total < best[0]):
+            best = (total, rows)
+    return best
+
+
+def report(target, repeat=5, top=10):
+    total, rows = measure(target_modules(target), repeat)
+    loaded = {name for name, *_ in rows}
+    budget = BUDGETS.get(target, {})
+    forbidden = [m for m in budget.get("forbidden", []) if m in loaded]
+    return {
+        "target": target,
+        "ms": total / 1000,
+        "modules": len(rows),
+        "top": sorted(((name, cum / 1000) for name, _, cum, depth in rows if depth == 0), key=lambda r: -r[1])[:top],
+        "forbidden": forbidden,
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import-time benchmark of the entry points")
+    parser.add_argument("targets", nargs="*", default=list(BUDGETS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="top-level imports listed per target")
+    parser.add_argument("--max-ms", type=float, default=None, help="override every target's budget")
+    args = parser.parse_args()
+
+    failures = []
+    for target in args.targets:
+        result = report(target, args.repeat, args.top)
+        max_ms = args.max_ms if args.max_ms is not None else BUDGETS.get(target, {}).get("max_ms")
+        print(f"{target:<24} {result['ms']:8.1f} ms  {result['modules']:>4} modules"
+              + (f"  (budget {max_ms:.0f} ms)" if max_ms else ""))
+        for name, ms in result["top"]:
+            print(f"    {name:<40} {ms:8.1f} ms")
+
+        if max_ms is not None and result["ms"] > max_ms:
+            failures.append(f"{target} {result['ms']:.0f} ms > {max_ms:.0f} ms")
+        if result["forbidden"]:
+            failures.append(f"{target} imports {', '.join(result['forbidden'])} at startup")
+
+    if failures:
+        sys.exit("import-time check failed: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
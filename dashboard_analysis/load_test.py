@@ -0,0 +1,377 @@
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from pathlib import Path
+
+import numpy as np
+
+# Load test: N concurrent sessions against one local Streamlit server process.
+#
+#   python -m dashboard_analysis.load_test run --sessions 1 4 8 16 --duration 60
+#   python -m dashboard_analysis.load_test run --url ws://127.0.0.1:8501 --pid 1234
+#   python -m dashboard_analysis.load_test compare reports/load/<a>.json reports/load/<b>.json
+#
+# Each session is a headless websocket client speaking the browser protocol (BackMsg /
+# ForwardMsg): it loads the app, then keeps changing controls (period, vintage, debt
+# scenario) with random think time, timing every rerun from the request to script_finished.
+# The server's CPU and memory are sampled with psutil throughout. Switching tabs does not
+# reach the server (every tab renders on each run), so sessions only drive reruns.
+#
+# Reports (JSON, keyed by commit and data version) go to reports/load/; `compare` prints the
+# latency change per concurrency level and fails on a p95 regression above the threshold.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DASHBOARD = BASE_DIR / "dashboard.py"
+REPORT_DIR = BASE_DIR / "reports" / "load"
+
+PERCENTILES = (50, 95, 99)
+MIN_MONTHS = 24          # dashboard.py widens shorter periods: ask for valid ones
+
+# action -> weight in the random mix
+ACTIONS = {"period": 4, "full_period": 1, "vintage": 1, "debt_scenario": 2}
+
+
+# --------------------------------------------
+# Server and process sampling
+def start_server(port):
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", str(DASHBOARD),
+        "--server.headless", "true", "--server.port", str(port),
+        "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false",
+    ]
+    proc = subprocess.Popen(cmd, cwd=BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    import urllib.request
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            if proc.poll() is not None:
+                break
+            time.sleep(0.25)
+    proc.kill()
+    raise RuntimeError(f"streamlit server did not come up on port {port}")
+
+
+class ProcessSampler:
+    # CPU (% of one core, summed over threads) and RSS of one process, every `interval` s
+
+    def __init__(self, pid, interval=0.5):
+        import psutil
+
+        self.process = psutil.Process(pid)
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        self.process.cpu_percent(None)
+        while not self._stop.wait(self.interval):
+            try:
+                self.samples.append((self.process.cpu_percent(None), self.process.memory_info().rss))
+            except Exception:
+                break  # process gone
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="load-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        cpu = np.array([s[0] for s in self.samples] or [np.nan])
+        rss = np.array([s[1] for s in self.samples] or [np.nan]) / 2**20
+        return {
+            "cpu_avg_pct": round(float(np.mean(cpu)), 1),
+            "cpu_max_pct": round(float(np.max(cpu)), 1),
+            "rss_max_mb": round(float(np.max(rss)), 1),
+            "rss_end_mb": round(float(rss[-1]), 1),
+        }
+
+
+# --------------------------------------------
+# A browser session over the websocket protocol
+class Session:
+
+    def __init__(self, url, rng):
+        self.url = url.rstrip("/") + "/_stcore/stream"
+        self.rng = rng
+        self.ws = None
+        self.widgets = {}   # label -> (widget type, proto) from the last run
+        self.states = {}    # widget id -> WidgetState proto sent with every rerun
+
+    async def connect(self):
+        from tornado.httpclient import HTTPRequest
+        from tornado.websocket import websocket_connect
+
+        self.ws = await websocket_connect(HTTPRequest(self.url, headers={"Sec-WebSocket-Protocol": "streamlit"}))
+
+    async def rerun(self):
+        # -> (seconds, exceptions raised by the script)
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+
+        t0 = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        widgets, exceptions = {}, 0
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("server closed the session")
+            fm = ForwardMsg()
+            fm.ParseFromString(raw)
+            kind = fm.WhichOneof("type")
+            if kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                element = fm.delta.new_element
+                etype = element.WhichOneof("type")
+                if etype == "exception":
+                    exceptions += 1
+                elif etype in ("slider", "selectbox", "number_input"):
+                    widget = getattr(element, etype)
+                    widgets[widget.label] = (etype, widget)
+            elif kind == "script_finished":
+                break
+        seconds = time.perf_counter() - t0
+
+        # Widget ids change with their defaults (e.g. the debt inputs after a new period)
+        self.widgets = widgets
+        live = {w.id for _, w in widgets.values()}
+        self.states = {i: s for i, s in self.states.items() if i in live}
+        return seconds, exceptions
+
+    def set_state(self, label, **value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        if label not in self.widgets:
+            return False
+        _, widget = self.widgets[label]
+        state = WidgetState(id=widget.id)
+        for field, v in value.items():
+            if field == "double_array_value":
+                state.double_array_value.data.extend(v)
+            else:
+                setattr(state, field, v)
+        self.states[widget.id] = state
+        return True
+
+    # ---- user actions: change one control, False if the control is not on the page
+    def period(self):
+        _, slider = self.widgets.get("Period", (None, None))
+        if slider is None or len(slider.options) <= MIN_MONTHS:
+            return False
+        last = len(slider.options) - 1
+        i = self.rng.randint(0, last - MIN_MONTHS + 1)
+        j = self.rng.randint(i + MIN_MONTHS - 1, last)
+        return self.set_state("Period", double_array_value=[i, j])
+
+    def full_period(self):
+        _, slider = self.widgets.get("Period", (None, None))
+        return slider is not None and self.set_state("Period", double_array_value=[0, len(slider.options) - 1])
+
+    def vintage(self):
+        _, box = self.widgets.get("Data as of", (None, None))
+        return box is not None and self.set_state("Data as of", string_value=self.rng.choice(list(box.options)))
+
+    def debt_scenario(self):
+        changed = False
+        for label in ("Nominal GDP growth (% p.a.)", "Primary balance (% of GDP)"):
+            if label in self.widgets:
+                _, box = self.widgets[label]
+                step = self.rng.choice([-2, -1, 1, 2]) * box.step
+                changed |= self.set_state(label, double_value=round(box.default + step, 2))
+        if "Horizon (years)" in self.widgets:
+            changed |= self.set_state("Horizon (years)", double_array_value=[self.rng.choice([5, 10, 15, 20])])
+        return changed
+
+    async def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+
+async def run_session(n, url, deadline, think, seed, records):
+    rng = random.Random(seed)
+    session = Session(url, rng)
+    await asyncio.sleep(rng.uniform(0, think))   # staggered arrivals
+    await session.connect()
+    try:
+        action = "load"
+        while True:
+            try:
+                seconds, exceptions = await session.rerun()
+                records.append({"session": n, "action": action, "seconds": seconds, "exceptions": exceptions})
+            except Exception as e:
+                records.append({"session": n, "action": action, "seconds": None, "error": f"{type(e).__name__}: {e}"})
+                return
+            if time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+            for action in rng.choices(list(ACTIONS), weights=list(ACTIONS.values()), k=len(ACTIONS)):
+                if getattr(session, action)():
+                    break
+            else:
+                action = "rerun"
+    finally:
+        await session.close()
+
+
+# --------------------------------------------
+# Levels and reports
+def latency_stats(seconds):
+    if not len(seconds):
+        return {"count": 0}
+    ms = np.asarray(seconds) * 1000
+    stats = {"count": int(len(ms)), "mean_ms": round(float(ms.mean()), 1)}
+    for p, v in zip(PERCENTILES, np.percentile(ms, PERCENTILES)):
+        stats[f"p{p}_ms"] = round(float(v), 1)
+    stats["max_ms"] = round(float(ms.max()), 1)
+    return stats
+
+
+def run_level(url, sessions, duration, think, pid=None, seed=0):
+    records = []
+    sampler = ProcessSampler(pid).start() if pid else None
+    client = ProcessSampler(os.getpid()).start()
+    started = time.monotonic()
+
+    async def main():
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*[run_session(n, url, deadline, think, seed * 1000 + n, records) for n in range(sessions)])
+
+    asyncio.run(main())
+    elapsed = time.monotonic() - started
+
+    ok = [r for r in records if r["seconds"] is not None]
+    reruns = [r for r in ok if r["action"] != "load"]
+    return {
+        "sessions": sessions,
+        "elapsed_s": round(elapsed, 1),
+        "reruns_per_s": round(len(reruns) / elapsed, 2),
+        "load": latency_stats([r["seconds"] for r in ok if r["action"] == "load"]),
+        "rerun": latency_stats([r["seconds"] for r in reruns]),
+        "by_action": {a: latency_stats([r["seconds"] for r in reruns if r["action"] == a])
+                      for a in sorted({r["action"] for r in reruns})},
+        "errors": [r["error"] for r in records if r["seconds"] is None],
+        "script_exceptions": sum(r.get("exceptions", 0) for r in ok),
+        "server": sampler.stop() if sampler else None,
+        "client": client.stop(),
+    }
+
+
+def git_commit():
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                             text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BASE_DIR,
+                               capture_output=True, text=True).stdout.strip()
+        return sha + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_test(levels, duration=60, think=1.0, url=None, pid=None, port=8599, seed=0):
+    from data_pipeline.data_cleaning import DATA_VERSION
+
+    server = None
+    if url is None:
+        server = start_server(port)
+        url, pid = f"ws://127.0.0.1:{port}", server.pid
+    try:
+        # One session first so every level starts from warm caches
+        asyncio.run(run_session(-1, url, 0, 0, seed, []))
+        results = [run_level(url, n, duration, think, pid, seed) for n in levels]
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    return {
+        "commit": git_commit(),
+        "data_version": DATA_VERSION,
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {"duration_s": duration, "think_s": think, "actions": ACTIONS, "seed": seed},
+        "levels": results,
+    }
+
+
+def print_report(report):
+    print(f"commit {report['commit']}  data {report['data_version']}  "
+          f"{report['config']['duration_s']}s per level, think {report['config']['think_s']}s")
+    print(f"{'sessions':>8} {'reruns/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'load p95':>9} "
+          f"{'cpu avg':>8} {'cpu max':>8} {'rss max':>9} {'errors':>6}")
+    for level in report["levels"]:
+        r, server = level["rerun"], level["server"] or {}
+        print(f"{level['sessions']:>8} {level['reruns_per_s']:>9.2f} {r.get('p50_ms', np.nan):>6.0f}ms "
+              f"{r.get('p95_ms', np.nan):>6.0f}ms {r.get('p99_ms', np.nan):>6.0f}ms "
+              f"{level['load'].get('p95_ms', np.nan):>7.0f}ms {server.get('cpu_avg_pct', np.nan):>7.0f}% "
+              f"{server.get('cpu_max_pct', np.nan):>7.0f}% {server.get('rss_max_mb', np.nan):>7.0f}MB "
+              f"{len(level['errors']) + level['script_exceptions']:>6}")
+
+
+def compare(base, new, max_regression=0.2):
+    # -> list of failures: p95 rerun latency up more than max_regression at a shared level
+    base_levels = {l["sessions"]: l for l in base["levels"]}
+    print(f"{'sessions':>8} {'p95 ' + str(base['commit']):>22} {'p95 ' + str(new['commit']):>22} {'change':>8}")
+    failures = []
+    for level in new["levels"]:
+        old = base_levels.get(level["sessions"])
+        if old is None or not old["rerun"].get("count") or not level["rerun"].get("count"):
+            continue
+        a, b = old["rerun"]["p95_ms"], level["rerun"]["p95_ms"]
+        change = b / a - 1
+        print(f"{level['sessions']:>8} {a:>20.0f}ms {b:>20.0f}ms {change:>+7.0%}")
+        if change > max_regression:
+            failures.append(f"{level['sessions']} sessions p95 {a:.0f} -> {b:.0f} ms")
+    return failures
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Concurrent-session load test of the dashboard")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_run = sub.add_parser("run", help="run the load levels and write a report")
+    p_run.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 8])
+    p_run.add_argument("--duration", type=float, default=60, help="seconds per level")
+    p_run.add_argument("--think", type=float, default=1.0, help="mean seconds between a session's actions")
+    p_run.add_argument("--url", default=None, help="existing server (default: start one)")
+    p_run.add_argument("--pid", type=int, default=None, help="server process to sample with --url")
+    p_run.add_argument("--port", type=int, default=8599)
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--out", default=str(REPORT_DIR))
+    p_cmp = sub.add_parser("compare", help="compare two reports")
+    p_cmp.add_argument("base")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--max-regression", type=float, default=0.2, help="allowed p95 increase (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        base, new = (json.loads(Path(p).read_text(encoding="utf-8")) for p in (args.base, args.new))
+        failures = compare(base, new, args.max_regression)
+        if failures:
+            sys.exit("load-test regression: " + "; ".join(failures))
+        return
+
+    report = load_test(args.sessions, args.duration, args.think, args.url, args.pid, args.port, args.seed)
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    path = out / f"{report['started'].replace(':', '')}-{report['commit'] or 'nogit'}.json"
+    path.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    print_report(report)
+    print(f"report -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import sys
 
+from dashboard_analysis.chart_spec import add_cone, forecast_cone
+from dashboard_analysis.figure_io import compact_figure
+from data_pipeline.asof import month_end_asof
+
 def market_performance_tab(DATA):
+    import plotly.express as px
 
     st.title("📈 Market Performance & Asset Pricing")
     # ==========================================================
@@ -13,6 +16,7 @@ def market_performance_tab(DATA):
     df_kospi = DATA["monthly"]["kospi"].copy()
     df_rate  = DATA["monthly"]["bok_rate"][["base_rate"]].copy()
     df_fx_monthly = DATA["monthly"]["fx"].copy()
+    df_fx_daily = DATA["daily"]["fx"]
 
     df_kospi = df_kospi.sort_index()
     df_rate  = df_rate.sort_index()
@@ -40,7 +44,32 @@ def market_performance_tab(DATA):
         eq_df,
         title="KOSPI & KOSDAQ Index Levels"
     )
-    st.plotly_chart(fig, use_container_width=True)
+
+    # Provisional KOSPI nowcast for months not yet published
+    nc_kospi = DATA.get("nowcast", {}).get("kospi")
+    if nc_kospi is not None and not nc_kospi.empty:
+        last = eq_df["KOSPI_Index(End Of)"].iloc[-1:]
+        fig.add_scatter(
+            x=last.index.append(nc_kospi.index),
+            y=list(last) + list(nc_kospi["KOSPI_Index(End Of)"]),
+            name="KOSPI — Nowcast (provisional)",
+            mode="lines+markers",
+            line=dict(dash="dot"),
+            marker=dict(symbol="circle-open")
+        )
+
+    # 12-month forecast cone, fitted offline (data_pipeline.forecast)
+    kospi_cone = forecast_cone(DATA, "monthly/kospi", "KOSPI_Index(End Of)")
+    if kospi_cone is not None:
+        add_cone(fig, kospi_cone, "KOSPI", "#636efa", anchor=eq_df["KOSPI_Index(End Of)"].iloc[-1:])
+
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+    if nc_kospi is not None and not nc_kospi.empty:
+        st.caption(
+            f"Provisional: KOSPI through {nc_kospi.index[-1]:%B %Y} is nowcast from daily KRW "
+            "exchange rates (dotted) until the official monthly figure is published."
+        )
 
     # Risk appetite signal
     eq_returns["Risk Appetite (KOSDAQ - KOSPI)"] = (
@@ -57,7 +86,7 @@ def market_performance_tab(DATA):
         line_color="gray",
         opacity=0.5
     )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     latest_eq = eq_returns.iloc[-1]
 
@@ -77,6 +106,39 @@ def market_performance_tab(DATA):
         st.warning(f"Risk Appetite: {latest_eq['Risk Appetite (KOSDAQ - KOSPI)']:.2f}. \
                    Risk-off regime: Defensive equities (KOSPI) outperforming.")
 
+    # Liquidity confirmation: is money actually rotating into KOSDAQ?
+    df_liq = DATA["monthly"].get("liquidity")
+    if df_liq is not None and len(df_liq.dropna(how="all")) > 1:
+        df_liq = df_liq.dropna(how="all")
+
+        fig = px.line(
+            df_liq[["Relative turnover (KOSDAQ/KOSPI)"]],
+            title="Liquidity Rotation: KOSDAQ vs KOSPI Turnover",
+            labels={"value": "Relative Turnover (x)", "date": ""}
+        )
+        fig.add_scatter(
+            x=df_liq.index,
+            y=df_liq["KOSDAQ value share (%)"],
+            name="KOSDAQ Share of Trading Value (%)",
+            yaxis="y2",
+            mode="lines",
+            line=dict(dash="dot")
+        )
+        fig.update_layout(
+            yaxis2=dict(title="Share of Trading Value (%)", overlaying="y", side="right", showgrid=False),
+            legend=dict(orientation="h", y=1.15)
+        )
+        st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+        share = df_liq["KOSDAQ value share (%)"]
+        share_avg = share.iloc[-12:].mean()
+        st.caption(
+            f"KOSDAQ accounts for {share.iloc[-1]:.1f}% of trading value "
+            f"(12-month average {share_avg:.1f}%). Relative turnover compares how actively each "
+            "market's capitalisation changes hands: a return-led risk-on signal is more durable "
+            "when KOSDAQ's share of trading rises with it."
+        )
+
     st.divider()
 
     # ==========================================================
@@ -84,7 +146,10 @@ def market_performance_tab(DATA):
     # ==========================================================
     st.subheader("FX Market: KRW vs USD")
 
-    fx_df = df_fx_monthly[[FX_COL]].dropna()
+    # Month-end close, matched to the KOSPI/KOSDAQ end-of-month levels: last fixing on or
+    # before each month end (0.00 holiday rows are not fixings)
+    fx_close = df_fx_daily[[FX_COL]]
+    fx_df = month_end_asof(df_fx_monthly.index, fx_close[fx_close[FX_COL] > 0]).dropna()
     fx_df.columns = ["KRW/USD"]
 
     fx_change = fx_df.pct_change(3) * 100
@@ -104,7 +169,24 @@ def market_performance_tab(DATA):
         opacity=0.4
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    # The forecast is of the monthly average rate (the monthly panel's FX), not of the
+    # month-end close: it is drawn with the average it continues and anchored on its last value
+    fx_cone = forecast_cone(DATA, "monthly/fx", FX_COL)
+    fx_avg = df_fx_monthly[FX_COL].dropna()
+    if fx_cone is not None and len(fx_avg):
+        fig.add_scatter(
+            x=fx_avg.index, y=fx_avg.to_numpy(), name="KRW/USD monthly average",
+            mode="lines", line=dict(color="#ffa500", width=1, dash="dot"), opacity=0.6
+        )
+        add_cone(fig, fx_cone, "KRW/USD monthly average", "#ffa500", anchor=fx_avg.iloc[-1:])
+
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+    if kospi_cone is not None or fx_cone is not None:
+        st.caption(
+            "Dashed lines with shaded bands are 12-month statistical forecasts (80% and 95% "
+            "prediction intervals) of the KOSPI month-end level and of the monthly average KRW/USD rate."
+        )
 
     st.caption(
         "KRW/USD captures Korea’s external balance and sensitivity to global risk conditions. "
@@ -122,6 +204,39 @@ def market_performance_tab(DATA):
     else:
         st.info("FX conditions broadly stable.")
 
+    # Multi-currency view from the derived FX analytics (daily, all currencies)
+    derived = DATA.get("derived", {})
+    if len(derived.get("fx_crosses", [])):
+        crosses = derived["fx_crosses"].dropna(how="all")
+        cols = st.columns(len(crosses.columns))
+        for col, pair in zip(cols, crosses.columns):
+            series = crosses[pair].dropna()
+            month_ago = series[:series.index[-1] - pd.DateOffset(months=1)]
+            delta = None if month_ago.empty else f"{(series.iloc[-1] / month_ago.iloc[-1] - 1) * 100:+.2f}% (1M)"
+            col.metric(f"Implied {pair}", f"{series.iloc[-1]:,.2f}", delta)
+
+        fig = px.line(
+            derived["fx_vol_garman_klass"].dropna(axis=1, how="all"),
+            title="KRW Realized Volatility (Garman-Klass, 21-day, annualized %)",
+            labels={"value": "Volatility (%)", "date": "", "currency": "Currency"}
+        )
+        st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+        fig = px.line(
+            derived["fx_drawdown"],
+            title="KRW Drawdown vs Trailing 1-Year High (%)",
+            labels={"value": "Drawdown (%)", "date": "", "currency": "Currency"}
+        )
+        st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+        st.caption(
+            "Volatility is estimated from daily open/high/low/close ranges, which uses more of each "
+            "day's information than close-to-close returns (JPY is quoted as a single daily rate). "
+            "Drawdown measures how far the won's value in each currency sits below its high of "
+            "the past year: a broad drawdown points to KRW-specific weakness, a USD-only one to "
+            "dollar strength."
+        )
+
     st.divider()
 
     # ==========================================================
@@ -201,7 +316,7 @@ def market_performance_tab(DATA):
             line_width=0
         )
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     st.caption(
         "Shaded areas indicate policy tightening cycles. " \
@@ -0,0 +1,176 @@
+import sys
+import threading
+import tracemalloc
+
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+# Memory accounting for the cleaned panel and the tab renders.
+#   frame_memory(DATA)          deep memory_usage of every frame, per bucket/dataset
+#   profile_render(func, ...)   tracemalloc peak of one render, plus every DataFrame.copy()
+#                               made by dashboard code, flagged as avoidable when the copy
+#                               was never modified (a view or the original would have done)
+#
+#   python -m dashboard_analysis.memory_profile --max-peak-mb 50 --max-avoidable-mb 5
+#
+# DATA is shared by all sessions (st.cache_data / cache_resource); what each session pays on
+# top of it is the render peak, so that is the number to multiply by concurrent users.
+
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+MB = 1024 ** 2
+
+# tracemalloc is process-wide: one profile at a time
+_lock = threading.Lock()
+
+# The DataFrame.copy patch is installed once for any number of tracking threads and
+# restored by the last one to leave; thread id -> records of that thread's copies
+_ORIGINAL_COPY = pd.DataFrame.copy
+_patch_lock = threading.Lock()
+_recorders = {}
+
+
+def frame_memory(DATA):
+    rows = []
+    for bucket, group in DATA.items():
+        for name, df in group.items():
+            if not isinstance(df, (pd.DataFrame, pd.Series)):
+                continue
+            usage = df.memory_usage(deep=True, index=True)
+            total = int(usage.sum())
+            index = int(usage["Index"]) if isinstance(usage, pd.Series) and "Index" in usage else 0
+            rows.append({
+                "bucket": bucket,
+                "dataset": name,
+                "rows": len(df),
+                "columns": df.shape[1] if df.ndim == 2 else 1,
+                "bytes": total,
+                "index_bytes": index,
+            })
+    return pd.DataFrame(rows, columns=["bucket", "dataset", "rows", "columns", "bytes", "index_bytes"])
+
+
+def _tracked_copy(self, deep=True):
+    result = _ORIGINAL_COPY(self, deep=deep)
+    records = _recorders.get(threading.get_ident())
+    if records is not None:
+        caller = sys._getframe(1)
+        if caller.f_code.co_filename.startswith(REPO_ROOT):
+            site = f"{Path(caller.f_code.co_filename).name}:{caller.f_lineno}"
+            records.append((site, self, result))
+    return result
+
+
+@contextmanager
+def track_copies():
+    # Records DataFrame.copy() calls made from this repo's code on the calling thread.
+    # Copies are held until the block exits so they can be compared with their source.
+    owner, records = threading.get_ident(), []
+    with _patch_lock:
+        if owner in _recorders:
+            raise RuntimeError("track_copies is already active on this thread")
+        _recorders[owner] = records
+        pd.DataFrame.copy = _tracked_copy
+    try:
+        yield records
+    finally:
+        with _patch_lock:
+            del _recorders[owner]
+            if not _recorders:
+                pd.DataFrame.copy = _ORIGINAL_COPY
+
+
+def copy_report(records):
+    rows = []
+    for site, source, result in records:
+        # Unchanged after the render: the caller only read from it
+        unchanged = (result.shape == source.shape and result.columns.equals(source.columns)
+                     and result.index.equals(source.index) and result.equals(source))
+        rows.append({
+            "site": site,
+            "bytes": int(result.memory_usage(deep=True, index=True).sum()),
+            "avoidable": bool(unchanged),
+        })
+    report = pd.DataFrame(rows, columns=["site", "bytes", "avoidable"])
+    return report.groupby("site", sort=False).agg(
+        copies=("bytes", "size"), bytes=("bytes", "sum"), avoidable=("avoidable", "all"),
+    ).reset_index()
+
+
+def profile_render(func, *args, copies=True, **kwargs):
+    # -> {"peak": bytes, "retained": bytes, "copies": per-site report or None}
+    # Held copies add to the peak; measure with copies=False for an exact peak.
+    with _lock:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            if copies:
+                with track_copies() as records:
+                    func(*args, **kwargs)
+                    current, peak = tracemalloc.get_traced_memory()
+                    report = copy_report(records)
+            else:
+                func(*args, **kwargs)
+                current, peak = tracemalloc.get_traced_memory()
+                report = None
+        finally:
+            if started:
+                tracemalloc.stop()
+    return {"peak": peak - before, "retained": current - before, "copies": report}
+
+
+def profile_tabs(DATA, tabs=None):
+    # Headless renders of each tab: exact peak pass, then a copy-audit pass
+    from dashboard_analysis.headless import TAB_MODULES, run_tab
+
+    results = {}
+    for tab in tabs or TAB_MODULES:
+        run_tab(tab, DATA)  # warm module imports and st.cache_data entries
+        peak = profile_render(run_tab, tab, DATA, copies=False)
+        audit = profile_render(run_tab, tab, DATA, copies=True)
+        results[tab] = {"peak": peak["peak"], "retained": peak["retained"], "copies": audit["copies"]}
+    return results
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Memory of the cleaned panel and of each tab render")
+    parser.add_argument("--max-peak-mb", type=float, default=None, help="fail if a tab render peaks above this")
+    parser.add_argument("--max-avoidable-mb", type=float, default=None, help="fail if avoidable copies exceed this")
+    args = parser.parse_args()
+
+    from data_pipeline.data_cleaning import DATA
+
+    frames = frame_memory(DATA)
+    by_bucket = frames.groupby("bucket", sort=False)["bytes"].sum()
+    for bucket, size in by_bucket.items():
+        print(f"DATA[{bucket!r}]".ljust(24) + f"{size / MB:8.2f} MB")
+    print("DATA total".ljust(24) + f"{frames['bytes'].sum() / MB:8.2f} MB")
+    print()
+
+    failures = []
+    for tab, result in profile_tabs(DATA).items():
+        copies = result["copies"]
+        avoidable = int(copies.loc[copies["avoidable"], "bytes"].sum())
+        print(f"{tab:<20} peak {result['peak'] / MB:7.2f} MB  retained {result['retained'] / MB:6.2f} MB  "
+              f"copies {int(copies['copies'].sum()):>3} ({copies['bytes'].sum() / MB:.2f} MB, "
+              f"avoidable {avoidable / MB:.2f} MB)")
+        for row in copies[copies["avoidable"]].itertuples():
+            print(f"    avoidable copy x{row.copies} at {row.site} ({row.bytes / 1024:.0f} KB)")
+
+        if args.max_peak_mb is not None and result["peak"] > args.max_peak_mb * MB:
+            failures.append(f"{tab} peak {result['peak'] / MB:.1f} MB")
+        if args.max_avoidable_mb is not None and avoidable > args.max_avoidable_mb * MB:
+            failures.append(f"{tab} avoidable copies {avoidable / MB:.1f} MB")
+
+    if failures:
+        sys.exit("memory check failed: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,31 @@
 import streamlit as st
-import plotly.express as px
 import pandas as pd
 import datetime
 import sys
 
+from data_pipeline.cpi_breadth import breadth_columns
+from dashboard_analysis.chart_spec import add_cone, forecast_cone
+from dashboard_analysis.figure_io import compact_figure
+
+
+# Consecutive months of hikes (cuts) merged into one shaded span each:
+# same picture as one rectangle per month, with a fraction of the shapes in the payload
+def rate_change_spans(df):
+    spans = []
+    sign = df["d_base_rate"].apply(lambda d: 1 if d > 0 else (-1 if d < 0 else 0))
+    for i in range(1, len(df)):
+        if sign.iloc[i] == 0:
+            continue
+        color = "red" if sign.iloc[i] > 0 else "green"
+        if spans and spans[-1][1] == df.index[i-1] and spans[-1][2] == color:
+            spans[-1] = (spans[-1][0], df.index[i], color)
+        else:
+            spans.append((df.index[i-1], df.index[i], color))
+    return spans
+
+
 def monetary_policy_tab(DATA):
+    import plotly.express as px
 
     st.title("🏦 Monetary Policy — Bank of Korea")
 
@@ -85,25 +106,54 @@ def monetary_policy_tab(DATA):
     )
 
     # Tightening / easing shading
-    for i in range(1, len(df)):
-        if df["d_base_rate"].iloc[i] > 0:
-            fig.add_vrect(
-                x0=df.index[i-1],
-                x1=df.index[i],
-                fillcolor="red",
-                opacity=0.15,
-                line_width=0
-            )
-        elif df["d_base_rate"].iloc[i] < 0:
-            fig.add_vrect(
-                x0=df.index[i-1],
-                x1=df.index[i],
-                fillcolor="green",
-                opacity=0.15,
-                line_width=0
-            )
-
-    st.plotly_chart(fig, use_container_width=True)
+    for x0, x1, color in rate_change_spans(df):
+        fig.add_vrect(x0=x0, x1=x1, fillcolor=color, opacity=0.15, line_width=0)
+
+    # Provisional nowcasts (daily FX based) for months not yet published
+    nowcasts = DATA.get("nowcast", {})
+    for name, col, label, color in [
+        ("bok_rate", "base_rate", "Base Rate (%)", "pink"),
+        ("cpi", "Total item", "CPI Inflation (%)", "#1f77b4"),
+    ]:
+        nc = nowcasts.get(name)
+        if nc is None or nc.empty:
+            continue
+        last = df[col].dropna().iloc[-1:]
+        fig.add_scatter(
+            x=last.index.append(nc.index),
+            y=list(last) + list(nc[col]),
+            name=f"{label} — Nowcast (provisional)",
+            mode="lines+markers",
+            line=dict(dash="dot", color=color),
+            marker=dict(symbol="circle-open")
+        )
+
+    # 12-month forecast cones, fitted offline (data_pipeline.forecast)
+    cones = []
+    for source, col, label, color in [
+        ("monthly/bok_rate", "base_rate", "Base Rate (%)", "#ff69b4"),
+        ("monthly/cpi", "Total item", "CPI Inflation (%)", "#1f77b4"),
+    ]:
+        cone = forecast_cone(DATA, source, col)
+        if cone is not None:
+            add_cone(fig, cone, label, color, anchor=df[col].dropna().iloc[-1:])
+            cones.append(cone)
+
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+    if nowcasts.get("cpi") is not None and not nowcasts["cpi"].empty:
+        nc_cpi = nowcasts["cpi"]["Total item"]
+        st.caption(
+            f"Provisional: CPI inflation for {nc_cpi.index[-1]:%B %Y} is nowcast at "
+            f"{nc_cpi.iloc[-1]:.1f}% from daily KRW exchange rates (dotted). "
+            "It is replaced by the official figure once published."
+        )
+
+    if cones:
+        st.caption(
+            f"Dashed lines with shaded bands are statistical forecasts to {cones[0].index[-1]:%B %Y} "
+            "(80% and 95% prediction intervals), refitted whenever the series is revised."
+        )
 
     st.caption(
         "When inflation rose well above the 2% target, notably during 2021–2023, "
@@ -151,25 +201,10 @@ def monetary_policy_tab(DATA):
     )
 
     # Regime shading (same logic as nominal chart)
-    for i in range(1, len(df)):
-        if df["d_base_rate"].iloc[i] > 0:
-            fig.add_vrect(
-                x0=df.index[i-1],
-                x1=df.index[i],
-                fillcolor="red",
-                opacity=0.12,
-                line_width=0
-            )
-        elif df["d_base_rate"].iloc[i] < 0:
-            fig.add_vrect(
-                x0=df.index[i-1],
-                x1=df.index[i],
-                fillcolor="green",
-                opacity=0.12,
-                line_width=0
-            )
-
-    st.plotly_chart(fig, use_container_width=True)
+    for x0, x1, color in rate_change_spans(df):
+        fig.add_vrect(x0=x0, x1=x1, fillcolor=color, opacity=0.12, line_width=0)
+
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     st.caption(
         """
@@ -214,9 +249,68 @@ def monetary_policy_tab(DATA):
         }
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     st.caption(
         "Inflation expectations closely track realised inflation, "
         "suggesting strong policy credibility by the Bank of Korea."
     )
+
+    st.divider()
+    # ==========================================================
+    # SECTION 6: INFLATION BREADTH
+    # ==========================================================
+    st.subheader("Inflation Breadth")
+
+    derived = DATA.get("derived", {})
+    breadth = derived.get("cpi_breadth")
+    if breadth is None or breadth.empty:
+        st.info("Inflation breadth is not available for the selected period.")
+        return
+
+    contributions = derived["cpi_contributions"]
+    columns = breadth_columns(contributions.shape[1])
+    headline_col, median_col = columns["headline"], columns["median"]
+    trimmed_col, diffusion_col = columns["trimmed_mean"], columns["weighted_diffusion"]
+    latest = breadth.iloc[-1]
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Headline CPI (YoY %)", f"{latest[headline_col]:.1f}")
+    c2.metric("Trimmed-Mean Core (YoY %)", f"{latest[trimmed_col]:.1f}")
+    c3.metric("Basket Above 2% Target", f"{latest[diffusion_col]:.0f}%")
+
+    fig = px.bar(
+        contributions,
+        title="Contributions to Headline CPI Inflation (pp)",
+        labels={"value": "Contribution (pp)", "date": "", "component": "Component"}
+    )
+    fig.add_scatter(
+        x=breadth.index, y=breadth[headline_col], name="Headline CPI (%)",
+        mode="lines", line=dict(color="black", width=2)
+    )
+    fig.update_layout(barmode="relative", bargap=0.1)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+    fig = px.line(
+        breadth[[headline_col, trimmed_col, median_col]],
+        title="Headline vs Core Inflation Measures (YoY %)",
+        labels={"value": "Inflation (%)", "date": "", "variable": "Measure"}
+    )
+    fig.add_scatter(
+        x=breadth.index, y=breadth[diffusion_col], name=diffusion_col,
+        yaxis="y2", mode="lines", line=dict(dash="dot", color="grey")
+    )
+    fig.add_hline(y=2, line_dash="dash", line_color="red", annotation_text="2% Target")
+    fig.update_layout(
+        yaxis2=dict(title="Basket above target (%)", overlaying="y", side="right", range=[0, 100], showgrid=False),
+        legend=dict(orientation="h", y=-0.2)
+    )
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
+
+    st.caption(
+        "Contributions weight each component's inflation by its share of the CPI basket. "
+        "The trimmed mean and median drop the most extreme component moves each month, so they "
+        "show underlying inflation without one-off swings in food or energy prices. "
+        "Weighted diffusion is the share of the basket inflating above the 2% target: a broad "
+        "rise signals generalised price pressure rather than a few volatile items."
+    )
@@ -0,0 +1,56 @@
+import streamlit as st
+
+from dashboard_analysis.chart_spec import render_tab
+
+NPISH = "quarterly/npish"
+TOTAL = "Final consumption expenditure of non-profit institutions serving households"
+PURPOSES = ["Education", "Health", "Recreation and culture", "Social protection", "Others"]
+
+TAB = {
+    "title": "🤝 NPISH Consumption",
+    "sections": [
+        {
+            "subheader": "Final Consumption Expenditure of Non-Profit Institutions Serving Households",
+            "info": (
+                "NPISHs (private schools, hospitals, religious and welfare organisations) provide "
+                "services to households free or below cost; their consumption is part of private "
+                "final consumption in the national accounts."
+            ),
+            "metrics": [
+                {"label": "Total (KRW tn)", "series": {"source": NPISH, "column": TOTAL}, "format": ",.2f", "delta": "QoQ"},
+                {"label": "Total (YoY %)", "series": {"source": NPISH, "column": TOTAL, "transform": "yoy"},
+                 "format": ".2f", "delta": "pp"},
+                {"label": "Social protection (YoY %)",
+                 "series": {"source": NPISH, "column": "Social protection", "transform": "yoy"},
+                 "format": ".2f", "delta": "pp"},
+            ],
+            "charts": [
+                {
+                    "title": "NPISH Consumption by Purpose (KRW tn) — Quarterly",
+                    "y": "KRW Trillion",
+                    "series": [{"source": NPISH, "column": col, "kind": "area"} for col in PURPOSES],
+                    "events": ["covid"],
+                },
+                {
+                    "title": "NPISH Consumption Growth by Purpose (YoY %)",
+                    "y": "YoY (%)",
+                    "series": [
+                        {"source": NPISH, "column": TOTAL, "transform": "yoy", "name": "Total", "kind": "markers"},
+                        *[{"source": NPISH, "column": col, "transform": "yoy", "dash": "dot"} for col in PURPOSES],
+                    ],
+                    "hlines": [{"y": 0}],
+                    "events": ["covid"],
+                },
+            ],
+            "caption": (
+                "Social protection and education make up most NPISH spending and move with "
+                "government transfers and school calendars; recreation and culture is the most "
+                "cyclical component and collapsed during the pandemic."
+            ),
+        },
+    ],
+}
+
+
+def npish_tab(DATA):
+    render_tab(TAB, DATA, st)
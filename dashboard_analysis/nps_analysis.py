@@ -1,10 +1,54 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import sys
 
+from dashboard_analysis.chart_spec import figure
+from dashboard_analysis.figure_io import compact_figure
+
+# NPS net flows (bars) against the market variable they respond to, drawn from the
+# frames the tab derives (df_plot: monthly market changes joined to yearly flows)
+NET_FLOWS = "NPS Net Buying / Selling"
+
+EQUITY_FLOWS = {
+    "title": "KOSPI Returns -> NPS Domestic Equity Flows (NPS role as Rebalancing Channel)",
+    "x": "Date", "y": NET_FLOWS, "y2": "KOSPI Return (%)",
+    "series": [
+        {"column": "domestic_equity", "name": "NPS Domestic Equity Net Flow", "kind": "bar", "opacity": 0.65},
+        {"column": "KOSPI_Return", "name": "KOSPI Monthly Return (%)", "kind": "markers", "axis": "y2"},
+    ],
+}
+
+LIQUIDITY_FLOWS = {
+    "title": "NPS Domestic Equity Flows vs KOSPI Market Liquidity",
+    "x": "Date", "y": NET_FLOWS, "y2": "|Return| per KRW tn Traded",
+    "series": [
+        {"column": "domestic_equity", "name": "NPS Domestic Equity Net Flow", "kind": "bar", "opacity": 0.65},
+        {"column": "KOSPI Amihud illiquidity", "name": "KOSPI Amihud Illiquidity (yearly avg.)",
+         "kind": "markers", "axis": "y2"},
+    ],
+}
+
+YIELD_FLOWS = {
+    "title": "10Y KTB Yield Changes -> NPS Domestic Fixed-Income Flows (NPS role in Yield Absorption)",
+    "x": "Date", "y": NET_FLOWS, "y2": "Yield Change (bp)",
+    "series": [
+        {"column": "domestic_fixed_income", "name": "NPS Domestic Fixed-Income Net Flow", "kind": "bar", "opacity": 0.65},
+        {"column": "KTB_10Y_Yield_Change", "name": "10Y KTB Yield Change (bp)", "kind": "markers", "axis": "y2"},
+    ],
+}
+
+STRESS_FLOWS = {
+    "title": "KTB Market Stress -> NPS Domestic Fixed-Income Flows (NPS role as Liquidity Backstop)",
+    "x": "Date", "y": "KTB Trading Value Change (%)", "y2": NET_FLOWS,
+    "series": [
+        {"column": "KTB_Trading_Value_Change", "name": "KTB Trading Value Change (%)"},
+        {"column": "domestic_fixed_income", "name": "NPS Domestic FI Net Flow", "kind": "bar", "opacity": 0.6,
+         "axis": "y2"},
+    ],
+}
+
 def nps_analysis_tab(DATA):
+    import plotly.express as px
 
     st.title("📈 National Pension Service (NPS) Analysis")
     # ==========================================================
@@ -40,7 +84,7 @@ def nps_analysis_tab(DATA):
         title="NPS Domestic vs Foreign Allocation (%)",
         labels={"value": "Allocation Percentage (%)", "index": "Date"}
     )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     st.caption(
         "The NPS has steadily increased its foreign asset allocation over the years, "
@@ -59,7 +103,7 @@ def nps_analysis_tab(DATA):
 
     # --- Market performance metrics
     df_market["KOSPI_Return"] = (
-        df_market["KOSPI_Index(End Of)"].pct_change() * 100
+        df_market["KOSPI_Index(End Of)"].pct_change(fill_method=None) * 100
     )
 
     df_market["KTB_10Y_Yield_Change"] = (
@@ -67,7 +111,7 @@ def nps_analysis_tab(DATA):
     )
 
     df_market["KTB_Trading_Value_Change"] = (
-        df_market["KTB Trading Value"].pct_change() * 100
+        df_market["KTB Trading Value"].pct_change(fill_method=None) * 100
     )
 
     # --- NPS net flows
@@ -90,51 +134,7 @@ def nps_analysis_tab(DATA):
     # ==========================================================
     # SECTION 3: EQUITY MARKET — REBALANCING (LAGGED RESPONSE)
     # ==========================================================
-    fig_eq = go.Figure()
-
-    fig_eq.add_trace(
-        go.Bar(
-            x=df_plot.index,
-            y=df_plot["domestic_equity"],
-            name="NPS Domestic Equity Net Flow",
-            opacity=0.65,
-            yaxis="y1",
-        )
-    )
-
-    fig_eq.add_trace(
-        go.Scatter(
-            x=df_plot.index,
-            y=df_plot["KOSPI_Return"],
-            name="KOSPI Monthly Return (%)",
-            mode="lines+markers",
-            yaxis="y2",
-        )
-    )
-
-    fig_eq.update_layout(
-        title="KOSPI Returns -> NPS Domestic Equity Flows (NPS role as Rebalancing Channel)",
-        xaxis_title="Date",
-        yaxis=dict(
-            title="NPS Net Buying / Selling",
-            zeroline=True,
-        ),
-        yaxis2=dict(
-            title="KOSPI Return (%)",
-            overlaying="y",
-            side="right",
-            zeroline=False,
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-        ),
-    )
-
-    st.plotly_chart(fig_eq, use_container_width=True)
+    st.plotly_chart(figure(EQUITY_FLOWS, DATA, frame=df_plot), use_container_width=True)
 
     st.caption(
         "NPS domestic equity flows tend to react with a lag to prior market (KOSPI) returns, which can be clearly seen in the chart above."
@@ -143,54 +143,29 @@ def nps_analysis_tab(DATA):
         
     )
 
-    # ==========================================================
-    # Section 4: BOND MARKET — PRICE / YIELD CHANNEL
-    # ==========================================================
-    fig_bond_price = go.Figure()
-
-    fig_bond_price.add_trace(
-        go.Bar(
-            x=df_plot.index,
-            y=df_plot["domestic_fixed_income"],
-            name="NPS Domestic Fixed-Income Net Flow",
-            opacity=0.65,
-            yaxis="y1",
+    # --- NPS equity flows vs market liquidity (yearly average of the monthly factor)
+    df_liq = DATA["monthly"].get("liquidity")
+    if df_liq is not None:
+        df_liq_year = (
+            df_liq[["KOSPI Amihud illiquidity", "KOSPI Turnover (%)"]]
+            .resample("YS").mean()
+            .join(df_nps_flow[["domestic_equity"]], how="inner")
+            .dropna()
         )
-    )
 
-    fig_bond_price.add_trace(
-        go.Scatter(
-            x=df_plot.index,
-            y=df_plot["KTB_10Y_Yield_Change"],
-            name="10Y KTB Yield Change (bp)",
-            mode="lines+markers",
-            yaxis="y2",
-        )
-    )
+        if len(df_liq_year) > 1:
+            st.plotly_chart(figure(LIQUIDITY_FLOWS, DATA, frame=df_liq_year), use_container_width=True)
 
-    fig_bond_price.update_layout(
-        title="10Y KTB Yield Changes -> NPS Domestic Fixed-Income Flows (NPS role in Yield Absorption)",
-        xaxis_title="Date",
-        yaxis=dict(
-            title="NPS Net Buying / Selling",
-            zeroline=True,
-        ),
-        yaxis2=dict(
-            title="Yield Change (bp)",
-            overlaying="y",
-            side="right",
-            zeroline=False,
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-        ),
-    )
+            st.caption(
+                "Amihud illiquidity measures how far KOSPI moves per trillion won traded: higher values "
+                "mean thinner markets where large orders move prices. NPS buying in illiquid years "
+                "supplies liquidity when other investors step back, reinforcing its stabilising role."
+            )
 
-    st.plotly_chart(fig_bond_price, use_container_width=True)
+    # ==========================================================
+    # Section 4: BOND MARKET — PRICE / YIELD CHANNEL
+    # ==========================================================
+    st.plotly_chart(figure(YIELD_FLOWS, DATA, frame=df_plot), use_container_width=True)
 
     st.caption(
         "Rises in long-term KTB yields tend to precede increased NPS domestic fixed-income purchases, " \
@@ -201,51 +176,7 @@ def nps_analysis_tab(DATA):
     # ==========================================================
     # Section 5: BOND MARKET — STRESS / LIQUIDITY CHANNEL
     # ==========================================================
-    fig_bond_stress = go.Figure()
-
-    fig_bond_stress.add_trace(
-        go.Scatter(
-            x=df_plot.index,
-            y=df_plot["KTB_Trading_Value_Change"],
-            name="KTB Trading Value Change (%)",
-            mode="lines",
-            yaxis="y1",
-        )
-    )
-
-    fig_bond_stress.add_trace(
-        go.Bar(
-            x=df_plot.index,
-            y=df_plot["domestic_fixed_income"],
-            name="NPS Domestic FI Net Flow",
-            opacity=0.6,
-            yaxis="y2",
-        )
-    )
-
-    fig_bond_stress.update_layout(
-        title="KTB Market Stress -> NPS Domestic Fixed-Income Flows (NPS role as Liquidity Backstop)",
-        xaxis_title="Date",
-        yaxis=dict(
-            title="KTB Trading Value Change (%)",
-            zeroline=True,
-        ),
-        yaxis2=dict(
-            title="NPS Net Buying / Selling",
-            overlaying="y",
-            side="right",
-            zeroline=False,
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-        ),
-    )
-
-    st.plotly_chart(fig_bond_stress, use_container_width=True)
+    st.plotly_chart(figure(STRESS_FLOWS, DATA, frame=df_plot), use_container_width=True)
 
     st.caption(
         "Periods of elevated KTB trading activity—an indicator of market stress and liquidity demand—are followed by stronger NPS bond absorption. " \
@@ -0,0 +1,158 @@
+import argparse
+import json
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Cache warm-up, so the first visitor after a deploy does not pay for it.
+#
+#   python -m dashboard_analysis.warmup serve [--ready-port 8502] [-- streamlit options]
+#       starts the Streamlit server and, in the same process, warms its caches in the
+#       background; GET :8502/ready answers 503 until they are hot, then 200
+#   python -m dashboard_analysis.warmup prebuild [--publish] [--forecast]
+#       pre-deploy step: builds the pipeline cache (the columnar store, the forecasts of the
+#       series that changed), renders every tab once and exits non-zero if anything fails
+#
+# Warming runs the pipeline, fills the dashboard's st.cache_* entries for the default view
+# (app_cache) and renders every tab headless in parallel, which builds each figure, fills
+# the tabs' own caches (debt simulation) and records a snapshot of every KPI shown.
+
+DASHBOARD = Path(__file__).resolve().parent.parent / "dashboard.py"
+
+READY = threading.Event()
+STATUS = {"ready": False, "started": None, "finished": None, "steps": {}, "kpis": {}, "error": None}
+
+
+def _timed(name, func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    STATUS["steps"][name] = round(time.perf_counter() - t0, 3)
+    return result
+
+
+def _render(tab, view):
+    from dashboard_analysis.headless import run_tab
+
+    blocks = run_tab(tab, view)
+    return [{k: b[k] for k in ("label", "value", "delta")} for b in blocks if b["type"] == "metric"]
+
+
+def warm_up(workers=None, publish=False, forecast=False):
+    STATUS.update(started=time.strftime("%Y-%m-%dT%H:%M:%S"), ready=False, error=None)
+    # Cached calls outside a session warn once each; keep the warm-up quiet
+    from streamlit import logger
+    logger.set_log_level("error")
+    try:
+        # Pipeline first (cached stages load from disk), everything else depends on it
+        from data_pipeline import data_cleaning
+        _timed("pipeline", getattr, data_cleaning, "DATA")
+        DATA_VERSION = data_cleaning.DATA_VERSION
+        if forecast:
+            from data_pipeline.forecast import build_forecasts
+            result = _timed("forecast", build_forecasts, data_cleaning.DATA["monthly"])
+            data_cleaning.DATA["forecast"] = result["forecast"]
+        if publish:
+            import query_service
+            _timed("publish", query_service.publish)
+
+        from dashboard_analysis import app_cache
+        from dashboard_analysis.headless import TAB_MODULES
+
+        # The default view the first session asks for: latest vintage, full period
+        DATA = _timed("load_data", app_cache.load_data)
+        view = _timed("data_view", app_cache.data_view, None, None, DATA_VERSION, DATA)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            vintages = pool.submit(_timed, "vintages", app_cache.vintages, DATA_VERSION)
+            renders = {tab: pool.submit(_timed, f"tab:{tab}", _render, tab, view) for tab in TAB_MODULES}
+            vintages.result()
+            for tab, future in renders.items():
+                STATUS["kpis"][tab] = future.result()
+    except Exception as e:
+        STATUS["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        STATUS["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    STATUS["ready"] = True
+    READY.set()
+    return STATUS
+
+
+# --------------------------------------------
+# Readiness endpoint for the load balancer
+class _ReadinessHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/live":
+            status, body = 200, {"live": True}
+        elif self.path.rstrip("/") == "/ready":
+            status, body = (200 if READY.is_set() else 503), STATUS
+        else:
+            status, body = 404, {"error": "use /ready or /live"}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_readiness(host="0.0.0.0", port=8502):
+    server = ThreadingHTTPServer((host, port), _ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name="readiness", daemon=True).start()
+    return server
+
+
+def start_warm_up(workers=None):
+    def run():
+        try:
+            warm_up(workers)
+        except Exception:
+            pass  # reported through STATUS["error"]; /ready stays 503
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the dashboard caches")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_serve = sub.add_parser("serve", help="run Streamlit and warm its caches in the background")
+    p_serve.add_argument("--ready-port", type=int, default=8502)
+    p_serve.add_argument("--workers", type=int, default=None)
+    p_serve.add_argument("streamlit_args", nargs=argparse.REMAINDER, help="passed to streamlit run")
+    p_pre = sub.add_parser("prebuild", help="pre-deploy warm-up; fails on any error")
+    p_pre.add_argument("--publish", action="store_true", help="also publish the columnar store")
+    p_pre.add_argument("--forecast", action="store_true", help="also re-fit the forecasts of changed series")
+    p_pre.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == "prebuild":
+        try:
+            status = warm_up(args.workers, publish=args.publish, forecast=args.forecast)
+        except Exception:
+            sys.exit(f"warm-up failed: {STATUS['error']}")
+        for step, seconds in status["steps"].items():
+            print(f"{step:<28} {seconds:7.2f}s")
+        print(f"{sum(len(k) for k in status['kpis'].values())} KPIs across {len(status['kpis'])} tabs")
+        return
+
+    from streamlit.web import cli
+
+    serve_readiness(port=args.ready_port)
+    start_warm_up(args.workers)
+    # Same process as the server: the warmed st.cache_* entries are the ones sessions hit
+    sys.argv = ["streamlit", "run", str(DASHBOARD), *[a for a in args.streamlit_args if a != "--"]]
+    cli.main()
+
+
+if __name__ == "__main__":
+    main()
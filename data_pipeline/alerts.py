@@ -0,0 +1,312 @@
+import argparse
+import json
+import logging
+import operator
+import re
+import threading
+import time
+
+import pandas as pd
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from data_pipeline.asof import month_end_asof
+
+# Alert rules over the cleaned panel, evaluated whenever new data arrives.
+#
+# SERIES names a column of DATA and an optional transform; a RULE compares a pandas
+# expression over those series with a threshold. Evaluation is incremental: each rule keeps
+# the date of the last row it evaluated, and a new data version only computes the rows after
+# it (plus the few rows of history the transforms need); revisions to rows already evaluated
+# are not replayed. Alerts fire when a condition switches on, and again as "resolved" when
+# it switches off.
+#
+#   python -m data_pipeline.alerts run --interval 300 --sink log --sink webhook:http://127.0.0.1:8070/
+#   python -m data_pipeline.alerts once                 # one evaluation, e.g. from cron
+#   python -m data_pipeline.alerts webhook-stub --port 8070
+
+ALERT_DIR = Path(__file__).resolve().parent.parent / "data" / "alerts"
+FX_COL = "Won per United States Dollar (Close 15:30)"
+
+# name -> bucket, dataset, column; transform (kind, periods) on the dataset's own rows;
+# at="month_end": daily series sampled at each month end (last fixing, 0.00 rows skipped)
+SERIES = {
+    "krw_usd_3m": {"bucket": "daily", "dataset": "fx", "column": FX_COL, "at": "month_end",
+                   "transform": ("pct_change", 3)},
+    "kospi_3m": {"bucket": "monthly", "dataset": "kospi", "column": "KOSPI_Index(End Of)",
+                 "transform": ("pct_change", 3)},
+    "kosdaq_3m": {"bucket": "monthly", "dataset": "kospi", "column": "KOSDAQ_Index(End of)",
+                  "transform": ("pct_change", 3)},
+    "base_rate": {"bucket": "monthly", "dataset": "bok_rate", "column": "base_rate"},
+    "cpi": {"bucket": "monthly", "dataset": "cpi", "column": "Total item"},
+    "current_exp_12m": {"bucket": "monthly", "dataset": "fiscal_balance", "column": "Current Expenditure",
+                        "transform": ("diff", 12)},
+    "capital_exp_12m": {"bucket": "monthly", "dataset": "fiscal_balance", "column": "Capital Expenditure",
+                        "transform": ("diff", 12)},
+    "revenue_12m": {"bucket": "monthly", "dataset": "fiscal_balance", "column": "Total Revenues",
+                    "transform": ("diff", 12)},
+}
+
+# The checks the tabs make when rendered (market, fiscal and summary tabs)
+RULES = {
+    "krw_depreciation": {
+        "value": "krw_usd_3m", "op": ">", "threshold": 3, "severity": "error",
+        "message": "KRW depreciation pressure: KRW/USD {value:+.1f}% over 3 months",
+    },
+    "krw_appreciation": {
+        "value": "krw_usd_3m", "op": "<", "threshold": -3, "severity": "info",
+        "message": "KRW appreciation: KRW/USD {value:+.1f}% over 3 months",
+    },
+    "risk_off": {
+        "value": "kosdaq_3m - kospi_3m", "op": "<=", "threshold": 0, "severity": "warning",
+        "message": "Risk-off regime: KOSDAQ minus KOSPI 3-month return {value:+.1f}pp",
+    },
+    "fiscal_expansion": {
+        "value": "current_exp_12m + capital_exp_12m - revenue_12m", "op": ">", "threshold": 0,
+        "severity": "warning", "message": "Expansionary fiscal stance: fiscal impulse {value:+,.1f} KRW tn (YoY)",
+    },
+    "accommodative_real_rate": {
+        "value": "base_rate - cpi", "op": "<", "threshold": 0, "severity": "warning",
+        "message": "Accommodative policy: real policy rate {value:.2f}%",
+    },
+}
+
+OPS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------------------------
+# Incremental evaluation
+def _series_names(rule):
+    return [name for name in dict.fromkeys(re.findall(r"[A-Za-z_]\w*", rule["value"])) if name in SERIES]
+
+
+def _new_rows(DATA, name, after):
+    # Rows of a SERIES after `after`, computed from those rows plus the transform's lookback
+    spec = SERIES[name]
+    kind, periods = spec.get("transform", (None, 0))
+    s = DATA[spec["bucket"]][spec["dataset"]][spec["column"]]
+    if spec.get("at") == "month_end":
+        s = s[s > 0]
+        # Only months the data has moved past: a month in progress would change after evaluation
+        months = pd.date_range(s.index[0].to_period("M").start_time, s.index[-1], freq="MS")
+        months = months[months + pd.offsets.MonthEnd(0) <= s.index[-1]]
+        if after is not None:
+            months = months[months > after - pd.DateOffset(months=periods + 1)]
+        s = month_end_asof(months, s)
+
+    if after is not None:
+        start = max(s.index.searchsorted(after, side="right") - periods, 0)
+        s = s.iloc[start:]
+    if kind == "pct_change":
+        s = s.pct_change(periods, fill_method=None) * 100
+    elif kind == "diff":
+        s = s.diff(periods)
+    return s if after is None else s[s.index > after]
+
+
+def evaluate_rule(name, DATA, state):
+    # state: {"through": last evaluated date or None, "active": bool} -> (events, new state)
+    rule = RULES[name]
+    after = None if state.get("through") is None else pd.Timestamp(state["through"])
+    frame = pd.concat({s: _new_rows(DATA, s, after) for s in _series_names(rule)}, axis=1).dropna()
+    if frame.empty:
+        return [], state
+
+    values = frame.eval(rule["value"])
+    hits = OPS[rule["op"]](values, rule["threshold"])
+    if after is None:
+        # First run: start from the latest reading instead of replaying the history
+        values, hits = values.iloc[-1:], hits.iloc[-1:]
+
+    events, active = [], state.get("active", False)
+    for date, value, hit in zip(values.index, values.to_numpy(), hits.to_numpy()):
+        if bool(hit) != active:
+            active = bool(hit)
+            events.append({
+                "rule": name,
+                "status": "firing" if active else "resolved",
+                "severity": rule["severity"] if active else "info",
+                "date": date.strftime("%Y-%m-%d"),
+                "value": float(value),
+                "message": rule["message"].format(value=value) if active else f"Resolved: {name}",
+            })
+    return events, {"through": values.index[-1].strftime("%Y-%m-%d"), "active": active}
+
+
+def evaluate_rules(DATA, state, rules=None):
+    events = []
+    for name in rules or RULES:
+        rule_events, state[name] = evaluate_rule(name, DATA, state.get(name, {}))
+        events += rule_events
+    return events
+
+
+# --------------------------------------------
+# Sinks: callables taking a list of alert dicts
+class LogSink:
+
+    def __init__(self, path=ALERT_DIR / "alerts.jsonl"):
+        self.path = Path(path)
+
+    def __call__(self, alerts):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for alert in alerts:
+                f.write(json.dumps(alert) + "\n")
+
+
+class WebhookSink:
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def __call__(self, alerts):
+        import requests
+
+        requests.post(self.url, json={"alerts": alerts}, timeout=self.timeout).raise_for_status()
+
+
+def make_sink(spec):
+    # "log", "log:<path>", "webhook:<url>"
+    kind, _, target = spec.partition(":")
+    if kind == "log":
+        return LogSink(target) if target else LogSink()
+    if kind == "webhook" and target:
+        return WebhookSink(target)
+    raise ValueError(f"unknown sink {spec!r}; use log[:path] or webhook:<url>")
+
+
+# --------------------------------------------
+# Background scheduler
+class AlertScheduler:
+
+    def __init__(self, sinks, interval=300, state_path=ALERT_DIR / "state.json"):
+        self.sinks = list(sinks)
+        self.interval = interval
+        self.state_path = Path(state_path)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load_state(self):
+        if self.state_path.exists():
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        return {"version": None, "rules": {}}
+
+    def save_state(self, state):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, indent=1), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    def run_once(self):
+        # -> alerts delivered; nothing is rebuilt or evaluated while the data version is unchanged.
+        # A rule's state only advances once every sink has taken its alerts: after a failed
+        # delivery its alerts are evaluated and sent again on the next run (sinks that did
+        # take them then see them twice), and the data version is not marked as done.
+        from data_pipeline.data_cleaning import build_pipeline, data_version
+
+        state = self.load_state()
+        version = data_version()
+        if version == state["version"]:
+            return []
+
+        results, _ = build_pipeline()  # unchanged stages come from the pipeline cache
+        previous = dict(state["rules"])
+        alerts = evaluate_rules(results["data"], state["rules"])
+        for alert in alerts:
+            alert["data_version"] = version
+            alert["emitted_at"] = pd.Timestamp.now().floor("s").isoformat()
+
+        delivered = True
+        for sink in self.sinks if alerts else []:
+            try:
+                sink(alerts)
+            except OSError as e:  # includes requests.RequestException
+                logger.warning("alert sink %s failed: %s", type(sink).__name__, e)
+                delivered = False
+
+        if delivered:
+            state["version"] = version
+        else:
+            for name in {alert["rule"] for alert in alerts}:
+                if name in previous:
+                    state["rules"][name] = previous[name]
+                else:
+                    del state["rules"][name]
+        self.save_state(state)
+        return alerts if delivered else []
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("alert evaluation failed")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="alert-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+# --------------------------------------------
+# Local webhook stub: prints what it receives
+class _StubHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        for alert in body.get("alerts", []):
+            print(f"[{alert['severity']:>7}] {alert['date']} {alert['rule']}: {alert['message']}", flush=True)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate alert rules on new data")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for command in ("run", "once"):
+        p = sub.add_parser(command)
+        p.add_argument("--sink", action="append", default=None, help="log[:path] or webhook:<url> (repeatable)")
+        p.add_argument("--state", default=str(ALERT_DIR / "state.json"))
+        if command == "run":
+            p.add_argument("--interval", type=float, default=300, help="seconds between data checks")
+    p_stub = sub.add_parser("webhook-stub", help="print alerts POSTed to a local port")
+    p_stub.add_argument("--port", type=int, default=8070)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.command == "webhook-stub":
+        print(f"webhook stub on http://127.0.0.1:{args.port}/")
+        ThreadingHTTPServer(("127.0.0.1", args.port), _StubHandler).serve_forever()
+        return
+
+    scheduler = AlertScheduler([make_sink(s) for s in args.sink or ["log"]], state_path=args.state)
+    if args.command == "once":
+        for alert in scheduler.run_once():
+            print(f"[{alert['severity']:>7}] {alert['date']} {alert['rule']}: {alert['message']}")
+        return
+
+    scheduler.interval = args.interval
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+# As-of joins on sorted datetime keys.
+# For every left timestamp, pick the row of `right` whose timestamp is the last one at or
+# before it (backward), the first one at or after it (forward) or the closest (nearest; ties
+# go backward), optionally within a tolerance. Matching is one np.searchsorted per
+# direction, O(n log m), and all columns are gathered with a single take: no resampled or
+# merged intermediate frames.
+
+DIRECTIONS = ("backward", "forward", "nearest")
+
+
+def _keys(index):
+    return np.asarray(index, dtype="datetime64[ns]").view("i8")
+
+
+def asof_positions(left, right, direction="backward", tolerance=None, allow_exact_matches=True):
+    # Row positions into `right` for each `left` key; -1 where nothing matches
+    left_k, right_k = _keys(left), _keys(right)
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {DIRECTIONS}, got {direction!r}")
+    if not len(right_k):
+        return np.full(len(left_k), -1)
+    if np.any(right_k[1:] < right_k[:-1]):
+        raise ValueError("as-of join needs the right-hand keys sorted ascending")
+
+    if direction == "backward":
+        pos = np.searchsorted(right_k, left_k, side="right" if allow_exact_matches else "left") - 1
+    elif direction == "forward":
+        pos = np.searchsorted(right_k, left_k, side="left" if allow_exact_matches else "right")
+        pos[pos == len(right_k)] = -1
+    else:
+        back = asof_positions(left, right, "backward", None, allow_exact_matches)
+        fwd = asof_positions(left, right, "forward", None, allow_exact_matches)
+        gap_back = np.where(back >= 0, left_k - right_k[back], np.iinfo("i8").max)
+        gap_fwd = np.where(fwd >= 0, right_k[fwd] - left_k, np.iinfo("i8").max)
+        pos = np.where(gap_fwd < gap_back, fwd, back)
+
+    if tolerance is not None:
+        gap = np.abs(left_k - right_k[np.maximum(pos, 0)])
+        pos = np.where((pos >= 0) & (gap <= pd.Timedelta(tolerance).value), pos, -1)
+    return pos
+
+
+def asof_join(left_index, right, direction="backward", tolerance=None, allow_exact_matches=True):
+    # right: Series or DataFrame indexed by sorted timestamps -> same, re-indexed on left_index
+    pos = asof_positions(left_index, right.index, direction, tolerance, allow_exact_matches)
+    missing = pos < 0
+
+    values = right.to_numpy(dtype="float64")
+    if len(values):
+        out = values.take(np.where(missing, 0, pos), axis=0)
+        out[missing] = np.nan
+    else:
+        out = np.full((len(pos),) + values.shape[1:], np.nan)
+
+    if isinstance(right, pd.Series):
+        return pd.Series(out, index=left_index, name=right.name)
+    return pd.DataFrame(out, index=left_index, columns=right.columns)
+
+
+def month_end_asof(index, right, tolerance=None):
+    # Month-labelled (month start) rows -> last observation of `right` on or before month end
+    ends = pd.DatetimeIndex(index) + pd.offsets.MonthEnd(0)
+    aligned = asof_join(ends, right, "backward", tolerance)
+    aligned.index = index
+    return aligned
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+# Inflation breadth from the CPI components (YoY %, one column per COICOP group).
+# All months and components are handled as one (months x components) matrix:
+#   contributions  weight x component inflation, in percentage points of headline
+#   diffusion      share of components (and of the basket by weight) above the target
+#   trimmed mean   mean of the components left after dropping TRIM of them at each tail,
+#                  selected with np.partition (a partial sort) rather than a full sort
+#   median         middle component(s), also via np.partition
+# Months with a missing component get NaN core measures instead of a smaller basket.
+
+TOTAL = "Total item"
+TARGET = 2.0
+TRIM = 2   # components dropped at each tail (2 of 12, about 15%)
+
+# Basket weights per mille (Statistics Korea, 2020 base). Contributions use fixed base
+# weights, so their sum only approximates the headline: the gap is kept as a residual.
+CPI_WEIGHTS = {
+    "Food and non-alcoholic beverages": 155.4,
+    "Alcoholic beverages and tobacco": 16.0,
+    "Clothing and footwear": 48.9,
+    "Housing, water, electricity and other fuels": 173.9,
+    "Furnishings, household equipment and routine household maintenance": 45.9,
+    "Health": 87.3,
+    "Transport": 110.6,
+    "Communication": 48.3,
+    "Recreation and culture": 57.9,
+    "Education": 71.7,
+    "Restaurants and hotels": 137.3,
+    "Miscellaneous goods and services": 46.8,
+}
+
+
+def breadth_columns(n_components, trim=TRIM, target=TARGET):
+    # measure -> column of the cpi_breadth frame; the labels carry the trim and target
+    return {
+        "headline": "Headline",
+        "trimmed_mean": f"Trimmed mean ({trim} of {n_components} each tail)",
+        "median": "Median",
+        "diffusion": f"Diffusion (% of components > {target:g}%)",
+        "weighted_diffusion": f"Weighted diffusion (% of basket > {target:g}%)",
+        "residual": "Contribution residual (pp)",
+    }
+
+
+def trimmed_mean(values, trim=TRIM):
+    # Row-wise mean of the middle n - 2*trim values
+    n = values.shape[1]
+    if n - 2 * trim < 1:
+        raise ValueError(f"cannot trim {trim} of {n} components at each tail")
+    middle = np.partition(values, (trim, n - trim - 1), axis=1)[:, trim:n - trim]
+    return middle.mean(axis=1)
+
+
+def row_median(values):
+    n = values.shape[1]
+    lo, hi = (n - 1) // 2, n // 2
+    part = np.partition(values, (lo, hi), axis=1)
+    return (part[:, lo] + part[:, hi]) / 2
+
+
+def cpi_breadth(cpi, weights=CPI_WEIGHTS, target=TARGET, trim=TRIM):
+    # -> {"cpi_contributions": months x components (pp), "cpi_breadth": summary measures}
+    components = [c for c in weights if c in cpi.columns]
+    values = cpi[components].to_numpy(dtype="float64")
+    w = np.array([weights[c] for c in components])
+    w = w / w.sum()
+
+    complete = np.isfinite(values).all(axis=1)
+    filled = np.where(complete[:, None], values, 0.0)
+    contributions = values * w
+
+    def core(measure):
+        return np.where(complete, measure(filled), np.nan)
+
+    with np.errstate(invalid="ignore"):
+        above = values > target
+    headline = cpi[TOTAL].to_numpy(dtype="float64") if TOTAL in cpi.columns else contributions.sum(axis=1)
+
+    columns = breadth_columns(len(components), trim, target)
+    breadth = pd.DataFrame({
+        columns["headline"]: headline,
+        columns["trimmed_mean"]: core(lambda v: trimmed_mean(v, trim)),
+        columns["median"]: core(row_median),
+        columns["diffusion"]: core(lambda v: above.mean(axis=1) * 100),
+        columns["weighted_diffusion"]: core(lambda v: above @ w * 100),
+        columns["residual"]: headline - core(lambda v: (v * w).sum(axis=1)),
+    }, index=cpi.index)
+
+    return {
+        "cpi_contributions": pd.DataFrame(contributions, index=cpi.index, columns=pd.Index(components, name="component")),
+        "cpi_breadth": breadth,
+    }
@@ -0,0 +1,159 @@
+import ast
+import hashlib
+import importlib.util
+import inspect
+import os
+import pickle
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+# Small DAG runner for the cleaning pipeline.
+#
+# A stage is a function of its dependencies' results. Its fingerprint hashes the source of
+# the function's module and of every module of the same package it imports (transitively),
+# its arguments, the content of any source files it reads and its
+# dependencies' fingerprints, so it changes exactly when something upstream changes. With a cache
+# directory, results are stored per fingerprint and a rebuild only runs the stages whose
+# fingerprint is new; the rest are loaded. Ready stages run concurrently in a thread pool
+# (pyarrow and pandas release the GIL for the heavy parts: CSV parsing, resampling).
+
+
+class Stage:
+
+    def __init__(self, name, func, deps=(), args=(), files=()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.args = tuple(args)
+        self.files = tuple(files)
+
+    def run(self, results):
+        return self.func(*self.args, *[results[d] for d in self.deps])
+
+
+def _module_files(module):
+    # The module's source and, transitively, that of every module of its package it imports
+    # (at the top or inside functions): an edit to any helper the stage calls invalidates it
+    package = module.split(".")[0]
+    files, pending = set(), [module]
+    while pending:
+        try:
+            spec = importlib.util.find_spec(pending.pop())
+        except (ImportError, ValueError):
+            continue  # `from pkg.module import name`: the name is not a module
+        if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+            continue
+        path = Path(spec.origin)
+        if path in files:
+            continue
+        files.add(path)
+        for node in ast.walk(ast.parse(path.read_bytes())):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module, *(f"{node.module}.{alias.name}" for alias in node.names)]
+            else:
+                continue
+            pending.extend(n for n in names if n == package or n.startswith(f"{package}."))
+    return sorted(files)
+
+
+def _code_digest(func, modules):
+    if func.__module__ not in modules:
+        digest = hashlib.sha256()
+        # A stage defined in a script (__main__) has no importable module: hash its file
+        for path in _module_files(func.__module__) or [Path(inspect.getsourcefile(func))]:
+            digest.update(path.read_bytes())
+        modules[func.__module__] = digest.hexdigest()
+    return hashlib.sha256((modules[func.__module__] + func.__qualname__).encode()).hexdigest()
+
+
+def fingerprints(stages):
+    fps, modules = {}, {}
+    remaining = dict(stages)
+    while remaining:
+        ready = [s for s in remaining.values() if all(d in fps for d in s.deps)]
+        if not ready:
+            raise ValueError(f"pipeline has a cycle or missing stage among: {sorted(remaining)}")
+        for stage in ready:
+            digest = hashlib.sha256()
+            digest.update(stage.name.encode())
+            digest.update(_code_digest(stage.func, modules).encode())
+            digest.update(repr(stage.args).encode())
+            for file in stage.files:
+                digest.update(Path(file).read_bytes())
+            for dep in stage.deps:
+                digest.update(fps[dep].encode())
+            fps[stage.name] = digest.hexdigest()[:16]
+            del remaining[stage.name]
+    return fps
+
+
+def _cache_file(cache_dir, name, fp):
+    return Path(cache_dir) / f"{name.replace(':', '__').replace('/', '_')}-{fp}.pkl"
+
+
+def run_dag(stages, targets=None, workers=None, cache_dir=None):
+    # stages: list of Stage; returns ({target: result}, {stage: "ran" | "cached"})
+    stages = {s.name: s for s in stages}
+    fps = fingerprints(stages)
+    targets = list(targets or [n for n in stages if not any(n in s.deps for s in stages.values())])
+
+    def cached(name):
+        return cache_dir is not None and _cache_file(cache_dir, name, fps[name]).exists()
+
+    # Walk up from the targets: stop at cached stages, everything else has to run
+    to_run, to_load, pending = set(), set(), list(targets)
+    while pending:
+        name = pending.pop()
+        if name in to_run or name in to_load:
+            continue
+        if cached(name):
+            to_load.add(name)
+        else:
+            to_run.add(name)
+            pending.extend(stages[name].deps)
+
+    results, report = {}, {}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for name, value in zip(to_load, pool.map(lambda n: _load(cache_dir, n, fps[n]), to_load)):
+            results[name] = value
+            report[name] = "cached"
+
+        running = {}
+        while to_run or running:
+            for name in [n for n in to_run if all(d in results for d in stages[n].deps)]:
+                running[pool.submit(stages[name].run, results)] = name
+                to_run.discard(name)
+            if not running:
+                raise ValueError(f"stages cannot be scheduled: {sorted(to_run)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                report[name] = "ran"
+                if cache_dir is not None:
+                    try:
+                        _store(cache_dir, name, fps[name], results[name])
+                    except OSError:
+                        pass  # read-only checkout: the build still succeeds, just uncached
+
+    return {t: results[t] for t in targets}, report
+
+
+def _load(cache_dir, name, fp):
+    with open(_cache_file(cache_dir, name, fp), "rb") as f:
+        return pickle.load(f)
+
+
+def _store(cache_dir, name, fp, value):
+    path = _cache_file(cache_dir, name, fp)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One file per stage: drop results of older fingerprints
+    for old in path.parent.glob(f"{path.name.rsplit('-', 1)[0]}-*.pkl"):
+        old.unlink(missing_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(path)
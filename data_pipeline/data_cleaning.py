@@ -1,150 +1,226 @@
+import hashlib
+import threading
 import pandas as pd
-import numpy as np
 
 from pathlib import Path
-import pandas as pd
 
-BASE_DIR = Path(__file__).resolve().parent.parent 
+from data_pipeline.dag import Stage, fingerprints, run_dag
+from data_pipeline.cpi_breadth import cpi_breadth
+from data_pipeline.factors import MONTHLY_FACTORS, build_factor
+from data_pipeline.forecast import load_forecasts
+from data_pipeline.fx_engine import fx_analytics
+from data_pipeline.nowcast import nowcast_panel, update_nowcaster
+from data_pipeline.quality import apply_mask, quality_report, validate
+from data_pipeline.schema import DATE_FORMATS, SCHEMAS, read_source
+from data_pipeline.units import FX_DATASET, needs_fx, normalize_units
+
+BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
+PIPELINE_CACHE = DATA_DIR / "pipeline_cache"
+
+# --------------------------------------------
+# Dataset registry
+#   file    : source CSV in data/
+#   freq    : native frequency ("D", "M", "Q", "Y"), must match the file's schema date format
+#   monthly : rule that brings the frame onto the month-start panel
+#             (None = already monthly, "mean" = downsample, "ffill" / "interpolate" = upsample)
+#   pivot   : value column for long-format files (asset_class x date)
+DATASETS = {
+    "bok_rate":       {"file": "BOK Base rate MoM.csv", "freq": "M", "monthly": None},
+    "cpi":            {"file": "Consumer Price indices MoM.csv", "freq": "M", "monthly": None},
+    "cts":            {"file": "Consumer Tendency Survey MoM.csv", "freq": "M", "monthly": None},
+    "fx":             {"file": "Exchange Rate of Won against USD, China, Japan Daily.csv", "freq": "D", "monthly": "mean"},
+    "npish":          {"file": "Final Consumption Expenditure of NPISH by Purpose QoQ.csv", "freq": "Q", "monthly": "ffill"},
+    "house_price":    {"file": "House Price Index(KB) MoM.csv", "freq": "M", "monthly": None},
+    "nps_percent":    {"file": "nps_asset_allocation YoY.csv", "freq": "Y", "monthly": "interpolate", "pivot": "weight_percent"},
+    "nps_aum":        {"file": "nps_asset_allocation YoY.csv", "freq": "Y", "monthly": "interpolate", "pivot": "aum_billion_krw"},
+    "ktb":            {"file": "Trade of KTB Bond MoM.csv", "freq": "M", "monthly": None},
+    "kospi":          {"file": "Transactions in KOSPI KOSDAQ Index MoM.csv", "freq": "M", "monthly": None},
+    "fiscal_balance": {"file": "Central Governmnet Fiscal Balance MoM.csv", "freq": "M", "monthly": None},
+    "debt_gdp":       {"file": "GDP n Debt YoY.csv", "freq": "Y", "monthly": "interpolate"},
+    "debt_house":     {"file": "House Debt Ratio QoQ.csv", "freq": "Q", "monthly": "ffill"},
+    "nps_market":     {"file": "nps market perfomance index MoM.csv", "freq": "M", "monthly": None},
+    "debt":           {"file": "Debt QoQ.csv", "freq": "Q", "monthly": "ffill"},
+}
+
+FREQ_BUCKETS = {"D": "daily", "M": "monthly", "Q": "quarterly", "Y": "yearly"}
+
 
-df_bok = pd.read_csv(DATA_DIR / "BOK Base rate MoM.csv")
-df_cpi = pd.read_csv(DATA_DIR / "Consumer Price indices MoM.csv")
-df_cts = pd.read_csv(DATA_DIR / "Consumer Tendency Survey MoM.csv")
-df_fx = pd.read_csv(DATA_DIR / "Exchange Rate of Won against USD, China, Japan Daily.csv")
-df_npish = pd.read_csv(DATA_DIR / "Final Consumption Expenditure of NPISH by Purpose QoQ.csv")
-df_fiscal_balance = pd.read_csv(DATA_DIR / "Central Governmnet Fiscal Balance MoM.csv")
-df_house = pd.read_csv(DATA_DIR / "House Price Index(KB) MoM.csv")
-df_nps = pd.read_csv(DATA_DIR / "nps_asset_allocation YoY.csv")
-df_ktb = pd.read_csv(DATA_DIR / "Trade of KTB Bond MoM.csv")
-df_kospi = pd.read_csv(DATA_DIR / "Transactions in KOSPI KOSDAQ Index MoM.csv")
-df_debt_gdp = pd.read_csv(DATA_DIR / "GDP n Debt YoY.csv")
-df_debt_house = pd.read_csv(DATA_DIR / "House Debt Ratio QoQ.csv")
-df_nps_market = pd.read_csv(DATA_DIR / "nps market perfomance index MoM.csv")
-df_debt = pd.read_csv(DATA_DIR / "Debt QoQ.csv")
-
-# clean nps data to correct format
-df_nps["date"] = pd.to_datetime(df_nps["date"].astype(str), format="%Y")
-df_nps_percent = df_nps.pivot(index="date", columns="asset_class", values="weight_percent").sort_index()
-df_nps_aum = df_nps.pivot(index="date", columns="asset_class", values="aum_billion_krw").sort_index()
-
-# clean data type by frequency
-yearly_data = [df_nps, df_debt_gdp]
-quarterly_data = [df_npish, df_debt_gdp, df_debt_house, df_debt]
-monthly_data = [df_bok, df_cpi, df_cts, df_house, df_ktb, df_kospi, df_fiscal_balance, df_nps_market]
-daily_data = [df_fx]
-full_data = yearly_data + quarterly_data + monthly_data + daily_data
-
-# Helper cleaning function
-import numpy as np
-
-def clean_data(data: pd.DataFrame):
-    # 1. Clean date column
-    if "date" in data.columns:
-        data["date"] = pd.to_datetime(data["date"].astype(str), format="mixed", errors="coerce")
-        data.set_index("date", inplace=True)
-    
-    # 2. Clean numeric columns
-    for col in data.columns:
-        data[col] = (
-            data[col].astype(str)
-            .str.replace(",", "", regex=False)
-            .str.replace(" ", "", regex=False)
-            .replace({"-": np.nan, ".": np.nan, "..": np.nan, "nan": np.nan})
+def load_dataset(name, spec, raw):
+    # A dataset may only go through the date parser of its declared frequency
+    date_format = SCHEMAS[spec["file"]]["date_format"]
+    if date_format != DATE_FORMATS[spec["freq"]]:
+        raise ValueError(
+            f"{name}: schema date format '{date_format}' does not match declared frequency '{spec['freq']}'"
         )
-        data[col] = pd.to_numeric(data[col], errors="coerce")
-    
-    # 3. Clean column names
-    data.columns = data.columns.str.strip()
-    return data
+
+    if "pivot" in spec:
+        return raw.pivot(index="date", columns="asset_class", values=spec["pivot"]).sort_index()
+
+    return raw.set_index("date")
+
+
+# Data version: source file contents plus the code that cleans them (the pipeline's own
+# fingerprints), used to key caches and published artifacts
+def data_version(datasets=DATASETS):
+    fps = fingerprints({stage.name: stage for stage in pipeline_stages(datasets)})
+    return hashlib.sha256((fps["data"] + fps["nowcaster"] + fps["derived"]).encode()).hexdigest()[:12]
+
+
+# --------------------------------------------
+# Frequency alignment: one resample per rule over all datasets sharing it
+def monthly_rules(datasets=DATASETS):
+    rules = {}
+    for name, spec in datasets.items():
+        rules.setdefault(spec["monthly"], []).append(name)
+    return rules
+
+
+def resample_group(names, rule, *group):
+    # group: the datasets' cleaned frames (masked cells already dropped)
+    frames = dict(zip(names, group))
+    if rule is None:
+        return frames
+
+    wide = pd.concat(frames, axis=1)
+    resampled = getattr(wide.resample("MS"), rule)()
+
+    # Trim each dataset back to its own span so shared resampling never extends a series
+    panel = {}
+    for name in names:
+        index = frames[name].index
+        start = index.min().to_period("M").to_timestamp()
+        panel[name] = resampled[name].loc[start:index.max()]
+    return panel
+
+
+def build_monthly_panel(frames, datasets=DATASETS):
+    panel = {}
+    for rule, names in monthly_rules(datasets).items():
+        panel.update(resample_group(names, rule, *[frames[n] for n in names]))
+    return {name: panel[name] for name in datasets}
+
+
+# --------------------------------------------
+# Quality mask: the cells flagged by the MASKED checks (ECOS 0.00 holiday rows, repeated
+# dates) are dropped from the frames themselves, so the native-frequency buckets, the FX
+# engine, alerts and the nowcaster see the same values as the monthly panel
+def mask_dataset(df, checked):
+    return apply_mask(df, checked["mask"])
+
+
+def clean_frames(frames, datasets=DATASETS):
+    return {name: mask_dataset(df, validate(name, datasets[name]["freq"], df)) for name, df in frames.items()}
 
 
 # --------------------------------------------
-# Clean data
-for df in quarterly_data:
-    df["date"] = (
-        df["date"]
-        .astype(str)
-        .str.replace("/", "", regex=False)
-    )
-    df["date"] = pd.PeriodIndex(df["date"], freq="Q").to_timestamp()
-
-for i in range(len(full_data)):
-    full_data[i] = clean_data(full_data[i])
-
-# clean data units
-df_debt_gdp = df_debt_gdp.rename(columns={"Korea, Republic Of": "GDP"})
-cols = [
-    "Gross External Debt",
-    "GDP"
-]
-df_debt_gdp[cols] = df_debt_gdp[cols] * 1452.33 / 1e6 # USD/KRW exchange rate as of Jan 2026
-
-df_fiscal_balance = df_fiscal_balance / 1000
-
-df_npish = df_npish / 1000
-
-df_ktb = df_ktb / 1e12
-
-df_nps_market["KTB Trading Value"] = df_nps_market["KTB Trading Value"] / 1e9
-
-cols_kospi = ['KOSDAQ_Trading Value', 'KOSDAQ_Trading Value (Daily Arg.)', 
-              'KOSPI_Trading Value', 'KOSPI_Trading Value (Daily Arg.)']
-df_kospi[cols_kospi] = df_kospi[cols_kospi] / 1e9
-
-# clean data into monthly frequency
-# daily to monthly
-df_fx_monthly    = df_fx.resample("MS").mean()
-# quarterly to monthly
-df_npish_monthly = df_npish.resample("MS").ffill()
-df_debt_house_monthly = df_debt_house.resample("MS").ffill()
-df_debt_monthly = df_debt.resample("MS").ffill()
-
-# yearly to monthly
-df_nps_percent_monthly   = df_nps_percent.resample("MS").interpolate()
-df_nps_aum_monthly       = df_nps_aum.resample("MS").interpolate()
-df_debt_gdp_monthly = df_debt_gdp.resample("MS").interpolate()
-
-full_df_list = [df_bok, df_cpi, df_cts, df_fx_monthly, df_npish_monthly, df_house, 
-                df_debt_house, df_debt_house_monthly,
-                df_nps_percent_monthly, df_nps_aum_monthly, df_ktb, df_kospi,
-                df_fiscal_balance, df_debt_gdp_monthly,
-                df_npish, df_debt_gdp,df_debt,
-                df_nps_percent, df_nps_aum, df_nps_market,
-                df_fx]
-
-for df in full_df_list:
-    df.apply(pd.to_numeric, errors="coerce")
+# Pipeline DAG: read -> frame -> units -> quality -> clean per dataset, one resample per monthly rule, then
+# assembly. Independent stages run concurrently; cached stages are reused until an input
+# file or the code behind them changes.
+def collect_frames(names, *group):
+    return dict(zip(names, group))
+
+
+def assemble_data(names, frames, *panels, datasets=DATASETS):
+    panel = {}
+    for part in panels:
+        panel.update(part)
+    # Datasets first, then the factors built from them
+    monthly = [*names, *(f for f in MONTHLY_FACTORS if f in panel)]
+    data = {"monthly": {name: panel[name] for name in monthly}, "quarterly": {}, "yearly": {}, "daily": {}}
+    for name in names:
+        bucket = FREQ_BUCKETS[datasets[name]["freq"]]
+        if bucket != "monthly":
+            data[bucket][name] = frames[name]
+    return data
+
+
+# Cleaned frames (native frequency, final units, masked) -> the nested DATA buckets used by the tabs
+def build_data(frames, datasets=DATASETS):
+    factors = [build_factor(name, frames[source]) for name, (_, source) in MONTHLY_FACTORS.items()]
+    return assemble_data(list(datasets), frames, build_monthly_panel(frames, datasets), *factors, datasets=datasets)
+
+
+# Derived layer: analytics computed from the cleaned frames, DATA["derived"][name]
+def merge_derived(*parts):
+    derived = {}
+    for part in parts:
+        derived.update(part)
+    return derived
+
+
+def build_derived(frames):
+    return merge_derived(fx_analytics(frames[FX_DATASET]), cpi_breadth(frames["cpi"]))
+
+
+def pipeline_stages(datasets=DATASETS):
+    names = list(datasets)
+    stages = []
+    for file in sorted({spec["file"] for spec in datasets.values()}):
+        stages.append(Stage(f"read:{file}", read_source, args=(DATA_DIR / file,), files=(DATA_DIR / file,)))
+    for name, spec in datasets.items():
+        stages.append(Stage(f"frame:{name}", load_dataset, deps=[f"read:{spec['file']}"], args=(name, spec)))
+        # USD amounts are converted at the daily rate of their date: those datasets wait for FX
+        deps = [f"frame:{name}", f"frame:{FX_DATASET}"] if needs_fx(name) else [f"frame:{name}"]
+        stages.append(Stage(f"units:{name}", normalize_units, deps=deps, args=(name,)))
+        stages.append(Stage(f"quality:{name}", validate, deps=[f"units:{name}"], args=(name, spec["freq"])))
+        stages.append(Stage(f"clean:{name}", mask_dataset, deps=[f"units:{name}", f"quality:{name}"]))
+    stages.append(Stage("frames", collect_frames, deps=[f"clean:{n}" for n in names], args=(names,)))
+    stages.append(Stage("quality", quality_report, deps=[f"quality:{n}" for n in names], args=(names,)))
+
+    rules = monthly_rules(datasets)
+    for rule, group in rules.items():
+        stages.append(Stage(f"monthly:{rule}", resample_group, deps=[f"clean:{n}" for n in group], args=(group, rule)))
+    for name, (_, source) in MONTHLY_FACTORS.items():
+        stages.append(Stage(f"factor:{name}", build_factor, deps=[f"clean:{source}"], args=(name,)))
+    panels = [*[f"monthly:{r}" for r in rules], *[f"factor:{n}" for n in MONTHLY_FACTORS]]
+    stages.append(Stage("data", assemble_data, deps=["frames", *panels], args=(names,)))
+    # Resumes the saved nowcaster and feeds it only the rows published since its last run
+    stages.append(Stage("nowcaster", update_nowcaster, deps=["data"]))
+
+    stages.append(Stage("derived:fx", fx_analytics, deps=[f"clean:{FX_DATASET}"]))
+    stages.append(Stage("derived:cpi", cpi_breadth, deps=["clean:cpi"]))
+    stages.append(Stage("derived", merge_derived, deps=["derived:fx", "derived:cpi"]))
+    return stages
+
+
+def build_pipeline(workers=None, cache_dir=PIPELINE_CACHE):
+    return run_dag(pipeline_stages(), targets=["frames", "data", "nowcaster", "derived", "quality"], workers=workers, cache_dir=cache_dir)
+
 
 # --------------------------------------------
-DATA = {
-    "monthly": {
-        "bok_rate": df_bok,
-        "cpi": df_cpi,
-        "cts": df_cts,
-        "fx": df_fx_monthly,
-        "npish": df_npish_monthly,
-        "house_price": df_house,
-        "nps_percent": df_nps_percent_monthly,
-        "nps_aum": df_nps_aum_monthly,
-        "ktb": df_ktb,
-        "kospi": df_kospi,
-        "fiscal_balance": df_fiscal_balance,
-        "debt_gdp": df_debt_gdp_monthly,
-        "debt_house": df_debt_house_monthly,
-        "nps_market": df_nps_market,
-        "debt": df_debt_monthly,
-    },
-    "quarterly": {
-        "npish": df_npish,
-        "debt_house": df_debt_house,
-        "debt": df_debt,
-    },
-    "yearly": {
-        "nps_percent": df_nps_percent,
-        "nps_aum": df_nps_aum,
-        "debt_gdp": df_debt_gdp,
-    },
-    "daily": {
-        "fx": df_fx,
+# Clean data, built on first access to one of these names rather than at import (PEP 562),
+# so importing the module for its functions or DATASETS does no I/O
+_LAZY = ("DATA", "frames", "NOWCASTER", "PIPELINE_REPORT", "QUALITY")
+_build_lock = threading.Lock()
+
+
+def _build():
+    results, report = build_pipeline()
+    DATA = results["data"]
+    # Provisional current-month estimates from daily FX, flagged via the "provisional" column
+    DATA["nowcast"] = nowcast_panel(results["nowcaster"])
+    # Analytics on the cleaned frames (FX crosses and volatility, CPI breadth), cached with the pipeline
+    DATA["derived"] = results["derived"]
+    # Forecast cones of the monthly series, fitted offline (python -m data_pipeline.forecast build);
+    # only the saved fits of the current data are loaded, nothing is fitted here
+    DATA["forecast"] = load_forecasts(DATA["monthly"])
+    return {
+        "DATA": DATA, "frames": results["frames"], "NOWCASTER": results["nowcaster"], "PIPELINE_REPORT": report,
+        # Data-quality findings per dataset and check (data_pipeline.quality); flagged cells of
+        # the masked checks are already left out of the frames and every bucket built from them
+        "QUALITY": results["quality"],
     }
-}
+
+
+def __getattr__(name):
+    if name == "DATA_VERSION":
+        # Fingerprints only: no stage is run
+        globals()["DATA_VERSION"] = data_version()
+        return globals()["DATA_VERSION"]
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _build_lock:
+        if name not in globals():
+            globals().update(_build())
+    return globals()[name]
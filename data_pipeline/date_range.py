@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from data_pipeline import store
+
+# Date-range views of the nested DATA dict.
+# Every frame is sorted by date, so a range is two binary searches on the index and an
+# iloc slice (a view for these single-dtype frames, no copy). Frames that share an index
+# object are searched once.
+
+
+def data_span(DATA, bucket="monthly"):
+    # From the first month every series is present to the last month any series has
+    starts = [df.index[0] for df in DATA[bucket].values() if len(df)]
+    ends = [df.index[-1] for df in DATA[bucket].values() if len(df)]
+    return max(starts), max(ends)
+
+
+def month_range(start, end):
+    return list(pd.date_range(pd.Timestamp(start).to_period("M").start_time, end, freq="MS"))
+
+
+def _bounds(index, start, end):
+    values = index.values
+    lo = 0 if start is None else np.searchsorted(values, np.datetime64(pd.Timestamp(start)), side="left")
+    hi = len(values) if end is None else np.searchsorted(values, np.datetime64(pd.Timestamp(end)), side="right")
+    return lo, hi
+
+
+def slice_data(DATA, start=None, end=None):
+    bounds, view = {}, {}
+    for bucket, frames in DATA.items():
+        view[bucket] = {}
+        for name, df in frames.items():
+            key = id(df.index)
+            if key not in bounds:
+                bounds[key] = _bounds(df.index, start, end)
+            lo, hi = bounds[key]
+            view[bucket][name] = df.iloc[lo:hi]
+    return view
+
+
+def read_data(start=None, end=None, root=store.STORE_DIR):
+    # Same shape as slice_data, but read from the published columnar store: the range is
+    # pushed down into the Parquet reads, so row groups outside it are never decoded
+    catalog = store.read_catalog(root)
+    view = {}
+    for name, entry in catalog["datasets"].items():
+        for bucket in entry["buckets"].values():
+            path = f"{store.CLEANED}/{bucket}/{name}"
+            batches = store.scan_frame(path, start=start, end=end, root=root)
+            table = pa.Table.from_batches(list(batches), schema=store.frame_schema(path, root))
+            view.setdefault(bucket, {})[name] = table.to_pandas().set_index("date")
+    return view
+
+
+def store_version(root=store.STORE_DIR):
+    try:
+        return store.read_catalog(root)["version"]
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,293 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+from data_pipeline import store
+from data_pipeline.schema import SCHEMAS
+
+# ECOS Open API (https://ecos.bok.or.kr/api/)
+#   StatisticSearch/{key}/json/{lang}/{start_row}/{end_row}/{stat_code}/{cycle}/{from}/{to}/{item}
+#   StatisticItemList/{key}/json/{lang}/{start_row}/{end_row}/{stat_code}
+ECOS_URL = "https://ecos.bok.or.kr/api"
+PAGE_SIZE = 10_000
+SAMPLE_PAGE_SIZE = 10   # the public "sample" key answers at most 10 rows per request
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "ecos_cache"
+
+
+def _same_names(file, exclude=()):
+    # Items whose ECOS English name is the CSV column (the CSVs are ECOS exports)
+    return {c: c for c in SCHEMAS[file]["columns"][1:] if c not in exclude}
+
+
+def _by_market(file):
+    # "KOSPI_Index(End Of)" is item "Index(End Of)" under parent item "KOSPI": the bare name
+    # is ambiguous (KOSDAQ has the same items), so these are selected as "parent/name"
+    return {c.replace("_", "/", 1): c for c in SCHEMAS[file]["columns"][1:]}
+
+
+FX_FILE = "Exchange Rate of Won against USD, China, Japan Daily.csv"
+FX_INTRADAY = [c for c in SCHEMAS[FX_FILE]["columns"] if c.endswith(("(Open)", "(High)", "(Higt)", "(Low)"))]
+
+# Datasets of data_cleaning.DATASETS that come from ECOS: per table, ECOS item -> column of
+# the dataset's schema (schema.SCHEMAS). Items are selected by English ECOS item name (or
+# "parent/name" where the name repeats), their codes resolved once through StatisticItemList
+# and cached; a declared item missing from its table is an error, not a silently absent column.
+# (nps_percent / nps_aum come from data/nps_data_scraping.py, not ECOS.)
+ECOS_SERIES = {
+    "bok_rate":       [{"stat_code": "722Y001", "cycle": "M", "items": {"Bank of Korea Base Rate": "base_rate"}}],
+    "cpi":            [{"stat_code": "901Y009", "cycle": "M", "items": _same_names("Consumer Price indices MoM.csv")}],
+    "cts":            [{"stat_code": "511Y002", "cycle": "M", "items": _same_names("Consumer Tendency Survey MoM.csv")}],
+    "fx":             [{"stat_code": "731Y001", "cycle": "D", "items": _same_names(FX_FILE, exclude=FX_INTRADAY)},
+                       {"stat_code": "731Y003", "cycle": "D", "items": {c: c for c in FX_INTRADAY}}],
+    "npish":          [{"stat_code": "200Y014", "cycle": "Q",
+                        "items": _same_names("Final Consumption Expenditure of NPISH by Purpose QoQ.csv")}],
+    "house_price":    [{"stat_code": "901Y062", "cycle": "M", "items": _same_names("House Price Index(KB) MoM.csv")}],
+    "ktb":            [{"stat_code": "901Y024", "cycle": "M", "items": _same_names("Trade of KTB Bond MoM.csv")}],
+    "kospi":          [{"stat_code": "901Y014", "cycle": "M",
+                        "items": _by_market("Transactions in KOSPI KOSDAQ Index MoM.csv")}],
+    "fiscal_balance": [{"stat_code": "301Y013", "cycle": "M",
+                        "items": _same_names("Central Governmnet Fiscal Balance MoM.csv")}],
+    "debt_gdp":       [{"stat_code": "902Y016", "cycle": "A", "items": _same_names("GDP n Debt YoY.csv")}],
+    "debt_house":     [{"stat_code": "151Y005", "cycle": "Q", "items": _same_names("House Debt Ratio QoQ.csv")}],
+    "nps_market":     [{"stat_code": "901Y014", "cycle": "M", "items": {"KOSPI/Index(End Of)": "KOSPI_Index(End Of)"}},
+                       {"stat_code": "901Y024", "cycle": "M", "items": {"Trading Value KRX KTB": "KTB Trading Value"}},
+                       {"stat_code": "721Y001", "cycle": "M",
+                        "items": {"Yields of Treasury Bonds(10-year)": "Yields of Treasury Bonds(10-year)"}}],
+    "debt":           [{"stat_code": "133Y001", "cycle": "Q", "items": _same_names("Debt QoQ.csv")}],
+}
+
+TIME_FORMATS = {"D": "%Y%m%d", "M": "%Y%m", "A": "%Y"}
+
+
+class EcosError(RuntimeError):
+    pass
+
+
+def dataset_columns(name):
+    # Columns of a fetched dataset, in declaration order
+    return [column for spec in ECOS_SERIES[name] for column in spec["items"].values()]
+
+
+# --------------------------------------------
+# Period helpers
+def parse_time(values, cycle):
+    values = pd.Series(values, dtype=str)
+    if cycle == "Q":
+        return pd.PeriodIndex(values, freq="Q").to_timestamp()
+    return pd.DatetimeIndex(pd.to_datetime(values, format=TIME_FORMATS[cycle]))
+
+
+def format_time(ts, cycle):
+    ts = pd.Timestamp(ts)
+    if cycle == "Q":
+        return f"{ts.year}Q{ts.quarter}"
+    return ts.strftime(TIME_FORMATS[cycle])
+
+
+def _retry_after(resp):
+    # Seconds from a Retry-After header (delay in seconds or an HTTP date), or None
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+# --------------------------------------------
+# Client
+class EcosClient:
+
+    def __init__(self, api_key=None, base_url=ECOS_URL, cache_dir=CACHE_DIR, store_root=store.STORE_DIR,
+                 max_concurrency=8, max_retries=5, backoff=0.5, timeout=30, record_dir=None):
+        self.api_key = api_key or os.environ.get("ECOS_API_KEY", "sample")
+        self.page_size = SAMPLE_PAGE_SIZE if self.api_key == "sample" else PAGE_SIZE
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = Path(cache_dir)
+        self.store_root = store_root
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.record_dir = Path(record_dir) if record_dir else None
+
+        # One pooled session shared by all requests; the pool matches the concurrency bound
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._semaphore = None
+
+    # ---- HTTP with ETag cache and retry/backoff
+    def _cache_file(self, path):
+        return self.cache_dir / f"{hashlib.sha1(path.encode()).hexdigest()}.json"
+
+    def _get(self, path):
+        cache_file = self._cache_file(path)
+        cached = json.loads(cache_file.read_text()) if cache_file.exists() else None
+        cached = cached if cached and "body" in cached else None
+        headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+
+        url = f"{self.base_url}/{path.format(key=self.api_key)}"
+        for attempt in range(self.max_retries + 1):
+            wait = None
+            try:
+                resp = self.session.get(url, headers=headers, timeout=self.timeout)
+                if resp.status_code == 304 and not cached:
+                    # Nothing cached to answer with: ask for the full body, past any cache on the way
+                    resp = self.session.get(url, headers={"Cache-Control": "no-cache"}, timeout=self.timeout)
+                if resp.status_code == 304:
+                    if not cached:
+                        raise EcosError(f"ECOS answered 304 Not Modified without a cached response: {path}")
+                    body = cached["body"]
+                    break
+                if resp.status_code < 500 and resp.status_code != 429:
+                    resp.raise_for_status()
+                    body = resp.json()
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(json.dumps({"etag": resp.headers.get("ETag"), "body": body}))
+                    break
+                wait = _retry_after(resp)
+            except (requests.ConnectionError, requests.Timeout):
+                pass
+            if attempt == self.max_retries:
+                raise EcosError(f"ECOS request failed after {self.max_retries} retries: {path}")
+            # Exponential backoff with jitter, or longer when the server says when to come back
+            delay = self.backoff * 2 ** attempt * (1 + random.random())
+            time.sleep(delay if wait is None else max(delay, wait))
+
+        # Recorded whether fresh or revalidated, so a --record session replays completely
+        if self.record_dir is not None:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+            (self.record_dir / cache_file.name).write_text(json.dumps(body))
+        return body
+
+    async def _aget(self, path):
+        async with self._semaphore:
+            return await asyncio.to_thread(self._get, path)
+
+    @staticmethod
+    def _rows(body, service):
+        if service not in body:
+            result = body.get("RESULT", {})
+            if result.get("CODE") == "INFO-200":   # no data for the requested range
+                return 0, []
+            raise EcosError(f"ECOS error {result.get('CODE')}: {result.get('MESSAGE')}")
+        return body[service]["list_total_count"], body[service]["row"]
+
+    async def _paged(self, service, tail):
+        # First page tells the total row count, remaining pages go out concurrently
+        size = self.page_size
+        first = await self._aget(f"{service}/{{key}}/json/en/1/{size}/{tail}")
+        total, rows = self._rows(first, service)
+        pages = [
+            self._aget(f"{service}/{{key}}/json/en/{start}/{start + size - 1}/{tail}")
+            for start in range(size + 1, total + 1, size)
+        ]
+        for body in await asyncio.gather(*pages):
+            rows += self._rows(body, service)[1]
+        return rows
+
+    # ---- Series fetching
+    async def item_codes(self, stat_code):
+        # item name -> code; a name that repeats under different parent items is only
+        # available as "parent/name"
+        rows = await self._paged("StatisticItemList", stat_code)
+        counts = Counter(row["ITEM_NAME"] for row in rows)
+        codes = {}
+        for row in rows:
+            if row.get("P_ITEM_NAME"):
+                codes[f"{row['P_ITEM_NAME']}/{row['ITEM_NAME']}"] = row["ITEM_CODE"]
+            if counts[row["ITEM_NAME"]] == 1:
+                codes[row["ITEM_NAME"]] = row["ITEM_CODE"]
+        return codes
+
+    async def fetch_table(self, spec, start, end):
+        codes = await self.item_codes(spec["stat_code"])
+        items = spec["items"]
+        missing = [name for name in items if name not in codes]
+        if missing:
+            raise EcosError(f"{spec['stat_code']}: no item {', '.join(map(repr, missing))}")
+
+        tail = f"{spec['stat_code']}/{spec['cycle']}/{format_time(start, spec['cycle'])}/{format_time(end, spec['cycle'])}"
+        results = await asyncio.gather(*[self._paged("StatisticSearch", f"{tail}/{codes[name]}") for name in items])
+
+        columns = {}
+        for name, rows in zip(items, results):
+            if rows:
+                index = parse_time([row["TIME"] for row in rows], spec["cycle"])
+                values = pd.to_numeric([row["DATA_VALUE"] for row in rows], errors="coerce")
+                columns[items[name]] = pd.Series(values, index=index)
+        return pd.DataFrame(columns)
+
+    async def fetch_dataset(self, name, start="2018-01-01", end=None):
+        end = pd.Timestamp.today().normalize() if end is None else pd.Timestamp(end)
+
+        # Date-range delta: only re-request from the last stored period (it may have been revised)
+        existing = None
+        if store.has_frame(name, self.store_root):
+            existing = store.read_frame(name, root=self.store_root)
+            if not existing.empty:
+                start = existing.index.max()
+
+        frames = await asyncio.gather(*[self.fetch_table(spec, start, end) for spec in ECOS_SERIES[name]])
+        frames = [f for f in frames if not f.empty]
+        # Nothing new (INFO-200 for every item): keep what is stored
+        if not frames:
+            return existing if existing is not None else pd.DataFrame(columns=dataset_columns(name))
+
+        fresh = pd.concat(frames, axis=1)
+        if existing is not None:
+            fresh = fresh.combine_first(existing)
+        fresh = fresh.reindex(columns=dataset_columns(name)).sort_index()
+        fresh.index.name = "date"
+        store.write_frame(name, fresh, self.store_root)
+        return fresh
+
+    async def fetch_all(self, names=None, start="2018-01-01", end=None):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        names = list(ECOS_SERIES) if names is None else names
+        frames = await asyncio.gather(*[self.fetch_dataset(name, start, end) for name in names])
+        return dict(zip(names, frames))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-fetch ECOS series into the columnar store")
+    parser.add_argument("datasets", nargs="*", help="datasets to fetch (default: all)")
+    parser.add_argument("--base-url", default=ECOS_URL, help="API root, e.g. a local ecos_mock server")
+    parser.add_argument("--start", default="2018-01-01")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--record", default=None, help="save raw responses for ecos_mock replay")
+    args = parser.parse_args()
+
+    client = EcosClient(base_url=args.base_url, max_concurrency=args.concurrency, record_dir=args.record)
+    t0 = time.perf_counter()
+    frames = asyncio.run(client.fetch_all(args.datasets or None, start=args.start))
+    for name, df in frames.items():
+        print(f"{name:15s} {df.shape[0]:6d} rows x {df.shape[1]:3d} cols")
+    print(f"done in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
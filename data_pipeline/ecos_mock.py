@@ -0,0 +1,85 @@
+import argparse
+import hashlib
+import json
+import random
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+# Local stand-in for the ECOS Open API.
+# Replays responses recorded by `ecos_client --record DIR`: files are keyed by the request path
+# with the API key masked, exactly as the client names them, so a recorded session can be
+# replayed offline. ETags are honoured, and latency / transient 503s can be injected to
+# exercise the client's concurrency and retry paths.
+
+NO_DATA = {"RESULT": {"CODE": "INFO-200", "MESSAGE": "No data for the requested range"}}
+
+
+def fixture_name(path):
+    # /api/{service}/{key}/json/... -> same hash the client uses for its cache/record files
+    parts = unquote(urlparse(path).path).strip("/").split("/")
+    if parts and parts[0] == "api":
+        parts = parts[1:]
+    if len(parts) > 1:
+        parts[1] = "{key}"
+    return f"{hashlib.sha1('/'.join(parts).encode()).hexdigest()}.json"
+
+
+def make_handler(fixtures, latency=0.0, fail_rate=0.0):
+
+    class EcosMockHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            if fail_rate and random.random() < fail_rate:
+                self.send_response(503)
+                self.end_headers()
+                return
+
+            file = Path(fixtures) / fixture_name(self.path)
+            body = file.read_bytes() if file.exists() else json.dumps(NO_DATA).encode()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return EcosMockHandler
+
+
+def serve(fixtures, host="127.0.0.1", port=8765, latency=0.0, fail_rate=0.0):
+    server = ThreadingHTTPServer((host, port), make_handler(fixtures, latency, fail_rate))
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded ECOS responses on a local port")
+    parser.add_argument("fixtures", help="directory written by ecos_client --record")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered with 503")
+    args = parser.parse_args()
+
+    server = serve(args.fixtures, port=args.port, latency=args.latency, fail_rate=args.fail_rate)
+    print(f"ECOS mock on http://127.0.0.1:{args.port}/api (fixtures: {args.fixtures})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
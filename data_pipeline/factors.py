@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+# Monthly factors built from cleaned datasets and added to the monthly panel,
+# DATA["monthly"][name], like any dataset (so they are sliced, published and
+# reconstructed per vintage with the rest).
+#
+# liquidity (from kospi: trading value in KRW tn, market cap in KRW thousand), per exchange:
+#   Turnover (%)              trading value / market capitalization
+#   Amihud illiquidity        |monthly index return| (%) per KRW tn traded: how far the
+#                             market moves per unit of trading, higher = less liquid
+#   Value per company (KRW bn)  trading value / listed companies
+# and KOSDAQ relative to KOSPI:
+#   Relative turnover         KOSDAQ turnover / KOSPI turnover
+#   KOSDAQ value share (%)    KOSDAQ share of combined trading value
+
+EXCHANGES = {
+    "KOSPI": {
+        "index": "KOSPI_Index(End Of)",
+        "value": "KOSPI_Trading Value",
+        "market_cap": "KOSPI_Market Capitalization",
+        "companies": "KOSPI_No.of Listed Companies",
+    },
+    "KOSDAQ": {
+        "index": "KOSDAQ_Index(End of)",
+        "value": "KOSDAQ_Trading Value",
+        "market_cap": "KOSDAQ_Market Capitalization",
+        "companies": "KOSDAQ_No.of Listed Companies",
+    },
+}
+
+
+def liquidity_factors(kospi, exchanges=EXCHANGES):
+    # One (months x exchanges) matrix per input field, every factor computed on all at once
+    def field(key):
+        return kospi[[spec[key] for spec in exchanges.values()]].to_numpy(dtype="float64")
+
+    level, value = field("index"), field("value")
+    # Market capitalization arrives in KRW thousand (units.py leaves it as delivered)
+    market_cap, companies = field("market_cap") / 1e9, field("companies")
+
+    returns = np.full_like(level, np.nan)
+    returns[1:] = (level[1:] / level[:-1] - 1) * 100
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        factors = {
+            "Turnover (%)": value / market_cap * 100,
+            "Amihud illiquidity": np.abs(returns) / value,
+            "Value per company (KRW bn)": value / companies * 1e3,
+        }
+
+    names = list(exchanges)
+    out = pd.DataFrame(
+        np.hstack(list(factors.values())),
+        index=kospi.index,
+        columns=[f"{exchange} {factor}" for factor in factors for exchange in names],
+    )
+    out["Relative turnover (KOSDAQ/KOSPI)"] = out["KOSDAQ Turnover (%)"] / out["KOSPI Turnover (%)"]
+    out["KOSDAQ value share (%)"] = value[:, names.index("KOSDAQ")] / value.sum(axis=1) * 100
+    return out
+
+
+# name -> (builder, source dataset)
+MONTHLY_FACTORS = {
+    "liquidity": (liquidity_factors, "kospi"),
+}
+
+
+def build_factor(name, source):
+    func, _ = MONTHLY_FACTORS[name]
+    return {name: func(source)}
@@ -0,0 +1,260 @@
+import hashlib
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from statistics import NormalDist
+
+from data_pipeline import store
+
+# Batch forecasts of every column of the monthly panel, fitted offline and read by the tabs.
+#
+#   python -m data_pipeline.forecast build [--workers N] [--force]
+#       fits the series whose data changed since the last build in a process pool and saves
+#       their parameters (models.json) and forecast cones (cones.parquet) under data/forecasts/
+#   python -m data_pipeline.forecast status
+#       model, fit and freshness of every series
+#
+# Each series is modelled on its last MAX_OBS months (gaps inside the history interpolated):
+# the model in MODELS that best forecasts its latest HORIZON months out of sample is refitted
+# on all of them. A series is keyed by a hash of the values it is fitted on and of this module's
+# source, so a rebuild re-fits exactly the series whose data (or the modelling) changed.
+# load_forecasts() only reads: it returns the cones whose hash still matches the data, so
+# the dashboard never fits anything and never shows a forecast of data it no longer has.
+
+FORECAST_DIR = Path(__file__).resolve().parent.parent / "data" / "forecasts"
+
+HORIZON = 12          # months ahead
+LEVELS = (80, 95)     # prediction interval coverage, %
+MIN_OBS = 36         # the last HORIZON of them held out to choose the model
+MAX_OBS = 240
+ARIMA_ORDER = (1, 1, 1)
+
+STATS = ["mean", *[f"{side}_{level}" for level in LEVELS for side in ("lower", "upper")]]
+
+_CODE = hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+
+def _params(res):
+    return {k: float(v) for k, v in zip(res.model.param_names, res.params)}
+
+
+def _ets(y):
+    from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+    res = ETSModel(y, error="add", trend="add", damped_trend=True).fit(disp=False)
+    pred = res.get_prediction(start=len(y), end=len(y) + HORIZON - 1)
+    bands = {level: pred.summary_frame(alpha=1 - level / 100)[["pi_lower", "pi_upper"]].to_numpy() for level in LEVELS}
+    return _params(res), pred.predicted_mean.to_numpy(), bands
+
+
+def _arima(y):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    res = ARIMA(y, order=ARIMA_ORDER).fit()
+    pred = res.get_forecast(HORIZON)
+    bands = {level: pred.conf_int(alpha=1 - level / 100).to_numpy() for level in LEVELS}
+    return _params(res), pred.predicted_mean.to_numpy(), bands
+
+
+def _random_walk(y):
+    sigma = float(np.std(np.diff(y.to_numpy()), ddof=1))
+    spread = sigma * np.sqrt(np.arange(1, HORIZON + 1))
+    mean = np.full(HORIZON, float(y.iloc[-1]))
+    bands = {}
+    for level in LEVELS:
+        z = NormalDist().inv_cdf(0.5 + level / 200)
+        bands[level] = np.column_stack([mean - z * spread, mean + z * spread])
+    return {"sigma": sigma}, mean, bands
+
+
+# name -> f(y) -> (parameters, mean, {level: (HORIZON, 2) lower/upper}); the random walk is
+# the baseline a fitted model has to beat, and what a series no model can fit falls back to
+MODELS = {
+    "ets": _ets,
+    "arima": _arima,
+    "random_walk": _random_walk,
+}
+
+
+def prepared(s):
+    # The months a series is fitted on: from its first observation, gaps inside interpolated
+    s = s.dropna()
+    if s.empty:
+        return s
+    return s.asfreq("MS").interpolate(limit_area="inside").iloc[-MAX_OBS:]
+
+
+def target_series(monthly):
+    # "dataset/column" -> fitted months, for every column with enough varying history
+    series = {}
+    for name, df in monthly.items():
+        for column in df.columns:
+            y = prepared(pd.to_numeric(df[column], errors="coerce").astype(float))
+            if len(y) >= MIN_OBS and y.iloc[:-HORIZON].nunique() > 1:
+                series[f"{name}/{column}"] = y
+    return series
+
+
+def series_hash(y):
+    digest = hashlib.sha256(pd.util.hash_pandas_object(y, index=True).to_numpy().tobytes())
+    digest.update(_CODE)
+    return digest.hexdigest()[:16]
+
+
+def _finite(mean, bands):
+    return all(np.isfinite(b).all() for b in [mean, *bands.values()])
+
+
+def fit_series(y):
+    # Every model forecasts the last HORIZON months from the months before them; the one with
+    # the lowest mean absolute error (comparable across model families, unlike their AICs)
+    # is refitted on the whole series
+    import warnings
+
+    scores = {}
+    with warnings.catch_warnings():
+        # Convergence and start-parameter warnings: a poor fit shows in its holdout error
+        warnings.simplefilter("ignore")
+        for name, fit in MODELS.items():
+            try:
+                _, mean, bands = fit(y.iloc[:-HORIZON])
+            except (ValueError, np.linalg.LinAlgError):
+                continue
+            if _finite(mean, bands):
+                scores[name] = float(np.mean(np.abs(mean - y.iloc[-HORIZON:].to_numpy())))
+
+        for name in sorted(scores, key=scores.get):
+            try:
+                params, mean, bands = MODELS[name](y)
+            except (ValueError, np.linalg.LinAlgError):
+                continue
+            if _finite(mean, bands):
+                break
+        else:
+            name = "random_walk"
+            params, mean, bands = _random_walk(y)
+
+    dates = pd.date_range(y.index[-1] + pd.offsets.MonthBegin(1), periods=HORIZON, freq="MS")
+    cone = pd.DataFrame({"mean": mean}, index=dates)
+    for level, band in bands.items():
+        cone[f"lower_{level}"], cone[f"upper_{level}"] = band[:, 0], band[:, 1]
+    fit = {"model": name, "params": params, "holdout_mae": scores, "nobs": len(y), "last": f"{y.index[-1]:%Y-%m-%d}"}
+    return fit, cone[STATS]
+
+
+# --------------------------------------------
+# Persistence: models.json (key -> hash, model, parameters) and one long cones table
+def models_path(root=FORECAST_DIR):
+    return Path(root) / "models.json"
+
+
+def read_models(root=FORECAST_DIR):
+    path = models_path(root)
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def read_cones(root=FORECAST_DIR):
+    if not store.has_frame("cones", root):
+        return pd.DataFrame(columns=["series", *STATS], index=pd.DatetimeIndex([], name="date"))
+    return store.read_frame("cones", root=root)
+
+
+def _write_models(models, root):
+    path = models_path(root)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(models, indent=1), encoding="utf-8")
+    tmp.replace(path)
+
+
+def build_forecasts(monthly=None, workers=None, force=False, root=FORECAST_DIR):
+    if monthly is None:
+        from data_pipeline.data_cleaning import DATA
+        monthly = DATA["monthly"]
+
+    series = target_series(monthly)
+    hashes = {key: series_hash(y) for key, y in series.items()}
+    models = read_models(root)
+    stale = [key for key in series if force or models.get(key, {}).get("hash") != hashes[key]]
+
+    fitted = {}
+    if stale:
+        # Spawned workers: the caller may be a threaded server process, which must not fork
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            fitted = dict(zip(stale, pool.map(fit_series, [series[k] for k in stale], chunksize=4)))
+
+        fitted_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        cones = read_cones(root)
+        kept = cones[cones["series"].isin(set(series) - set(fitted))]
+        parts = [kept] if len(kept) else []
+        parts += [cone.assign(series=key)[["series", *STATS]] for key, (_, cone) in fitted.items()]
+        Path(root).mkdir(parents=True, exist_ok=True)
+        # Cones before models: a crash in between leaves old hashes, so the new cones stay unused
+        store.write_frame("cones", pd.concat(parts).rename_axis("date"), root=root)
+        models = {key: models[key] for key in series if key in models and key not in fitted}
+        for key, (fit, _) in fitted.items():
+            models[key] = {"hash": hashes[key], **fit, "fitted_at": fitted_at}
+        _write_models(dict(sorted(models.items())), root)
+
+    return {"series": len(series), "refit": stale, "models": models, "forecast": load_forecasts(monthly, root)}
+
+
+def load_forecasts(monthly, root=FORECAST_DIR):
+    # dataset -> frame of future months with (column, stat) columns, for the series whose
+    # saved fit is of their current data; nothing is fitted here
+    models = read_models(root)
+    if not models:
+        return {}
+    current = {key for key, y in target_series(monthly).items() if models.get(key, {}).get("hash") == series_hash(y)}
+    cones = read_cones(root)
+    columns = {}
+    for key, cone in cones[cones["series"].isin(current)].groupby("series", sort=False):
+        name, column = key.split("/", 1)
+        columns.setdefault(name, {})[column] = cone[STATS].sort_index()
+    return {name: pd.concat(cols, axis=1, names=["column", "stat"]) for name, cols in columns.items()}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Batch forecasts of the monthly series")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="fit the series whose data changed")
+    p_build.add_argument("--workers", type=int, default=None, help="processes (default: one per CPU)")
+    p_build.add_argument("--force", action="store_true", help="re-fit every series")
+    sub.add_parser("status", help="saved fit of every series")
+    args = parser.parse_args()
+
+    from data_pipeline.data_cleaning import DATA
+
+    if args.command == "build":
+        t0 = time.perf_counter()
+        result = build_forecasts(DATA["monthly"], workers=args.workers, force=args.force)
+        counts = pd.Series([result["models"][k]["model"] for k in result["refit"]], dtype=object).value_counts()
+        print(f"re-fitted {len(result['refit'])} of {result['series']} series in {time.perf_counter() - t0:.1f}s")
+        for model, n in counts.items():
+            print(f"  {model:<12} {n}")
+        return
+
+    models = read_models()
+    rows = []
+    for key, y in target_series(DATA["monthly"]).items():
+        saved = models.get(key, {})
+        rows.append({
+            "series": key, "model": saved.get("model"),
+            "mae": saved.get("holdout_mae", {}).get(saved.get("model")), "last": saved.get("last"),
+            "fitted_at": saved.get("fitted_at"), "current": saved.get("hash") == series_hash(y),
+        })
+    status = pd.DataFrame(rows)
+    with pd.option_context("display.max_rows", None, "display.width", 200, "display.max_colwidth", 60):
+        print(status.to_string(index=False))
+    print(f"{int(status['current'].sum())} of {len(status)} series have a current forecast")
+
+
+if __name__ == "__main__":
+    main()
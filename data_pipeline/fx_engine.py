@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Multi-currency analytics over the raw daily FX frame.
+# Every measure is computed for all currencies at once on (days x currencies) matrices, so
+# adding a currency is one CURRENCIES entry, not more code. Holiday rows carry 0.00 instead
+# of a missing value; those are treated as missing.
+#
+#   rates      KRW per 1 unit of each currency (JPY is quoted per 100 yen)
+#   crosses    implied BASE/XXX = (KRW per BASE) / (KRW per XXX)
+#   vol_*      annualized realized volatility (%) from daily OHLC ranges, rolling mean of the
+#              daily variance estimates:
+#                Parkinson     ln(H/L)^2 / (4 ln 2)
+#                Garman-Klass  0.5 ln(H/L)^2 - (2 ln 2 - 1) ln(C/O)^2
+#              NaN for currencies quoted without OHLC
+#   drawdown   KRW drawdown against each currency (%): its value in that currency vs the
+#              trailing-window high, i.e. min(rate) / rate - 1
+
+CURRENCIES = {
+    "USD": {
+        "close": "Won per United States Dollar (Close 15:30)",
+        "open": "Won per United States Dollar (Open)",
+        "high": "Won per United States Dollar (High)",
+        "low": "Won per United States Dollar (Low)",
+        "per": 1,
+    },
+    "CNY": {
+        "close": "Won per China Yuan Renminbi (Close)",
+        "open": "Won per China Yuan Renminbi (Open)",
+        "high": "Won per China Yuan Renminbi (Higt)",
+        "low": "Won per China Yuan Renminbi (Low)",
+        "per": 1,
+    },
+    "JPY": {
+        "close": "Won per Japan Yen(quoted by KEB Hana Bank)",
+        "per": 100,
+    },
+}
+
+BASE = "USD"
+VOL_WINDOW = 21          # trading days, about one month
+DRAWDOWN_WINDOW = 252    # trading days, about one year
+TRADING_DAYS = 252
+
+
+def price_matrix(fx, field, currencies=CURRENCIES):
+    # (days x currencies) KRW per unit; NaN where the field is not quoted or not a fixing
+    position = {col: i for i, col in enumerate(fx.columns)}
+    idx = np.array([position.get(spec.get(field), -1) for spec in currencies.values()])
+    per = np.array([spec["per"] for spec in currencies.values()], dtype="float64")
+
+    out = fx.to_numpy(dtype="float64")[:, np.maximum(idx, 0)]
+    out[:, idx < 0] = np.nan
+    out[~(out > 0)] = np.nan
+    out /= per
+    return out
+
+
+def rolling_mean(x, window, min_periods=None):
+    # NaN-aware trailing mean along axis 0 from cumulative sums: O(days x currencies)
+    min_periods = window if min_periods is None else min_periods
+    valid = np.isfinite(x)
+    sums = np.vstack([np.zeros((1, x.shape[1])), np.cumsum(np.where(valid, x, 0.0), axis=0)])
+    counts = np.vstack([np.zeros((1, x.shape[1])), np.cumsum(valid, axis=0)])
+    lagged = np.maximum(np.arange(1, len(x) + 1) - window, 0)
+    total = sums[1:] - sums[lagged]
+    n = counts[1:] - counts[lagged]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(n >= min_periods, total / n, np.nan)
+
+
+def rolling_min(x, window):
+    # Trailing min along axis 0 ignoring NaN (np.fmin): partial windows at the start
+    padded = np.vstack([np.full((window - 1, x.shape[1]), np.nan), x])
+    return np.fmin.reduce(sliding_window_view(padded, window, axis=0), axis=-1)
+
+
+def realized_vol(daily_var, window=VOL_WINDOW):
+    # Garman-Klass daily terms can be negative: floor the window mean at zero
+    variance = np.maximum(rolling_mean(daily_var, window, min_periods=window // 2), 0)
+    return np.sqrt(TRADING_DAYS * variance) * 100
+
+
+def fx_analytics(fx, currencies=CURRENCIES, base=BASE):
+    # -> {name: DataFrame indexed like fx}, all keyed "fx_*" for the derived layer
+    names = list(currencies)
+    close, open_ = price_matrix(fx, "close", currencies), price_matrix(fx, "open", currencies)
+    high, low = price_matrix(fx, "high", currencies), price_matrix(fx, "low", currencies)
+
+    log_hl = np.log(high / low)
+    log_co = np.log(close / open_)
+    parkinson = log_hl ** 2 / (4 * np.log(2))
+    garman_klass = 0.5 * log_hl ** 2 - (2 * np.log(2) - 1) * log_co ** 2
+
+    quoted = [i for i, name in enumerate(names) if name != base]
+    crosses = close[:, [names.index(base)]] / close[:, quoted]
+
+    def frame(values, columns):
+        return pd.DataFrame(values, index=fx.index, columns=pd.Index(columns, name="currency"))
+
+    return {
+        "fx_rates": frame(close, names),
+        "fx_crosses": frame(crosses, [f"{base}/{names[i]}" for i in quoted]),
+        "fx_vol_parkinson": frame(realized_vol(parkinson), names),
+        "fx_vol_garman_klass": frame(realized_vol(garman_klass), names),
+        "fx_drawdown": frame((rolling_min(close, DRAWDOWN_WINDOW) / close - 1) * 100, names),
+    }
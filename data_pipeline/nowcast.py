@@ -0,0 +1,252 @@
+import hashlib
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+
+# Mixed-frequency nowcasting of the monthly panel from daily FX.
+#
+# Each target is modelled as a MIDAS-style regression of its monthly change on the
+# change in exponentially weighted (recent days count more) month-to-date FX means:
+#   dy_m = b0 + sum_k b_k * log(fx_k,m / fx_k,m-1)
+# Coefficients are kept by recursive least squares, so a new daily row costs O(1)
+# and a newly published monthly value costs one rank-one update — nothing is refit.
+#
+# The pipeline's "nowcaster" stage resumes the nowcaster saved by its last run (STATE_PATH:
+# RLS state, closed month means, the partial sums of the open month) and feeds it only the
+# daily rows and monthly values published since. History that was revised, or a change to
+# this module, replays everything from scratch.
+
+HF_COLUMNS = [
+    "Won per United States Dollar (Close 15:30)",
+    "Won per China Yuan Renminbi (Close)",
+    "Won per Japan Yen(quoted by KEB Hana Bank)",
+]
+
+# dataset -> column, transform of the regression target, rounding step of the estimate
+NOWCAST_TARGETS = {
+    "bok_rate": {"column": "base_rate", "transform": "diff", "step": 0.25},
+    "cpi": {"column": "Total item", "transform": "diff", "step": 0.1},
+    "kospi": {"column": "KOSPI_Index(End Of)", "transform": "logdiff", "step": None},
+}
+
+DAY_DECAY = 0.9        # MIDAS weight ratio between consecutive days
+FORGETTING = 0.98      # RLS forgetting factor, lets the FX pass-through drift over time
+
+STATE_PATH = Path(__file__).resolve().parent.parent / "data" / "pipeline_cache" / "nowcaster_state.pkl"
+
+_CODE = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+class MidasNowcaster:
+
+    def __init__(self, hf_columns=HF_COLUMNS, targets=NOWCAST_TARGETS):
+        self.hf_columns = list(hf_columns)
+        self.month_means = {}
+        self.current_month = None
+        self.last_daily = None
+        self.fx_digest = None
+        self.code = _CODE
+        self._sum = np.zeros(len(self.hf_columns))
+        self._weight = np.zeros(len(self.hf_columns))
+
+        k = len(self.hf_columns) + 1
+        self.targets = {
+            name: {
+                **spec,
+                "observed": {},
+                "fitted_through": None,
+                "theta": np.zeros(k),
+                "P": np.eye(k) * 1e3,
+            }
+            for name, spec in targets.items()
+        }
+
+    # --------------------------------------------
+    # Incremental updates
+    def add_daily(self, date, values):
+        if self.last_daily is not None and date <= self.last_daily:
+            raise ValueError(f"daily row {date:%Y-%m-%d} is not after the last one, {self.last_daily:%Y-%m-%d}")
+        self.last_daily = date
+        month = pd.Timestamp(date.year, date.month, 1)
+        if self.current_month is not None and month != self.current_month:
+            self._close_month()
+        self.current_month = month
+
+        values = np.asarray(values, dtype=float)
+        valid = np.isfinite(values) & (values > 0)
+
+        # Exponential MIDAS weights: decay what we have, add today's row with weight 1
+        self._sum *= DAY_DECAY
+        self._weight *= DAY_DECAY
+        self._sum[valid] += values[valid]
+        self._weight[valid] += 1.0
+
+    def add_monthly(self, name, date, value):
+        if pd.isna(value):
+            return
+        month = pd.Timestamp(date.year, date.month, 1)
+        self.targets[name]["observed"][month] = float(value)
+        self._absorb(name)
+
+    def _close_month(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.month_means[self.current_month] = self._sum / self._weight
+        self._sum = np.zeros(len(self.hf_columns))
+        self._weight = np.zeros(len(self.hf_columns))
+        for name in self.targets:
+            self._absorb(name)
+
+    # --------------------------------------------
+    # Recursive least squares
+    def _features(self, month, means=None):
+        prev = self.month_means.get(month - pd.DateOffset(months=1))
+        means = self.month_means.get(month) if means is None else means
+        if prev is None or means is None:
+            return None
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = np.concatenate([[1.0], np.log(means / prev)])
+        return np.nan_to_num(x, nan=0.0, posinf=0.0, neginf=0.0)
+
+    def _target_change(self, spec, month):
+        prev = spec["observed"].get(month - pd.DateOffset(months=1))
+        curr = spec["observed"].get(month)
+        if prev is None or curr is None:
+            return None
+        return np.log(curr / prev) if spec["transform"] == "logdiff" else curr - prev
+
+    def _absorb(self, name):
+        spec = self.targets[name]
+        last_closed = max(self.month_means, default=None)
+        for month in sorted(spec["observed"]):
+            if spec["fitted_through"] is not None and month <= spec["fitted_through"]:
+                continue
+            if month not in self.month_means:
+                if last_closed is None or month > last_closed:
+                    break  # FX month still open: fitted once it closes
+                continue   # before the FX history (or a month without FX rows)
+            x = self._features(month)
+            y = self._target_change(spec, month)
+            if x is not None and y is not None:
+                P, theta = spec["P"], spec["theta"]
+                Px = P @ x
+                gain = Px / (FORGETTING + x @ Px)
+                spec["theta"] = theta + gain * (y - x @ theta)
+                spec["P"] = (P - np.outer(gain, Px)) / FORGETTING
+            spec["fitted_through"] = month
+
+    # --------------------------------------------
+    # Provisional estimates
+    def nowcast(self, name):
+        spec = self.targets[name]
+        if not spec["observed"] or self.current_month is None:
+            return pd.DataFrame(columns=[spec["column"], "provisional"])
+
+        last_month = max(spec["observed"])
+        value = spec["observed"][last_month]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            partial = self._sum / self._weight
+
+        rows = {}
+        month = last_month + pd.DateOffset(months=1)
+        while month <= self.current_month:
+            means = partial if month == self.current_month else None
+            x = self._features(month, means)
+            if x is None:
+                break
+            change = x @ spec["theta"]
+            value = value * np.exp(change) if spec["transform"] == "logdiff" else value + change
+            rows[month] = value
+            month += pd.DateOffset(months=1)
+
+        out = pd.DataFrame({spec["column"]: pd.Series(rows, dtype=float)})
+        if spec["step"]:
+            out[spec["column"]] = (out[spec["column"]] / spec["step"]).round() * spec["step"]
+        out["provisional"] = True
+        out.index.name = "date"
+        return out
+
+
+    # --------------------------------------------
+    # Feeding from the cleaned data
+    def _inputs(self, DATA):
+        fx = DATA["daily"]["fx"][self.hf_columns].sort_index()
+        monthly = {name: DATA["monthly"][name][spec["column"]].dropna().sort_index() for name, spec in self.targets.items()}
+        return fx, monthly
+
+    def extends(self, DATA):
+        # True when DATA only appends to what this nowcaster has seen (same code and targets,
+        # FX rows up to last_daily and every observed monthly value unchanged)
+        if self.code != _CODE or self.last_daily is None:
+            return False
+        fx, monthly = self._inputs(DATA)
+        if _digest(fx.loc[:self.last_daily]) != self.fx_digest:
+            return False
+        for name, spec in self.targets.items():
+            seen = monthly[name].loc[:max(spec["observed"])] if spec["observed"] else monthly[name].iloc[:0]
+            if {pd.Timestamp(d.year, d.month, 1): float(v) for d, v in seen.items()} != spec["observed"]:
+                return False
+        return True
+
+    def update(self, DATA):
+        # Feeds the daily rows after last_daily, then the monthly values after each target's last
+        fx, monthly = self._inputs(DATA)
+        new = fx if self.last_daily is None else fx.loc[fx.index > self.last_daily]
+        for date, row in zip(new.index, new.to_numpy()):
+            self.add_daily(date, row)
+        self.fx_digest = _digest(fx)
+
+        for name, spec in self.targets.items():
+            series = monthly[name]
+            if spec["observed"]:
+                series = series.loc[series.index >= max(spec["observed"]) + pd.DateOffset(months=1)]
+            for date, value in series.items():
+                self.add_monthly(name, date, value)
+        return self
+
+
+def _digest(frame):
+    return hashlib.sha256(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes()).hexdigest()
+
+
+def build_nowcaster(DATA):
+    # Full replay of the whole history
+    return MidasNowcaster().update(DATA)
+
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return state if isinstance(state, MidasNowcaster) else None
+
+
+def save_state(nowcaster, path=STATE_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(nowcaster, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(path)
+
+
+def update_nowcaster(DATA, path=STATE_PATH):
+    # Resumes the saved nowcaster when DATA only appends to what it has seen, else replays
+    nowcaster = load_state(path)
+    if nowcaster is None or not nowcaster.extends(DATA):
+        nowcaster = MidasNowcaster()
+    nowcaster.update(DATA)
+    try:
+        save_state(nowcaster, path)
+    except OSError:
+        pass  # read-only checkout: the next data change replays the history
+    return nowcaster
+
+
+def nowcast_panel(nowcaster):
+    return {name: nowcaster.nowcast(name) for name in nowcaster.targets}
@@ -0,0 +1,155 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Data-quality validation of each cleaned dataset (native frequency, final units), run as a
+# pipeline stage per dataset so only datasets whose source changed are validated again.
+# Every check is columnar over the dataset's (dates x columns) matrix:
+#
+#   gap           periods missing between the first and last date (business days for daily data)
+#   duplicate     repeated dates; the last row of each date is kept
+#   sentinel_zero 0 in a series that is otherwise positive and far from 0 (ECOS fills holidays
+#                 and unpublished months with 0.00 instead of leaving them empty)
+#   outlier       change more than OUTLIER_Z robust z-scores (median / MAD) from the column's
+#                 typical change, both period-on-period and against the same period a year
+#                 earlier (so seasonal steps, e.g. year-to-date fiscal totals resetting in
+#                 January, are not flagged)
+#   missing       values that arrived empty
+#
+# validate() returns the report rows and a cell mask; MASKED checks are dropped from the
+# cleaned frames (apply_mask), the others are reported only (an outlier may be a real move).
+
+OUTLIER_Z = 8.0
+SENTINEL_RATIO = 0.05    # smallest positive value / median above this: a 0 is not a level
+MASKED = ("duplicate", "sentinel_zero")
+MAD_SCALE = 1.4826       # MAD -> standard deviation for normal data
+SEASONAL_LAG = {"M": 12, "Q": 4}
+
+REPORT_COLUMNS = ["dataset", "check", "column", "count", "first", "last"]
+
+
+def missing_periods(index, freq):
+    # Dates absent between consecutive observations of a sorted index, as a DatetimeIndex
+    if len(index) < 2:
+        return pd.DatetimeIndex([])
+    if freq == "D":
+        days = index.values.astype("datetime64[D]")
+        steps = np.busday_count(days[:-1], days[1:])
+        if not (steps > 1).any():
+            return pd.DatetimeIndex([])
+        expected = pd.bdate_range(index[0], index[-1])
+    else:
+        ordinals = index.to_period(freq).asi8
+        if not (np.diff(ordinals) > 1).any():
+            return pd.DatetimeIndex([])
+        expected = pd.period_range(index[0], index[-1], freq=freq).to_timestamp()
+    return expected.difference(index.normalize())
+
+
+def sentinel_zeros(values):
+    # values: (rows x columns) float matrix -> bool mask of 0 entries that stand for "no data"
+    with warnings.catch_warnings(), np.errstate(invalid="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN / all-zero columns
+        positive = np.where(values > 0, values, np.nan)
+        ratio = np.nanmin(positive, axis=0) / np.nanmedian(positive, axis=0)
+        levels = ~(values < 0).any(axis=0) & (ratio > SENTINEL_RATIO)
+    return (values == 0) & levels
+
+
+def robust_outliers(values, lag=1, z=OUTLIER_Z):
+    # Flags the later observation of each `lag`-period change more than z robust sigmas from
+    # the median change
+    flags = np.zeros(values.shape, dtype=bool)
+    if len(values) < lag + 2:
+        return flags
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        change = values[lag:] - values[:-lag]
+        median = np.nanmedian(change, axis=0)
+        mad = np.nanmedian(np.abs(change - median), axis=0) * MAD_SCALE
+        flags[lag:] = (np.abs(change - median) / mad > z) & (mad > 0)
+    return flags
+
+
+def _rows(name, check, columns, index, flags):
+    # One report row per column with at least one flag
+    rows = []
+    counts = flags.sum(axis=0)
+    for j in np.flatnonzero(counts):
+        dates = index[flags[:, j]]
+        rows.append((name, check, columns[j], int(counts[j]), dates[0], dates[-1]))
+    return rows
+
+
+def validate(name, freq, df):
+    # -> {"report": DataFrame[REPORT_COLUMNS], "mask": bool DataFrame like df (True = drop)}
+    values = df.to_numpy(dtype="float64")
+    columns, index = list(df.columns), df.index
+
+    duplicate = index.duplicated(keep="last")
+    unique = ~duplicate
+    checks = {"duplicate": np.repeat(duplicate[:, None], values.shape[1], axis=1)}
+    checks["sentinel_zero"] = np.zeros(values.shape, dtype=bool)
+    checks["sentinel_zero"][unique] = sentinel_zeros(values[unique])
+    checks["missing"] = np.isnan(values)
+
+    # Changes are measured on the values that survive the mask
+    clean = np.where(checks["sentinel_zero"], np.nan, values)[unique]
+    checks["outlier"] = np.zeros(values.shape, dtype=bool)
+    outlier = robust_outliers(clean)
+    if freq in SEASONAL_LAG:
+        outlier &= robust_outliers(clean, SEASONAL_LAG[freq])
+    checks["outlier"][unique] = outlier
+
+    rows = []
+    gaps = missing_periods(index[unique], freq)
+    if len(gaps):
+        rows.append((name, "gap", None, len(gaps), gaps[0], gaps[-1]))
+    if duplicate.any():
+        dates = index[duplicate]
+        rows.append((name, "duplicate", None, int(duplicate.sum()), dates[0], dates[-1]))
+    for check in ("sentinel_zero", "outlier", "missing"):
+        rows += _rows(name, check, columns, index, checks[check])
+
+    mask = np.logical_or.reduce([checks[c] for c in MASKED])
+    return {
+        "report": pd.DataFrame(rows, columns=REPORT_COLUMNS),
+        "mask": pd.DataFrame(mask, index=index, columns=df.columns),
+    }
+
+
+def apply_mask(df, mask):
+    # Masked cells -> NaN; repeated dates keep their last row
+    return df.mask(mask.to_numpy())[~df.index.duplicated(keep="last")]
+
+
+def quality_report(names, *results):
+    reports = [r["report"] for r in results if len(r["report"])]
+    if not reports:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    return pd.concat(reports, ignore_index=True)
+
+
+def main():
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Data-quality report of the cleaned datasets")
+    parser.add_argument("--dataset", action="append", default=None, help="only these datasets (repeatable)")
+    parser.add_argument("--fail-on", action="append", default=[], help="exit non-zero if a check flags anything")
+    args = parser.parse_args()
+
+    from data_pipeline.data_cleaning import QUALITY
+
+    report = QUALITY if args.dataset is None else QUALITY[QUALITY["dataset"].isin(args.dataset)]
+    with pd.option_context("display.max_rows", None, "display.width", 200, "display.max_colwidth", 60):
+        print(report.to_string(index=False) if len(report) else "no issues")
+
+    failed = sorted(set(args.fail_on) & set(report["check"]))
+    if failed:
+        sys.exit(f"data-quality check failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
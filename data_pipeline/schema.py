@@ -0,0 +1,203 @@
+import csv
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# --------------------------------------------
+# Schema registry for every source CSV in data/
+#   columns     : expected header in file order (surrounding whitespace and BOM ignored)
+#   date_format : explicit format of the "date" column ("%q" = quarter number)
+#   renames     : source header -> column name used by the dashboard
+#   dtypes      : non-float64 columns ("date" is always parsed with date_format)
+#   na_values   : tokens ECOS uses for missing observations
+NA_VALUES = ["", "-", ".", ".."]
+
+DATE_FORMATS = {"D": "%Y/%m/%d", "M": "%Y/%m", "Q": "%Y/Q%q", "Y": "%Y"}
+
+SCHEMAS = {
+    "BOK Base rate MoM.csv": {
+        "columns": ["date", "base_rate"],
+        "date_format": "%Y/%m",
+    },
+    "Central Governmnet Fiscal Balance MoM.csv": {
+        "columns": [
+            "date", "Domestic", "Foreign", "Subsidies", "Transfers Abroad", "Transfers To Households",
+            "Transfers To Local Governments", "Transfers To Nonprofit Institutions",
+            "Acquisition of Capital Assets", "Capital Transfers", "Expen. on Goods and Services",
+            "Interest Payments", "NFPE Special Acct＇s Capital Exp.", "NFPE Special Acct＇s Current Exp.",
+            "Purchases of Land & Intangible Assets", "Purchases of Stocks",
+            "Subsidies & Other Current Transfers", "Capital Expenditure", "Current Expenditure",
+            "Income. Profits & Capital Gains", "Tax on Goods & Services(incl. V.A.T)", "Taxes on Property",
+            "Non-tax Revenue", "Social Security Contributions", "Total Expenditure", "Total Tax Revenues",
+            "Balance", "Capital Revenue", "Current Revenues", "Net Lending(incl. Net Acquisition)",
+            "Total Exp. & Net Lending", "Total Revenues",
+        ],
+        "date_format": "%Y/%m",
+    },
+    "Consumer Price indices MoM.csv": {
+        "columns": [
+            "date", "Alcoholic beverages and tobacco", "Clothing and footwear", "Communication", "Education",
+            "Food and non-alcoholic beverages",
+            "Furnishings, household equipment and routine household maintenance", "Health",
+            "Housing, water, electricity and other fuels", "Miscellaneous goods and services",
+            "Recreation and culture", "Restaurants and hotels", "Transport", "Total item",
+        ],
+        "date_format": "%Y/%m",
+    },
+    "Consumer Tendency Survey MoM.csv": {
+        "columns": [
+            "date", "Domestic Economic Situation", "Expectations of Domestic Economic Situation",
+            "Expectations of Employment Situation", "Expectations of Household Debt",
+            "Expectations of Household Saving", "Expectations of Housing Prices",
+            "Expectations of Interest Rates", "Expectations of Living Standard of Household",
+            "Expectations of Wages", "Living Standard of Household", "Present Debt of Household",
+            "Present Saving of Household", "Composite Consumer Sentiment Index",
+        ],
+        "date_format": "%Y/%m",
+    },
+    "Debt QoQ.csv": {
+        "columns": [
+            "date", "Financial corporations", "General government", "Households and NPISHs",
+            "Non-financial corporations", "Rest of the world",
+        ],
+        "date_format": "%Y/Q%q",
+    },
+    "Exchange Rate of Won against USD, China, Japan Daily.csv": {
+        "columns": [
+            "date", "Won per China Yuan Renminbi (Close)", "Won per China Yuan Renminbi (Higt)",
+            "Won per China Yuan Renminbi (Low)", "Won per China Yuan Renminbi (Open)",
+            "Won per Japan Yen(quoted by KEB Hana Bank)", "Won per United States Dollar (Close 02:00)",
+            "Won per United States Dollar (Close 15:30)", "Won per United States Dollar (High)",
+            "Won per United States Dollar (Low)", "Won per United States Dollar (Open)",
+        ],
+        "date_format": "%Y/%m/%d",
+    },
+    "Final Consumption Expenditure of NPISH by Purpose QoQ.csv": {
+        "columns": [
+            "date", "Education",
+            "Final consumption expenditure of non-profit institutions serving households",
+            "Health", "Others", "Recreation and culture", "Social protection",
+        ],
+        "date_format": "%Y/Q%q",
+    },
+    "GDP n Debt YoY.csv": {
+        "columns": ["date", "Gross External Debt", "Korea, Republic Of"],
+        "date_format": "%Y",
+        "renames": {"Korea, Republic Of": "GDP"},
+    },
+    "House Debt Ratio QoQ.csv": {
+        "columns": [
+            "date",
+            "Ratio of Loans(including government loans) to financial liabilities(Households and NPISHs)",
+            "Household and NPISHs Credit to GDP ratio(Core debt)", "Households and NPISHs",
+        ],
+        "date_format": "%Y/Q%q",
+    },
+    "House Price Index(KB) MoM.csv": {
+        "columns": [
+            "date", "Apartment(Seoul)", "All Groups(Seoul)", "Apartment", "Detached Dwelling",
+            "Row House", "All Groups",
+        ],
+        "date_format": "%Y/%m",
+    },
+    "Trade of KTB Bond MoM.csv": {
+        "columns": [
+            "date", "Trading Value KRX KTB", "Trading Value Total", "Trading Volume KRX KTB",
+            "Trading Volume Total",
+        ],
+        "date_format": "%Y/%m",
+    },
+    "Transactions in KOSPI KOSDAQ Index MoM.csv": {
+        "columns": [
+            "date", "KOSDAQ_Index(Avg.)", "KOSDAQ_Index(End of)", "KOSDAQ_Market Capitalization",
+            "KOSDAQ_No.of Listed Companies", "KOSDAQ_No.of Listed Issues", "KOSDAQ_No.of Listed Shares",
+            "KOSDAQ_Trading Value", "KOSDAQ_Trading Value (Daily Arg.)", "KOSDAQ_Trading Volume",
+            "KOSDAQ_Trading Volume (Daily Arg.)", "KOSDAQ_Turn-over ratio over listed stock",
+            "KOSPI_Dividend yield ratio", "KOSPI_Index(Avg.)", "KOSPI_Index(End Of)",
+            "KOSPI_Market Capitalization", "KOSPI_No. of Listed Shares", "KOSPI_No.of Listed Companies",
+            "KOSPI_No.of Listed Issues", "KOSPI_Price Earnings Ratio", "KOSPI_Trading Value",
+            "KOSPI_Trading Value (Daily Arg.)", "KOSPI_Trading Volume", "KOSPI_Trading Volume (Daily Arg.)",
+            "KOSPI_Turn-over ratio over listed stock",
+        ],
+        "date_format": "%Y/%m",
+    },
+    "nps market perfomance index MoM.csv": {
+        "columns": ["date", "KOSPI_Index(End Of)", "KTB Trading Value", "Yields of Treasury Bonds(10-year)"],
+        "date_format": "%Y/%m",
+    },
+    "nps_asset_allocation YoY.csv": {
+        "columns": ["asset_class", "date", "aum_billion_krw", "weight_percent"],
+        "date_format": "%Y",
+        "dtypes": {"asset_class": "string"},
+    },
+}
+
+
+# --------------------------------------------
+# Schema drift check
+def read_header(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [col.strip() for col in next(csv.reader(f))]
+
+
+def check_header(file, header, expected):
+    if header == expected:
+        return
+    missing = [col for col in expected if col not in header]
+    unexpected = [col for col in header if col not in expected]
+    raise ValueError(
+        f"Schema drift in '{file}': missing {missing}, unexpected {unexpected}"
+        + ("" if missing or unexpected else " (column order changed)")
+    )
+
+
+# --------------------------------------------
+# Typed readers
+def parse_dates(dates, date_format, name):
+    dates = pd.Series(dates).astype(str).str.strip()
+    try:
+        if "%q" in date_format:
+            return pd.PeriodIndex(dates.str.replace("/", "", regex=False), freq="Q").to_timestamp()
+        return pd.DatetimeIndex(pd.to_datetime(dates, format=date_format))
+    except ValueError as e:
+        raise ValueError(f"{name}: dates do not match declared format '{date_format}' ({e})") from None
+
+
+def read_source(path):
+    file = path.name
+    schema = SCHEMAS[file]
+
+    # Fail fast on a changed header before any value is parsed
+    check_header(file, read_header(path), schema["columns"])
+
+    renames = schema.get("renames", {})
+    dtypes = schema.get("dtypes", {})
+    names = [renames.get(col, col) for col in schema["columns"]]
+
+    # Everything arrives as strings: values are quoted with thousands separators
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(column_names=names, skip_rows=1),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+
+    columns = {}
+    for name in names:
+        col = table[name]
+        if name != "date" and dtypes.get(name, "float64") == "float64":
+            col = pc.replace_substring(pc.utf8_trim_whitespace(col), ",", "")
+            try:
+                col = pc.cast(col, pa.float64())
+            except pa.ArrowInvalid as e:
+                raise ValueError(f"{file}: non-numeric value in column '{name}' ({e})") from None
+        columns[name] = col
+
+    df = pa.table(columns).to_pandas()
+    df["date"] = parse_dates(df["date"], schema["date_format"], file)
+    return df
@@ -0,0 +1,123 @@
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from pathlib import Path
+
+# Columnar store: one Parquet file per dataset, "date" column sorted ascending,
+# one row group per year so date filters skip whole row groups.
+STORE_DIR = Path(__file__).resolve().parent.parent / "data" / "store"
+
+# The cleaned panel (DATA) is published under cleaned/<bucket>/<name>, with a catalog
+CLEANED = "cleaned"
+
+
+def frame_path(name, root=STORE_DIR):
+    return Path(root) / f"{name}.parquet"
+
+
+def write_frame(name, df, root=STORE_DIR):
+    path = frame_path(name, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    df = df.sort_index()
+    table = pa.Table.from_pandas(df.rename_axis("date").reset_index(), preserve_index=False)
+
+    # Write via a temporary file so readers never see a half-written store
+    tmp = path.with_suffix(".tmp")
+    with pq.ParquetWriter(tmp, table.schema) as writer:
+        years = df.index.year.to_numpy()
+        for year in pd.unique(years):
+            mask = years == year
+            writer.write_table(table.filter(pa.array(mask)))
+    tmp.replace(path)
+    return path
+
+
+def read_frame(name, columns=None, start=None, end=None, root=STORE_DIR):
+    filters = []
+    if start is not None:
+        filters.append(("date", ">=", pd.Timestamp(start)))
+    if end is not None:
+        filters.append(("date", "<=", pd.Timestamp(end)))
+
+    table = pq.read_table(
+        frame_path(name, root),
+        columns=None if columns is None else ["date", *columns],
+        filters=filters or None,
+    )
+    return table.to_pandas().set_index("date")
+
+
+def has_frame(name, root=STORE_DIR):
+    return frame_path(name, root).exists()
+
+
+def scan_frame(name, columns=None, start=None, end=None, root=STORE_DIR, batch_size=65536):
+    # Streaming read: row groups whose date statistics miss [start, end] are never read,
+    # only the requested columns are decoded, and boundary groups are filtered per batch
+    file = pq.ParquetFile(frame_path(name, root))
+    date_idx = file.schema_arrow.get_field_index("date")
+    date_type = file.schema_arrow.field("date").type
+    lo = None if start is None else pa.scalar(pd.Timestamp(start), type=date_type)
+    hi = None if end is None else pa.scalar(pd.Timestamp(end), type=date_type)
+
+    row_groups = []
+    for i in range(file.metadata.num_row_groups):
+        stats = file.metadata.row_group(i).column(date_idx).statistics
+        if stats is not None and stats.has_min_max:
+            if lo is not None and stats.max < lo.as_py():
+                continue
+            if hi is not None and stats.min > hi.as_py():
+                continue
+        row_groups.append(i)
+
+    for batch in file.iter_batches(
+        batch_size=batch_size,
+        row_groups=row_groups,
+        columns=None if columns is None else ["date", *columns],
+    ):
+        mask = None
+        if lo is not None:
+            mask = pc.greater_equal(batch.column("date"), lo)
+        if hi is not None:
+            upper = pc.less_equal(batch.column("date"), hi)
+            mask = upper if mask is None else pc.and_(mask, upper)
+        if mask is not None:
+            batch = batch.filter(mask)
+        if batch.num_rows:
+            yield batch
+
+
+def frame_schema(name, root=STORE_DIR):
+    return pq.read_schema(frame_path(name, root))
+
+
+# --------------------------------------------
+# Cleaned panel
+def publish_data(DATA, buckets, version, root=STORE_DIR, units=None):
+    # buckets: frequency code -> DATA key, e.g. {"D": "daily", "M": "monthly", ...}
+    # units: optional callable (name, columns) -> {column: {"source", "target"}}
+    datasets = {}
+    for freq, bucket in buckets.items():
+        for name, df in DATA.get(bucket, {}).items():
+            write_frame(f"{CLEANED}/{bucket}/{name}", df, root)
+            entry = datasets.setdefault(name, {"buckets": {}})
+            entry["buckets"][freq] = bucket
+            entry["columns"] = sorted(set(entry.get("columns", [])) | set(map(str, df.columns)))
+            entry["start"] = min(entry.get("start", "9999"), df.index.min().strftime("%Y-%m-%d"))
+            entry["end"] = max(entry.get("end", "0000"), df.index.max().strftime("%Y-%m-%d"))
+            if units is not None:
+                entry["units"] = units(name, entry["columns"])
+
+    catalog = {"version": version, "datasets": datasets}
+    path = Path(root) / CLEANED / "catalog.json"
+    path.write_text(json.dumps(catalog, indent=1), encoding="utf-8")
+    return catalog
+
+
+def read_catalog(root=STORE_DIR):
+    return json.loads((Path(root) / CLEANED / "catalog.json").read_text(encoding="utf-8"))
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from data_pipeline.asof import asof_join
+
+# Unit registry: what each column arrives in and what the dashboard works in.
+#   columns : column names, or None for every column of the dataset
+#   source  : unit in the ECOS file
+#   target  : unit after normalization
+#   divisor : scale applied after any currency conversion
+#   fx      : currency converted to KRW with the daily rate in effect on each observation's date
+# Columns not listed keep their source unit.
+
+FX_DATASET = "fx"
+FX_COLUMNS = {"USD": "Won per United States Dollar (Close 15:30)"}
+FX_DIRECTION = "nearest"   # yearly observations are dated Jan 1, before the first fixing of the year
+
+UNITS = {
+    "debt_gdp": [
+        {"columns": ["Gross External Debt", "GDP"], "source": "USD mn", "target": "KRW tn", "divisor": 1e6, "fx": "USD"},
+    ],
+    "fiscal_balance": [
+        {"columns": None, "source": "KRW bn", "target": "KRW tn", "divisor": 1e3},
+    ],
+    "npish": [
+        {"columns": None, "source": "KRW bn", "target": "KRW tn", "divisor": 1e3},
+    ],
+    "ktb": [
+        {"columns": None, "source": "KRW", "target": "KRW tn", "divisor": 1e12},
+    ],
+    "nps_market": [
+        {"columns": ["KTB Trading Value"], "source": "KRW", "target": "KRW bn", "divisor": 1e9},
+    ],
+    # Market capitalization is left in KRW thousand, as delivered (factors.py scales its own copy)
+    "kospi": [
+        {"columns": ["KOSDAQ_Trading Value", "KOSDAQ_Trading Value (Daily Arg.)",
+                     "KOSPI_Trading Value", "KOSPI_Trading Value (Daily Arg.)"],
+         "source": "KRW thousand", "target": "KRW tn", "divisor": 1e9},
+    ],
+}
+
+
+def needs_fx(name):
+    return any(rule.get("fx") for rule in UNITS.get(name, []))
+
+
+def column_units(name, columns):
+    # column -> {"source", "target"} for the columns the registry covers
+    units = {}
+    for rule in UNITS.get(name, []):
+        for col in (columns if rule["columns"] is None else rule["columns"]):
+            units[col] = {"source": rule["source"], "target": rule["target"]}
+    return units
+
+
+def fx_rates(dates, fx, currency):
+    # KRW per unit of `currency` on each date, from the nearest daily fixing
+    # (holiday rows carry 0.00 instead of a missing value: not a fixing)
+    rates = fx[FX_COLUMNS[currency]]
+    return asof_join(dates, rates[rates > 0], FX_DIRECTION).to_numpy()
+
+
+def normalize_units(name, df, fx=None):
+    rules = UNITS.get(name)
+    if not rules:
+        return df
+
+    # One allocation for the result, then in-place vectorized scaling: a row vector of
+    # divisors over all columns and, for converted columns, a column vector of FX rates
+    values = df.to_numpy(dtype="float64", copy=True)
+    divisors = np.ones(values.shape[1])
+    position = {col: i for i, col in enumerate(df.columns)}
+
+    for rule in rules:
+        idx = list(range(values.shape[1])) if rule["columns"] is None else [position[c] for c in rule["columns"]]
+        if rule.get("fx"):
+            if fx is None:
+                raise ValueError(f"{name}: {rule['fx']} conversion needs the daily FX frame")
+            values[:, idx] *= fx_rates(df.index, fx, rule["fx"])[:, None]
+        divisors[idx] = rule["divisor"]
+
+    np.divide(values, divisors, out=values)
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
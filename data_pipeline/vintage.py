@@ -0,0 +1,196 @@
+import argparse
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pathlib import Path
+
+# Point-in-time (vintage) store for the cleaned datasets.
+#
+# Each dataset is kept as one long, bitemporal Parquet table of cells:
+#   date           valid time of the observation
+#   column         series name
+#   value          observed value
+#   recorded_from  when this value became known (vintage time)
+#   recorded_to    when it was superseded or withdrawn (OPEN while current)
+#
+# A new vintage only appends the cells that were added or revised and closes the rows they
+# replace, so unchanged history is stored once. "As of T" is a single predicate,
+# recorded_from <= T < recorded_to, pushed down into the Parquet read.
+#
+#   python -m data_pipeline.vintage record     # snapshot the current data/*.csv if it changed
+#   python -m data_pipeline.vintage list
+
+VINTAGE_DIR = Path(__file__).resolve().parent.parent / "data" / "vintages"
+OPEN = pd.Timestamp("2262-04-11")
+SCHEMA = pa.schema([
+    ("date", pa.timestamp("ns")),
+    ("column", pa.string()),
+    ("value", pa.float64()),
+    ("recorded_from", pa.timestamp("ns")),
+    ("recorded_to", pa.timestamp("ns")),
+])
+
+
+def cells_path(name, root=VINTAGE_DIR):
+    return Path(root) / f"{name}.parquet"
+
+
+def log_path(root=VINTAGE_DIR):
+    return Path(root) / "vintages.json"
+
+
+def list_vintages(root=VINTAGE_DIR):
+    path = log_path(root)
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else []
+
+
+def to_cells(df):
+    # Wide frame -> long (date, column, value); missing cells are simply absent
+    if not all(pd.api.types.is_numeric_dtype(t) for t in df.dtypes):
+        raise ValueError("vintage store holds numeric series only")
+    long = df.rename_axis(index="date", columns="column").stack(future_stack=True).dropna()
+    return long.astype("float64").rename("value").reset_index()
+
+
+def read_cells(name, root=VINTAGE_DIR, as_of=None):
+    path = cells_path(name, root)
+    if not path.exists():
+        return SCHEMA.empty_table().to_pandas()
+    filters = None
+    if as_of is not None:
+        as_of = pd.Timestamp(as_of)
+        filters = [("recorded_from", "<=", as_of), ("recorded_to", ">", as_of)]
+    return pq.read_table(path, filters=filters).to_pandas()
+
+
+def _write_cells(name, cells, root):
+    path = cells_path(name, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cells = cells.sort_values(["column", "date", "recorded_from"], kind="stable")
+    table = pa.Table.from_pandas(cells, schema=SCHEMA, preserve_index=False)
+    tmp = path.with_suffix(".tmp")
+    pq.write_table(table, tmp, compression="zstd")
+    tmp.replace(path)
+
+
+def diff_cells(current, new, recorded_at):
+    # current: open rows of the stored table; new: cells of the incoming vintage
+    key = ["date", "column"]
+    merged = current.merge(new, on=key, how="outer", suffixes=("_old", ""), indicator=True)
+
+    changed = (merged["_merge"] == "both") & (merged["value_old"] != merged["value"])
+    closed = changed | (merged["_merge"] == "left_only")
+    opened = changed | (merged["_merge"] == "right_only")
+
+    close_keys = merged.loc[closed, key]
+    added = merged.loc[opened, key + ["value"]].assign(recorded_from=recorded_at, recorded_to=OPEN)
+    return close_keys, added
+
+
+def record_vintage(frames, version, recorded_at=None, root=VINTAGE_DIR):
+    # Returns the new log entry, or None when this data version is already recorded
+    log = list_vintages(root)
+    if any(v["version"] == version for v in log):
+        return None
+
+    last = pd.Timestamp(log[-1]["recorded_at"]) if log else None
+    if recorded_at is None:
+        # Wall-clock time, kept monotonic: a clock set back must not reorder the vintages
+        recorded_at = pd.Timestamp.now().floor("s")
+        if last is not None and recorded_at <= last:
+            recorded_at = last + pd.Timedelta(seconds=1)
+    recorded_at = pd.Timestamp(recorded_at)
+    if last is not None and recorded_at <= last:
+        raise ValueError(f"vintage time {recorded_at} is not after the last vintage {log[-1]['recorded_at']}")
+
+    entry = {"recorded_at": recorded_at.isoformat(), "version": version, "datasets": {}}
+    for name, df in frames.items():
+        stored = read_cells(name, root)
+        is_open = stored["recorded_to"] == OPEN
+        close_keys, added = diff_cells(stored.loc[is_open, ["date", "column", "value"]], to_cells(df), recorded_at)
+
+        if len(close_keys) or len(added):
+            closing = stored.index[is_open][
+                pd.MultiIndex.from_frame(stored.loc[is_open, ["date", "column"]])
+                .isin(pd.MultiIndex.from_frame(close_keys))
+            ]
+            stored.loc[closing, "recorded_to"] = recorded_at
+            # Empty parts left out: concat would otherwise warn about their all-NA dtypes
+            parts = [part for part in (stored, added) if len(part)]
+            _write_cells(name, pd.concat(parts, ignore_index=True), root)
+
+        entry["datasets"][name] = {
+            "columns": list(map(str, df.columns)),
+            "columns_name": df.columns.name,
+            "superseded": int(len(close_keys)),
+            "written": int(len(added)),
+        }
+
+    log.append(entry)
+    log_path(root).parent.mkdir(parents=True, exist_ok=True)
+    log_path(root).write_text(json.dumps(log, indent=1), encoding="utf-8")
+    return entry
+
+
+# --------------------------------------------
+# As-of reconstruction
+def vintage_at(as_of, root=VINTAGE_DIR):
+    # Latest log entry recorded at or before as_of
+    as_of = pd.Timestamp(as_of)
+    known = [v for v in list_vintages(root) if pd.Timestamp(v["recorded_at"]) <= as_of]
+    if not known:
+        raise ValueError(f"no vintage recorded at or before {as_of}")
+    return known[-1]
+
+
+def frames_as_of(as_of, root=VINTAGE_DIR):
+    layout = vintage_at(as_of, root)["datasets"]
+    frames = {}
+    for name, spec in layout.items():
+        cells = read_cells(name, root, as_of)
+        df = cells.pivot(index="date", columns="column", values="value")
+        df = df.reindex(columns=spec["columns"]).rename_axis(index="date", columns=spec["columns_name"])
+        frames[name] = df.sort_index()
+    return frames
+
+
+def data_as_of(as_of, root=VINTAGE_DIR):
+    # The same buckets (nowcasts, derived layer) the pipeline builds, from the data known at as_of
+    from data_pipeline.data_cleaning import build_data, build_derived, clean_frames
+    from data_pipeline.nowcast import build_nowcaster, nowcast_panel
+
+    # Vintages recorded before the frames were masked still hold the flagged cells
+    frames = clean_frames(frames_as_of(as_of, root))
+    data = build_data(frames)
+    data["nowcast"] = nowcast_panel(build_nowcaster(data))
+    data["derived"] = build_derived(frames)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Point-in-time store of the cleaned datasets")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("record", help="record the current data/*.csv as a new vintage if it changed")
+    sub.add_parser("list", help="list recorded vintages")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        from data_pipeline.data_cleaning import DATA_VERSION, frames
+        entry = record_vintage(frames, DATA_VERSION)
+        if entry is None:
+            print(f"data version {DATA_VERSION} already recorded")
+        else:
+            written = sum(d["written"] for d in entry["datasets"].values())
+            print(f"recorded vintage {entry['recorded_at']} ({DATA_VERSION}): {written} cells written")
+    else:
+        for v in list_vintages():
+            written = sum(d["written"] for d in v["datasets"].values())
+            superseded = sum(d["superseded"] for d in v["datasets"].values())
+            print(f"{v['recorded_at']}  {v['version']}  {written:>7} written  {superseded:>6} superseded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+import argparse
+import io
+import json
+import os
+
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIServer, make_server
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from data_pipeline import store
+
+# Read-only query API over the cleaned panel in the columnar store.
+#
+#   python query_service.py publish           # write DATA to data/store/cleaned (+ catalog.json)
+#   python query_service.py serve --port 8050
+#
+#   GET /datasets                              catalog: buckets, columns, date span, data version
+#   GET /datasets/<name>?start=2020-01&end=2023-12&columns=base_rate&freq=Q&agg=last&format=csv
+#
+# Date range and columns are pushed down into the Parquet read (row groups / column chunks).
+# freq is served from the pipeline's own bucket when one exists, otherwise the nearest finer
+# bucket is aggregated with `agg`. Results stream as Arrow IPC (default) or CSV.
+
+FREQ_ORDER = ["D", "M", "Q", "Y"]
+RESAMPLE_RULES = {"M": "MS", "Q": "QS", "Y": "YS"}
+AGGREGATIONS = {"mean", "median", "first", "last", "sum", "min", "max"}
+FORMATS = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class QueryError(ValueError):
+
+    def __init__(self, message, status="400 Bad Request"):
+        super().__init__(message)
+        self.status = status
+
+
+# --------------------------------------------
+# Query planning
+def parse_query(environ):
+    params = parse_qs(environ.get("QUERY_STRING", ""), keep_blank_values=False)
+
+    def one(key, default=None):
+        values = params.get(key)
+        return values[-1] if values else default
+
+    query = {
+        "start": one("start"),
+        "end": one("end"),
+        # repeatable (?columns=a&columns=b): column names may contain commas
+        "columns": params.get("columns"),
+        "freq": one("freq"),
+        "agg": one("agg", "mean"),
+        "format": one("format", "arrow"),
+    }
+    for key in ("start", "end"):
+        if query[key] is not None:
+            try:
+                query[key] = pd.Timestamp(query[key])
+            except ValueError:
+                raise QueryError(f"invalid {key} date: {query[key]!r}")
+    if query["freq"] is not None and query["freq"] not in FREQ_ORDER:
+        raise QueryError(f"freq must be one of {FREQ_ORDER}")
+    if query["agg"] not in AGGREGATIONS:
+        raise QueryError(f"agg must be one of {sorted(AGGREGATIONS)}")
+    if query["format"] not in FORMATS:
+        raise QueryError(f"format must be one of {sorted(FORMATS)}")
+    return query
+
+
+def plan(entry, freq):
+    # -> (bucket to read, resample rule or None)
+    buckets = entry["buckets"]
+    if freq is None:
+        finest = min(buckets, key=FREQ_ORDER.index)
+        return buckets[finest], None
+    if freq in buckets:
+        return buckets[freq], None
+
+    finer = [f for f in buckets if FREQ_ORDER.index(f) < FREQ_ORDER.index(freq)]
+    if not finer:
+        raise QueryError(f"no data at or below frequency {freq}; available: {sorted(buckets, key=FREQ_ORDER.index)}")
+    return buckets[max(finer, key=FREQ_ORDER.index)], RESAMPLE_RULES[freq]
+
+
+def run_query(name, query, catalog, root=store.STORE_DIR):
+    entry = catalog["datasets"].get(name)
+    if entry is None:
+        raise QueryError(f"unknown dataset: {name}", "404 Not Found")
+
+    bucket, rule = plan(entry, query["freq"])
+    path = f"{store.CLEANED}/{bucket}/{name}"
+
+    schema, columns = store.frame_schema(path, root), query["columns"]
+    if columns is not None:
+        missing = [c for c in columns if c == "date" or c not in schema.names]
+        if missing:
+            raise QueryError(f"unknown columns for {name}: {missing}")
+        schema = pa.schema([schema.field(c) for c in ["date", *columns]])
+
+    start, end = query["start"], query["end"]
+    if rule is None:
+        return schema, store.scan_frame(path, columns, start, end, root)
+
+    # Aggregation needs whole periods: widen the pushed-down range to period boundaries,
+    # resample only what was read, then trim back to the requested window
+    period = rule[0]
+    read_start = None if start is None else start.to_period(period).start_time
+    read_end = None if end is None else end.to_period(period).end_time
+    batches = list(store.scan_frame(path, columns, read_start, read_end, root))
+    if not batches:
+        return schema, iter(())
+    df = pa.Table.from_batches(batches).to_pandas().set_index("date")
+    df = getattr(df.resample(rule), query["agg"])()
+    if start is not None:
+        df = df[df.index >= read_start]
+    if end is not None:
+        df = df[df.index <= end]
+    table = pa.Table.from_pandas(df.reset_index(), schema=schema, preserve_index=False)
+    return schema, iter(table.to_batches())
+
+
+# --------------------------------------------
+# Streaming encoders: one chunk per record batch
+def _drain(sink):
+    chunk = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return chunk
+
+
+def _as_dates(schema):
+    # Every series is day-granular: send dates, not nanosecond timestamps
+    i = schema.get_field_index("date")
+    return schema.set(i, pa.field("date", pa.date32())).remove_metadata()
+
+
+def _cast(batch, schema):
+    return pa.RecordBatch.from_arrays(
+        [col.cast(schema.field(i).type) for i, col in enumerate(batch.columns)], schema=schema,
+    )
+
+
+def stream_arrow(schema, batches):
+    schema, sink = _as_dates(schema), io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield _drain(sink)
+        for batch in batches:
+            writer.write_batch(_cast(batch, schema))
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def stream_csv(schema, batches):
+    schema, sink = _as_dates(schema), io.BytesIO()
+    with pacsv.CSVWriter(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(_cast(batch, schema))
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+ENCODERS = {"arrow": stream_arrow, "csv": stream_csv}
+
+
+# --------------------------------------------
+# WSGI app
+def make_app(root=store.STORE_DIR):
+
+    def json_response(start_response, status, payload, headers=()):
+        body = json.dumps(payload).encode()
+        start_response(status, [("Content-Type", "application/json"),
+                                ("Content-Length", str(len(body))), *headers])
+        return [body]
+
+    def app(environ, start_response):
+        if environ["REQUEST_METHOD"] != "GET":
+            return json_response(start_response, "405 Method Not Allowed", {"error": "GET only"})
+
+        parts = environ.get("PATH_INFO", "").strip("/").split("/")
+        try:
+            catalog = store.read_catalog(root)
+        except FileNotFoundError:
+            return json_response(start_response, "503 Service Unavailable",
+                                 {"error": "store not published; run `python query_service.py publish`"})
+
+        # The catalog version doubles as an ETag: results only change when the data does
+        etag = f'"{catalog["version"]}"'
+        if environ.get("HTTP_IF_NONE_MATCH") == etag:
+            start_response("304 Not Modified", [("ETag", etag)])
+            return []
+
+        try:
+            if parts == ["datasets"]:
+                return json_response(start_response, "200 OK", catalog, [("ETag", etag)])
+            if len(parts) != 2 or parts[0] != "datasets":
+                raise QueryError(f"no route for {environ.get('PATH_INFO')}", "404 Not Found")
+
+            query = parse_query(environ)
+            schema, batches = run_query(parts[1], query, catalog, root)
+        except QueryError as e:
+            return json_response(start_response, e.status, {"error": str(e)})
+
+        start_response("200 OK", [("Content-Type", FORMATS[query["format"]]), ("ETag", etag)])
+        return ENCODERS[query["format"]](schema, batches)
+
+    return app
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+def serve(root=store.STORE_DIR, host="127.0.0.1", port=8050):
+    return make_server(host, port, make_app(root), server_class=ThreadingWSGIServer)
+
+
+def publish(root=store.STORE_DIR):
+    from data_pipeline.data_cleaning import DATA, DATA_VERSION, FREQ_BUCKETS
+    from data_pipeline.units import column_units
+    return store.publish_data(DATA, FREQ_BUCKETS, DATA_VERSION, root, units=column_units)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query service over the cleaned columnar store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("publish", help="write the cleaned panel to the store")
+    p_serve = sub.add_parser("serve", help="serve the query API")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8050)))
+    args = parser.parse_args()
+
+    if args.command == "publish":
+        catalog = publish()
+        print(f"published {len(catalog['datasets'])} datasets (data version {catalog['version']}) -> {store.STORE_DIR / store.CLEANED}")
+    else:
+        server = serve(host=args.host, port=args.port)
+        print(f"query API on http://{args.host}:{args.port}/datasets")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
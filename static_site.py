@@ -0,0 +1,240 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+from batch_report import TAB_TITLES, render_all
+from dashboard_analysis.figure_io import UNPACK_JS, default_template, pack_figures
+from dashboard_analysis.headless import TAB_MODULES
+
+# Pre-rendered dashboard for read-only viewers.
+#
+#   python static_site.py build             # site/<version>/<tab>/<n>.json.gz + manifest
+#   python static_site.py serve --port 8000 # static server with cache headers, no Python per view
+#
+# Artifacts are immutable once written: a new version (of the data or of the code that renders
+# it) gets a new directory, shared assets are named by a hash of their content (assets/), and
+# only the files at the site root (latest.json, index.html; tiny, revalidated with ETags)
+# point viewers at them.
+# Each figure artifact is a one-figure pack_figures bundle; the layout template ships once,
+# in the manifest.
+
+BASE_DIR = Path(__file__).resolve().parent
+SITE_DIR = BASE_DIR / "site"
+
+VIEWER_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>South Korea Macroeconomic Dashboard</title>
+<script src="%PLOTLY_JS%"></script>
+<style>
+body { font-family: sans-serif; max-width: 1200px; margin: auto; padding: 1em; }
+.caption { color: #666; font-size: 0.9em; }
+.markdown, .caption, .info, .success, .warning, .error { white-space: pre-line; }
+.info, .success, .warning, .error { padding: 0.5em; border-radius: 4px; }
+.info { background: #e8f0fe; } .success { background: #e6f4ea; }
+.warning { background: #fef7e0; } .error { background: #fce8e6; }
+.metric { display: inline-block; margin: 0.5em 2em 0.5em 0; } .metric b { font-size: 1.6em; display: block; }
+</style></head>
+<body><h1>🇰🇷 South Korea Macroeconomic Dashboard</h1><nav id="nav"></nav><main id="main"></main>
+<script>
+%UNPACK_JS%
+const TAGS = {title: "h2", header: "h2", subheader: "h3"};
+async function show(tab, template) {
+    const main = document.getElementById("main");
+    main.innerHTML = "";
+    for (const block of tab.blocks) {
+        if (block.type === "plotly_chart") {
+            const div = main.appendChild(document.createElement("div"));
+            fetch(block.src).then(r => r.json()).then(bundle => {
+                const fig = unpackFigures({...bundle, template})[0];
+                Plotly.newPlot(div, fig.data, fig.layout, {responsive: true});
+            });
+        } else if (block.type === "divider") {
+            main.appendChild(document.createElement("hr"));
+        } else if (block.type === "metric") {
+            const div = main.appendChild(document.createElement("div"));
+            div.className = "metric";
+            div.textContent = block.label;
+            div.appendChild(document.createElement("b")).textContent = block.value;
+        } else {
+            const el = main.appendChild(document.createElement(TAGS[block.type] || "div"));
+            el.className = block.type;
+            el.textContent = (block.text || "").trim();
+        }
+    }
+}
+(async () => {
+    const latest = await (await fetch("latest.json", {cache: "no-cache"})).json();
+    const manifest = await (await fetch(latest.manifest)).json();
+    const nav = document.getElementById("nav");
+    manifest.tabs.forEach((tab, i) => {
+        const a = nav.appendChild(document.createElement("button"));
+        a.textContent = tab.title;
+        a.onclick = () => show(tab, manifest.template);
+        if (i === 0) show(tab, manifest.template);
+    });
+})();
+</script></body></html>
+"""
+
+
+# --------------------------------------------
+# Build
+def write_gz(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(gzip.compress(payload, compresslevel=9, mtime=0))
+
+
+def write_plotly_js(site_dir):
+    # -> path of the bundle under site_dir; a new plotly release gets a new name
+    from plotly.offline import get_plotlyjs
+
+    payload = get_plotlyjs().encode()
+    rel = f"assets/plotly-{hashlib.sha256(payload).hexdigest()[:12]}.min.js"
+    if not (site_dir / f"{rel}.gz").exists():
+        write_gz(site_dir / f"{rel}.gz", payload)
+    return rel
+
+
+def code_version():
+    # The tab and figure code: DATA_VERSION only fingerprints the data pipeline
+    digest = hashlib.sha256()
+    for path in sorted([*(BASE_DIR / "dashboard_analysis").glob("*.py"), BASE_DIR / "batch_report.py", Path(__file__)]):
+        digest.update(path.name.encode() + path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def site_version():
+    from data_pipeline.data_cleaning import DATA_VERSION
+    return f"{DATA_VERSION}-{code_version()}"
+
+
+def build(site_dir=SITE_DIR, workers=None):
+    version = site_version()
+
+    version_dir = site_dir / version
+    manifest_path = version_dir / "manifest.json"
+
+    if not manifest_path.exists():
+        report = render_all(list(TAB_MODULES), workers)
+        tabs = []
+        for name, blocks in report.items():
+            out_blocks = []
+            for i, block in enumerate(blocks):
+                if block["type"] == "plotly_chart":
+                    rel = f"{version}/{name}/{i}.json"
+                    bundle = pack_figures([block["figure"]])
+                    write_gz(site_dir / f"{rel}.gz", json.dumps(bundle, separators=(",", ":")).encode())
+                    block = {"type": "plotly_chart", "src": rel}
+                out_blocks.append(block)
+            tabs.append({"name": name, "title": TAB_TITLES[name], "blocks": out_blocks})
+
+        manifest = json.dumps({
+            "version": version, "template": default_template(), "tabs": tabs,
+        }, separators=(",", ":")).encode()
+        write_gz(Path(f"{manifest_path}.gz"), manifest)
+        manifest_path.write_bytes(manifest)
+
+    # Shared assets and the pointers to them and to the current version
+    plotly_js = write_plotly_js(site_dir)
+    html = VIEWER_HTML.replace("%UNPACK_JS%", UNPACK_JS).replace("%PLOTLY_JS%", plotly_js)
+    (site_dir / "index.html").write_text(html, encoding="utf-8")
+    (site_dir / "latest.json").write_text(json.dumps({
+        "version": version, "manifest": f"{version}/manifest.json",
+    }))
+    return version
+
+
+# --------------------------------------------
+# Serve
+class ArtifactHandler(SimpleHTTPRequestHandler):
+
+    # Files under a directory (<version>/, content-hashed assets/) never change; the
+    # root-level pointers are revalidated
+    def cache_control(self, rel):
+        if "/" not in rel:
+            return "no-cache"
+        return "public, max-age=31536000, immutable"
+
+    def do_GET(self):
+        rel = unquote(self.path.split("?", 1)[0].split("#", 1)[0]).lstrip("/") or "index.html"
+        root = Path(self.directory).resolve()
+        plain, packed = (root / rel).resolve(), (root / f"{rel}.gz").resolve()
+        # Nothing outside the site directory is served ("..", symlinks out of it)
+        if not (plain.is_relative_to(root) and packed.is_relative_to(root)):
+            self.send_error(404)
+            return
+
+        gzip_ok = "gzip" in self.headers.get("Accept-Encoding", "")
+        if packed.is_file() and (gzip_ok or not plain.is_file()):
+            file, encoding = packed, "gzip"
+        elif plain.is_file():
+            file, encoding = plain, None
+        else:
+            self.send_error(404)
+            return
+        if encoding and not gzip_ok:
+            body = gzip.decompress(file.read_bytes())
+            encoding = None
+        else:
+            body = None
+
+        stat = file.stat()
+        etag = f'"{hashlib.sha1(f"{file}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", self.cache_control(rel))
+            self.end_headers()
+            return
+
+        body = file.read_bytes() if body is None else body
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(rel))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", self.cache_control(rel))
+        self.send_header("ETag", etag)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(site_dir=SITE_DIR, host="127.0.0.1", port=8000):
+    handler = lambda *args, **kwargs: ArtifactHandler(*args, directory=str(site_dir), **kwargs)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and serve pre-rendered dashboard figures")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="render figures for the current data version")
+    p_build.add_argument("--workers", type=int, default=None)
+    p_serve = sub.add_parser("serve", help="serve the built site")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    args = parser.parse_args()
+
+    if args.command == "build":
+        t0 = time.perf_counter()
+        version = build(workers=args.workers)
+        print(f"site built for version {version} in {time.perf_counter() - t0:.2f}s -> {SITE_DIR}")
+    else:
+        server = serve(host=args.host, port=args.port)
+        print(f"serving {SITE_DIR} on http://{args.host}:{args.port}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.asof import asof_join, asof_positions, month_end_asof
+
+RIGHT = pd.Series([1.0, 2.0, 3.0], index=pd.to_datetime(["2024-01-10", "2024-01-20", "2024-01-30"]), name="x")
+
+
+def _left(*dates):
+    return pd.DatetimeIndex(pd.to_datetime(list(dates)))
+
+
+@pytest.mark.parametrize("direction, expected", [
+    ("backward", [np.nan, 1.0, 1.0, 2.0, 3.0]),
+    ("forward", [1.0, 1.0, 2.0, 3.0, np.nan]),
+    ("nearest", [1.0, 1.0, 1.0, 3.0, 3.0]),
+])
+def test_directions_at_edges_and_between(direction, expected):
+    # Before the first observation, exact match, between, just before the last, after the last
+    left = _left("2024-01-01", "2024-01-10", "2024-01-12", "2024-01-29", "2024-02-05")
+    out = asof_join(left, RIGHT, direction)
+    assert out.name == "x" and out.index.equals(left)
+    np.testing.assert_array_equal(out.to_numpy(), expected)
+
+
+def test_nearest_ties_go_backward():
+    out = asof_join(_left("2024-01-15", "2024-01-25"), RIGHT, "nearest")
+    np.testing.assert_array_equal(out.to_numpy(), [1.0, 2.0])
+
+
+@pytest.mark.parametrize("direction, expected", [
+    ("backward", [np.nan, 2.0]),
+    ("forward", [2.0, np.nan]),
+    ("nearest", [2.0, 2.0]),
+])
+def test_exact_matches_excluded(direction, expected):
+    # 01-10 may not match itself; 01-21 is a day after 01-20, which still matches
+    left = _left("2024-01-10", "2024-01-21")
+    right = RIGHT.iloc[:2]
+    out = asof_join(left, right, direction, allow_exact_matches=False)
+    np.testing.assert_array_equal(out.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("direction, expected", [
+    ("backward", [np.nan, 1.0, 3.0]),
+    ("forward", [1.0, np.nan, np.nan]),
+    ("nearest", [1.0, 1.0, 3.0]),
+])
+def test_tolerance_is_inclusive(direction, expected):
+    # 01-08 is 2 days before 01-10, 01-12 2 days after it (8 before 01-20), 02-01 2 days after the last
+    left = _left("2024-01-08", "2024-01-12", "2024-02-01")
+    out = asof_join(left, RIGHT, direction, tolerance="2D")
+    np.testing.assert_array_equal(out.to_numpy(), expected)
+
+
+def test_empty_right_matches_nothing():
+    right = pd.DataFrame({"a": [], "b": []}, index=pd.DatetimeIndex([]))
+    left = _left("2024-01-01", "2024-01-02")
+    assert (asof_positions(left, right.index) == -1).all()
+    out = asof_join(left, right)
+    assert out.shape == (2, 2) and out.isna().all().all()
+
+
+def test_unsorted_right_and_unknown_direction_raise():
+    with pytest.raises(ValueError, match="sorted"):
+        asof_positions(_left("2024-01-01"), RIGHT.index[::-1])
+    with pytest.raises(ValueError, match="direction"):
+        asof_positions(_left("2024-01-01"), RIGHT.index, "sideways")
+
+
+# nearest without exact matches is left out: a key dropped as an exact match leaves two
+# neighbours at the same distance, where merge_asof's tie order is not documented
+@pytest.mark.parametrize("direction, exact", [
+    ("backward", True), ("backward", False), ("forward", True), ("forward", False), ("nearest", True),
+])
+@pytest.mark.parametrize("tolerance", [None, "3D"])
+def test_matches_merge_asof(direction, tolerance, exact):
+    rng = np.random.default_rng(0)
+    # Right keys on even days, left keys on any day: exact matches but no nearest ties
+    days = np.arange(0, 400)
+    right_index = pd.Timestamp("2020-01-01") + pd.to_timedelta(np.sort(rng.choice(days[::2], 60, replace=False)), "D")
+    left_index = pd.Timestamp("2019-12-20") + pd.to_timedelta(np.sort(rng.choice(np.arange(0, 420), 150, replace=False)), "D")
+    right = pd.DataFrame({"a": rng.normal(size=60), "b": rng.normal(size=60)}, index=right_index)
+
+    out = asof_join(left_index, right, direction, tolerance, allow_exact_matches=exact)
+    expected = pd.merge_asof(
+        pd.DataFrame({"t": left_index}), right.rename_axis("t").reset_index(), on="t", direction=direction,
+        tolerance=None if tolerance is None else pd.Timedelta(tolerance), allow_exact_matches=exact,
+    ).set_index("t")
+    np.testing.assert_array_equal(out.to_numpy(), expected[["a", "b"]].to_numpy())
+
+
+def test_month_end_asof_keeps_the_month_labels():
+    index = pd.date_range("2024-01-01", periods=3, freq="MS")
+    right = pd.Series([1.0, 2.0, 3.0], index=pd.to_datetime(["2024-01-31", "2024-02-15", "2024-04-01"]))
+    out = month_end_asof(index, right)
+    assert out.index.equals(index)
+    # Jan: its last day counts; Feb: mid-month; Mar: nothing new, the Feb value carries
+    np.testing.assert_array_equal(out.to_numpy(), [1.0, 2.0, 2.0])
+    np.testing.assert_array_equal(month_end_asof(index, right, tolerance="20D").to_numpy(), [1.0, 2.0, np.nan])
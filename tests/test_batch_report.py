@@ -0,0 +1,27 @@
+import json
+
+import plotly.graph_objects as go
+
+from batch_report import block_html, render_all, write_html
+
+
+def test_text_blocks_are_escaped():
+    assert block_html({"type": "subheader", "text": " <b>Rates</b> "}, "x") == '<h3 class="subheader">&lt;b&gt;Rates&lt;/b&gt;</h3>'
+    metric = block_html({"type": "metric", "label": "CPI", "value": "2.1", "delta": "-0.3 <pp>"}, "x")
+    assert '<div class="delta">-0.3 &lt;pp&gt;</div>' in metric
+    assert block_html({"type": "plotly_chart"}, "npish-3") == '<div id="npish-3" class="chart"></div>'
+
+
+def test_rendered_tab_is_json_and_writes_one_page(tmp_path):
+    report = render_all(["npish"], workers=1)
+    blocks = report["npish"]
+    json.dumps(blocks)  # crosses the process pool as plain data
+    charts = [i for i, b in enumerate(blocks) if b["type"] == "plotly_chart"]
+    assert charts
+    assert go.Figure(blocks[charts[0]]["figure"]).data
+
+    path = tmp_path / "report.html"
+    write_html({"generated_at": "2024-01-01T00:00:00", "tabs": report}, path)
+    page = path.read_text(encoding="utf-8")
+    assert all(f'id="npish-{i}"' in page for i in charts)
+    assert f'const IDS = {json.dumps([f"npish-{i}" for i in charts])};' in page
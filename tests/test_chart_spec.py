@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard_analysis.chart_spec import frame_periods, series
+
+
+@pytest.mark.parametrize("freq, periods", [("B", 252), ("MS", 12), ("QS", 4), ("YS", 1)])
+def test_frame_periods_from_date_spacing(freq, periods):
+    assert frame_periods(pd.date_range("2018-01-01", periods=40, freq=freq)) == periods
+
+
+def test_frame_series_yoy_counts_a_year_of_rows():
+    index = pd.date_range("2018-01-01", periods=36, freq="MS")
+    frame = pd.DataFrame({"x": np.arange(1.0, 37.0)}, index=index)
+    # A masked month leaves a gap in the dates but not in the spacing's median
+    frame = frame.drop(index[20])
+
+    yoy = series({"column": "x", "transform": "yoy"}, DATA={}, frame=frame)
+    expected = frame["x"].pct_change(12, fill_method=None) * 100
+    pd.testing.assert_series_equal(yoy, expected)
+    assert yoy.iloc[:12].isna().all()
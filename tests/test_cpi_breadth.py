@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.cpi_breadth import CPI_WEIGHTS, TOTAL, breadth_columns, cpi_breadth, row_median, trimmed_mean
+
+
+def _sorted_trimmed_mean(values, trim):
+    return np.sort(values, axis=1)[:, trim:values.shape[1] - trim].mean(axis=1)
+
+
+@pytest.mark.parametrize("n", [5, 6, 12])
+@pytest.mark.parametrize("trim", [0, 1, 2])
+def test_partition_measures_match_a_full_sort(n, trim):
+    rng = np.random.default_rng(n * 10 + trim)
+    values = rng.normal(2, 3, size=(50, n))
+    values[::7, 0] = values[::7, 1]  # ties
+    np.testing.assert_allclose(trimmed_mean(values, trim), _sorted_trimmed_mean(values, trim))
+    np.testing.assert_allclose(row_median(values), np.median(values, axis=1))
+
+
+def test_trim_leaving_nothing_raises():
+    with pytest.raises(ValueError):
+        trimmed_mean(np.zeros((1, 4)), trim=2)
+
+
+def test_months_with_a_missing_component_get_nan_core_measures():
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2024-01-01", periods=6, freq="MS")
+    cpi = pd.DataFrame(rng.normal(2.5, 2, size=(6, len(CPI_WEIGHTS))), index=index, columns=list(CPI_WEIGHTS))
+    cpi[TOTAL] = 2.5
+    cpi.iloc[2, 3] = np.nan
+
+    breadth = cpi_breadth(cpi)["cpi_breadth"]
+    columns = breadth_columns(len(CPI_WEIGHTS))
+    assert list(breadth.columns) == list(columns.values())
+
+    values = cpi[list(CPI_WEIGHTS)].to_numpy()
+    complete = np.isfinite(values).all(axis=1)
+    trimmed, median = breadth[columns["trimmed_mean"]].to_numpy(), breadth[columns["median"]].to_numpy()
+    assert np.isnan(trimmed[2]) and np.isnan(median[2])
+    np.testing.assert_allclose(trimmed[complete], _sorted_trimmed_mean(values[complete], 2))
+    np.testing.assert_allclose(median[complete], np.median(values[complete], axis=1))
+    # The headline is never masked
+    assert breadth[columns["headline"]].notna().all()
@@ -0,0 +1,69 @@
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from data_pipeline.dag import Stage, run_dag
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    # dagpkg.stages.double calls dagpkg.helpers.scale, imported from another module
+    pkg = tmp_path / "dagpkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "helpers.py").write_text("FACTOR = 2\n\ndef scale(x):\n    return x * FACTOR\n")
+    (pkg / "stages.py").write_text(textwrap.dedent("""
+        from dagpkg.helpers import scale
+
+        def source(x):
+            return x
+
+        def double(x):
+            return scale(x)
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Same-size edits within a second would otherwise be served from a stale .pyc
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    yield pkg
+    for name in [n for n in sys.modules if n.startswith("dagpkg")]:
+        del sys.modules[name]
+
+
+def build(cache_dir, arg=1):
+    stages = importlib.import_module("dagpkg.stages")
+    return run_dag(
+        [Stage("source", stages.source, args=(arg,)), Stage("double", stages.double, deps=["source"])],
+        cache_dir=cache_dir,
+    )
+
+
+def test_second_build_is_served_from_cache(package, tmp_path):
+    assert build(tmp_path / "cache") == ({"double": 2}, {"source": "ran", "double": "ran"})
+    assert build(tmp_path / "cache") == ({"double": 2}, {"double": "cached"})
+
+
+def test_argument_change_reruns_the_stage_and_its_dependents(package, tmp_path):
+    build(tmp_path / "cache")
+    results, report = build(tmp_path / "cache", arg=5)
+    assert results == {"double": 10}
+    assert report == {"source": "ran", "double": "ran"}
+
+
+def test_edit_to_an_imported_helper_module_invalidates_the_stage(package, tmp_path):
+    build(tmp_path / "cache")
+    (package / "helpers.py").write_text("FACTOR = 3\n\ndef scale(x):\n    return x * FACTOR\n")
+    for name in [n for n in sys.modules if n.startswith("dagpkg")]:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+
+    results, report = build(tmp_path / "cache")
+    assert results == {"double": 3}
+    assert report["double"] == "ran"
+
+
+def test_cycle_is_rejected():
+    stages = [Stage("a", lambda b: b, deps=["b"]), Stage("b", lambda a: a, deps=["a"])]
+    with pytest.raises(ValueError, match="cycle"):
+        run_dag(stages)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from data_pipeline.data_cleaning import DATASETS, build_monthly_panel, clean_frames, pipeline_stages
+
+
+def test_clean_frames_drop_sentinel_zeros_and_repeated_dates():
+    index = pd.bdate_range("2024-01-01", periods=60)
+    rates = pd.DataFrame({"rate": np.linspace(1300.0, 1400.0, 60)}, index=index)
+    rates.iloc[10] = 0.0
+    rates = pd.concat([rates, rates.iloc[[20]] + 1.0])
+
+    clean = clean_frames({"fx": rates}, {"fx": DATASETS["fx"]})["fx"]
+
+    assert clean.index.is_unique and len(clean) == 60
+    assert np.isnan(clean.loc[index[10], "rate"])
+    assert clean.loc[index[20], "rate"] == rates.iloc[-1]["rate"]
+
+
+def test_every_consumer_of_the_frames_reads_the_masked_stage():
+    stages = {stage.name: stage for stage in pipeline_stages()}
+    consumers = ["frames", "derived:fx", "derived:cpi", *[n for n in stages if n.startswith(("monthly:", "factor:"))]]
+    for name in consumers:
+        assert not any(dep.startswith("units:") for dep in stages[name].deps), name
+
+
+# Datasets per monthly rule, two sharing each rule with different spans
+PANEL_DATASETS = {
+    "daily_a": {"freq": "D", "monthly": "mean"},
+    "daily_b": {"freq": "D", "monthly": "mean"},
+    "month": {"freq": "M", "monthly": None},
+    "quarter": {"freq": "Q", "monthly": "ffill"},
+    "year_a": {"freq": "Y", "monthly": "interpolate"},
+    "year_b": {"freq": "Y", "monthly": "interpolate"},
+}
+
+
+def _panel_frames():
+    rng = np.random.default_rng(2)
+
+    def frame(index):
+        return pd.DataFrame({"x": rng.normal(size=len(index)), "y": rng.normal(size=len(index))}, index=index)
+
+    return {
+        "daily_a": frame(pd.bdate_range("2020-01-06", "2021-06-15")),
+        "daily_b": frame(pd.bdate_range("2020-05-04", "2020-11-30")),
+        "month": frame(pd.date_range("2019-01-01", periods=30, freq="MS")),
+        "quarter": frame(pd.date_range("2019-01-01", periods=8, freq="QS")),
+        "year_a": frame(pd.date_range("2010-01-01", periods=6, freq="YS")),
+        "year_b": frame(pd.date_range("2013-01-01", periods=5, freq="YS")),
+    }
+
+
+def test_monthly_panel_applies_each_datasets_rule_within_its_own_span():
+    frames = _panel_frames()
+    panel = build_monthly_panel(frames, PANEL_DATASETS)
+    assert list(panel) == list(PANEL_DATASETS)
+
+    for name, spec in PANEL_DATASETS.items():
+        df = frames[name]
+        expected = df if spec["monthly"] is None else getattr(df.resample("MS"), spec["monthly"])()
+        pd.testing.assert_frame_equal(panel[name], expected, check_freq=False)
+
+
+def test_monthly_panel_rules():
+    panel = build_monthly_panel(_panel_frames(), PANEL_DATASETS)
+    # A daily month is its mean; the shorter daily series is not extended by the longer one
+    assert panel["daily_b"].index[0] == pd.Timestamp("2020-05-01")
+    assert panel["daily_b"].index[-1] == pd.Timestamp("2020-11-01")
+    # Quarterly values hold for the quarter's months; yearly ones move linearly between years
+    quarter, year = panel["quarter"], panel["year_a"]
+    assert (quarter.loc["2019-01-01":"2019-03-01", "x"] == quarter.loc["2019-01-01", "x"]).all()
+    steps = year.loc["2010-01-01":"2011-01-01", "x"].diff().dropna()
+    np.testing.assert_allclose(steps, steps.iloc[0])
+    assert panel["year_b"].index[0] == pd.Timestamp("2013-01-01")
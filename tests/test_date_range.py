@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline import store
+from data_pipeline.date_range import read_data, slice_data
+
+
+def _data():
+    rng = np.random.default_rng(3)
+    days = pd.bdate_range("2020-01-01", "2021-12-31", name="date")
+    months = pd.date_range("2015-01-01", "2021-12-01", freq="MS", name="date")
+    shared = pd.DataFrame({"x": rng.normal(size=len(months))}, index=months)
+    return {
+        "daily": {"fx": pd.DataFrame({"usd": rng.normal(size=len(days))}, index=days)},
+        # Two frames on one index object: searched once
+        "monthly": {"a": shared, "b": pd.DataFrame({"y": rng.normal(size=len(months))}, index=shared.index)},
+        "yearly": {"empty": pd.DataFrame({"z": []}, index=pd.DatetimeIndex([], name="date"))},
+    }
+
+
+RANGES = [
+    (None, None),
+    ("2020-03-01", None),
+    (None, "2020-03-01"),
+    ("2020-03-01", "2021-03-01"),        # exact dates on both ends are kept
+    ("2020-03-01 12:00", "2021-02-28"),
+    ("2010-01-01", "2012-01-01"),        # before everything
+    ("2030-01-01", None),                # after everything
+    ("2021-06-01", "2021-01-01"),        # reversed
+]
+
+
+@pytest.mark.parametrize("start, end", RANGES)
+def test_searchsorted_bounds_match_boolean_masks(start, end):
+    DATA = _data()
+    view = slice_data(DATA, start, end)
+    for bucket, frames in DATA.items():
+        for name, df in frames.items():
+            mask = np.ones(len(df), dtype=bool)
+            if start is not None:
+                mask &= df.index >= pd.Timestamp(start)
+            if end is not None:
+                mask &= df.index <= pd.Timestamp(end)
+            pd.testing.assert_frame_equal(view[bucket][name], df[mask])
+
+
+def test_slices_are_views():
+    DATA = _data()
+    view = slice_data(DATA, "2020-01-01", "2020-12-01")
+    assert np.shares_memory(view["monthly"]["a"].to_numpy(), DATA["monthly"]["a"].to_numpy())
+
+
+@pytest.mark.parametrize("start, end", [(None, None), ("2020-03-01", "2021-03-01"), ("2021-06-01", None)])
+def test_store_reads_match_in_memory_slices(tmp_path, start, end):
+    DATA = _data()
+    del DATA["yearly"]
+    store.publish_data(DATA, {"D": "daily", "M": "monthly"}, "v1", tmp_path)
+    read, sliced = read_data(start, end, tmp_path), slice_data(DATA, start, end)
+    for bucket, frames in sliced.items():
+        for name, df in frames.items():
+            pd.testing.assert_frame_equal(read[bucket][name], df, check_freq=False, check_index_type=False)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from dashboard_analysis.debt_projection import SEED_BLOCK, _simulate_chunk, fan_chart_bands, simulate_debt_paths
+
+INPUTS = {"d0": 0.4, "r_mean": 0.03, "r_std": 0.01, "g_mean": 0.04, "g_std": 0.02, "pb_mean": -0.01, "pb_std": 0.01}
+PARAMS = tuple(INPUTS[k] for k in ("d0", "r_mean", "r_std", "g_mean", "g_std", "pb_mean", "pb_std"))
+
+
+def test_closed_form_matches_the_recursion():
+    seeds = np.random.SeedSequence(7).spawn(2)
+    blocks, horizon = [(seeds[0], 5), (seeds[1], 3)], 12
+    paths = _simulate_chunk((blocks, horizon) + PARAMS)
+
+    expected = []
+    for seed, n in blocks:
+        rng = np.random.default_rng(seed)
+        r = rng.normal(INPUTS["r_mean"], INPUTS["r_std"], size=(n, horizon))
+        g = rng.normal(INPUTS["g_mean"], INPUTS["g_std"], size=(n, horizon))
+        pb = rng.normal(INPUTS["pb_mean"], INPUTS["pb_std"], size=(n, horizon))
+        for i in range(n):
+            d = [INPUTS["d0"]]
+            for t in range(horizon):
+                d.append(d[-1] * (1 + r[i, t]) / (1 + g[i, t]) - pb[i, t])
+            expected.append(d)
+
+    assert paths.shape == (8, horizon + 1)
+    np.testing.assert_allclose(paths, np.array(expected), rtol=1e-5)
+
+
+@pytest.mark.parametrize("chunk_size", [1, SEED_BLOCK, 3 * SEED_BLOCK + 1, 100_000])
+def test_seed_gives_the_same_paths_for_any_chunking(chunk_size):
+    reference = simulate_debt_paths(INPUTS, horizon=5, n_paths=7_500, chunk_size=2 * SEED_BLOCK, seed=3)
+    paths = simulate_debt_paths(INPUTS, horizon=5, n_paths=7_500, chunk_size=chunk_size, seed=3)
+    np.testing.assert_array_equal(paths, reference)
+
+
+def test_worker_pool_gives_the_same_paths():
+    serial = simulate_debt_paths(INPUTS, horizon=5, n_paths=4_000, chunk_size=SEED_BLOCK, seed=3)
+    pooled = simulate_debt_paths(INPUTS, horizon=5, n_paths=4_000, chunk_size=SEED_BLOCK, workers=2, seed=3)
+    np.testing.assert_array_equal(pooled, serial)
+
+
+def test_bands_and_memory_cap():
+    paths = simulate_debt_paths(INPUTS, horizon=5, n_paths=2_000, seed=1)
+    bands = fan_chart_bands(paths, 2024)
+    assert list(bands.columns) == ["p5", "p25", "p50", "p75", "p95"]
+    assert (bands.diff(axis=1).iloc[:, 1:] >= 0).all().all()
+    assert bands.index[0].year == 2024 and len(bands) == 6
+    with pytest.raises(ValueError, match="MAX_PATHS_BYTES"):
+        simulate_debt_paths(INPUTS, horizon=100, n_paths=10_000_000)
@@ -0,0 +1,148 @@
+import asyncio
+import hashlib
+import json
+import threading
+
+import pandas as pd
+import pytest
+import requests
+
+from data_pipeline import ecos_client, store
+from data_pipeline.ecos_client import ECOS_SERIES, SAMPLE_PAGE_SIZE, EcosClient, EcosError, dataset_columns
+from data_pipeline.ecos_mock import serve
+
+START, END = "2018-01-01", "2020-01-31"
+
+
+class Fixtures:
+    # Writes responses the way `ecos_client --record` names them, paged as the sample key is
+
+    def __init__(self, root):
+        self.root = root
+
+    def write(self, service, tail, rows):
+        for start in range(1, max(len(rows), 1) + 1, SAMPLE_PAGE_SIZE):
+            path = f"{service}/{{key}}/json/en/{start}/{start + SAMPLE_PAGE_SIZE - 1}/{tail}"
+            body = {service: {"list_total_count": len(rows), "row": rows[start - 1:start - 1 + SAMPLE_PAGE_SIZE]}}
+            (self.root / f"{hashlib.sha1(path.encode()).hexdigest()}.json").write_text(json.dumps(body))
+
+    def items(self, stat_code, items):
+        # items: [(parent or None, name)] -> codes I0, I1, ...
+        rows = [{"P_ITEM_NAME": parent, "ITEM_NAME": name, "ITEM_CODE": f"I{i}"} for i, (parent, name) in enumerate(items)]
+        self.write("StatisticItemList", stat_code, rows)
+        return {(parent, name): f"I{i}" for i, (parent, name) in enumerate(items)}
+
+    def series(self, stat_code, cycle, code, values):
+        times = pd.date_range(START, periods=len(values), freq="MS").strftime("%Y%m")
+        rows = [{"TIME": t, "DATA_VALUE": str(v)} for t, v in zip(times, values)]
+        self.write("StatisticSearch", f"{stat_code}/{cycle}/201801/202001/{code}", rows)
+
+
+@pytest.fixture
+def ecos(tmp_path, monkeypatch):
+    monkeypatch.delenv("ECOS_API_KEY", raising=False)
+    fixtures = tmp_path / "fixtures"
+    fixtures.mkdir()
+    server = serve(fixtures, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = EcosClient(base_url=f"http://127.0.0.1:{server.server_address[1]}/api", cache_dir=tmp_path / "cache",
+                        store_root=tmp_path / "store", max_retries=0)
+    yield Fixtures(fixtures), client
+    server.shutdown()
+
+
+def fetch(client, name):
+    return asyncio.run(client.fetch_all([name], start=START, end=END))[name]
+
+
+def test_items_that_repeat_across_markets_are_kept_apart(ecos):
+    fixtures, client = ecos
+    columns = ECOS_SERIES["kospi"][0]["items"]
+    codes = fixtures.items("901Y014", [tuple(item.split("/", 1)) for item in columns])
+    # 25 rows: three sample-key pages each
+    fixtures.series("901Y014", "M", codes[("KOSPI", "Market Capitalization")], range(25))
+    fixtures.series("901Y014", "M", codes[("KOSDAQ", "Market Capitalization")], range(100, 125))
+
+    df = fetch(client, "kospi")
+    assert list(df.columns) == dataset_columns("kospi")
+    assert len(df) == 25
+    assert df["KOSPI_Market Capitalization"].iloc[-1] == 24
+    assert df["KOSDAQ_Market Capitalization"].iloc[-1] == 124
+    pd.testing.assert_frame_equal(store.read_frame("kospi", root=client.store_root), df, check_freq=False)
+
+
+def test_no_data_keeps_the_store_untouched(ecos):
+    fixtures, client = ecos
+    fixtures.items("722Y001", [(None, "Bank of Korea Base Rate")])
+
+    df = fetch(client, "bok_rate")
+    assert df.empty
+    assert list(df.columns) == ["base_rate"]
+    assert not store.has_frame("bok_rate", client.store_root)
+
+
+def test_undeclared_item_names_are_an_error(ecos):
+    fixtures, client = ecos
+    fixtures.items("722Y001", [(None, "Base Rate")])
+    with pytest.raises(EcosError, match="Bank of Korea Base Rate"):
+        fetch(client, "bok_rate")
+
+
+class FakeSession:
+    # Answers GETs from a list of (status, headers, body) and records the request headers
+
+    def __init__(self, responses):
+        self.responses, self.requests = list(responses), []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        status, resp_headers, body = self.responses.pop(0)
+        resp = requests.Response()
+        resp.status_code, resp.url = status, url
+        resp.headers.update(resp_headers)
+        resp._content = json.dumps(body).encode() if body is not None else b""
+        return resp
+
+
+@pytest.fixture
+def offline(tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(ecos_client.time, "sleep", sleeps.append)
+    client = EcosClient(api_key="sample", cache_dir=tmp_path / "cache", record_dir=tmp_path / "record",
+                        max_retries=2, backoff=0.01)
+    return client, sleeps
+
+
+PATH = "StatisticItemList/{key}/json/en/1/10/722Y001"
+
+
+def test_revalidated_responses_are_recorded(offline):
+    client, _ = offline
+    client.session = FakeSession([(200, {"ETag": '"v1"'}, {"a": 1}), (304, {}, None)])
+    assert client._get(PATH) == {"a": 1}
+    record = client.record_dir / client._cache_file(PATH).name
+    record.unlink()
+
+    assert client._get(PATH) == {"a": 1}
+    assert client.session.requests[1] == {"If-None-Match": '"v1"'}
+    assert json.loads(record.read_text()) == {"a": 1}
+
+
+def test_304_without_a_cache_entry_asks_for_the_body(offline):
+    client, _ = offline
+    client.session = FakeSession([(304, {}, None), (200, {}, {"a": 2})])
+    assert client._get(PATH) == {"a": 2}
+    assert client.session.requests == [{}, {"Cache-Control": "no-cache"}]
+
+    client._cache_file(PATH).unlink()
+    client.session = FakeSession([(304, {}, None), (304, {}, None)])
+    with pytest.raises(EcosError, match="304"):
+        client._get(PATH)
+
+
+def test_429_waits_as_long_as_retry_after(offline):
+    client, sleeps = offline
+    client.session = FakeSession([(429, {"Retry-After": "7"}, None), (503, {}, None), (200, {}, {"a": 3})])
+    assert client._get(PATH) == {"a": 3}
+    assert sleeps[0] == 7
+    assert sleeps[1] < 1  # plain backoff without the header
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.factors import build_factor, liquidity_factors
+
+
+@pytest.fixture
+def kospi():
+    # Trading value in KRW tn, market cap in KRW thousand (as delivered)
+    return pd.DataFrame({
+        "KOSPI_Index(End Of)": [2000.0, 2100.0, 2100.0],
+        "KOSPI_Trading Value": [200.0, 300.0, 0.0],
+        "KOSPI_Market Capitalization": [2.0e12, 2.5e12, 2.5e12],
+        "KOSPI_No.of Listed Companies": [800.0, 800.0, 800.0],
+        "KOSDAQ_Index(End of)": [800.0, 760.0, 798.0],
+        "KOSDAQ_Trading Value": [100.0, 100.0, 50.0],
+        "KOSDAQ_Market Capitalization": [4.0e11, 4.0e11, 5.0e11],
+        "KOSDAQ_No.of Listed Companies": [1600.0, 1600.0, 1625.0],
+    }, index=pd.date_range("2024-01-01", periods=3, freq="MS", name="date"))
+
+
+def test_liquidity_factors_by_hand(kospi):
+    out = liquidity_factors(kospi)
+
+    # Turnover: KRW 200 tn traded over KRW 2,000 tn of market cap (2.0e12 thousand)
+    np.testing.assert_allclose(out["KOSPI Turnover (%)"], [10.0, 12.0, 0.0])
+    np.testing.assert_allclose(out["KOSDAQ Turnover (%)"], [25.0, 25.0, 10.0])
+    # Amihud: |return| in % per KRW tn; no return in the first month, 0 traded -> inf
+    amihud = out["KOSDAQ Amihud illiquidity"]
+    assert np.isnan(amihud.iloc[0])
+    np.testing.assert_allclose(amihud.iloc[1:], [5.0 / 100, 5.0 / 50])
+    assert out["KOSPI Amihud illiquidity"].iloc[1] == pytest.approx(5.0 / 300)
+    assert np.isnan(out["KOSPI Amihud illiquidity"].iloc[2])   # 0 / 0
+    # Value per company in KRW bn
+    np.testing.assert_allclose(out["KOSPI Value per company (KRW bn)"], [250.0, 375.0, 0.0])
+    # Cross-exchange
+    np.testing.assert_allclose(out["Relative turnover (KOSDAQ/KOSPI)"].iloc[:2], [2.5, 25 / 12])
+    np.testing.assert_allclose(out["KOSDAQ value share (%)"], [100 / 3, 25.0, 100.0])
+    assert out.index.equals(kospi.index)
+
+
+def test_factor_is_keyed_by_name(kospi):
+    panel = build_factor("liquidity", kospi)
+    pd.testing.assert_frame_equal(panel["liquidity"], liquidity_factors(kospi))
@@ -0,0 +1,28 @@
+import pytest
+
+from dashboard_analysis.figure_io import measure_tabs
+
+MIN_RATIO = 2.0
+
+
+@pytest.fixture(scope="module")
+def rows():
+    from streamlit import logger
+    logger.set_log_level("error")
+    return measure_tabs()
+
+
+def test_every_chart_tab_is_measured(rows):
+    from dashboard_analysis.headless import TAB_MODULES
+    # The summary tab shows metrics only
+    assert {tab for tab, *_ in rows} == set(TAB_MODULES) - {"summary"}
+
+
+def test_compact_payload_is_at_least_half_the_raw_one(rows):
+    raw, small = sum(r[2] for r in rows), sum(r[3] for r in rows)
+    assert raw / small >= MIN_RATIO, f"total ratio {raw / small:.2f} below {MIN_RATIO}"
+
+
+def test_raw_size_is_uncompacted(rows):
+    # A figure that was already compact would give a ratio of 1
+    assert all(raw > small for _, _, raw, small in rows)
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline import forecast
+from data_pipeline.forecast import HORIZON, LEVELS, build_forecasts, fit_series, load_forecasts, read_models
+
+
+def _bands(mean):
+    return {level: np.column_stack([mean - 1, mean + 1]) for level in LEVELS}
+
+
+def _trend(y):
+    # extrapolates the series' straight line: exact on a linear series
+    slope = float(y.iloc[-1] - y.iloc[-2])
+    mean = float(y.iloc[-1]) + slope * np.arange(1, HORIZON + 1)
+    return {"slope": slope}, mean, _bands(mean)
+
+
+def _fails(y):
+    raise ValueError("no fit")
+
+
+def _diverges(y):
+    mean = np.full(HORIZON, np.nan)
+    return {}, mean, _bands(mean)
+
+
+def test_fit_series_picks_the_lowest_holdout_mae(monkeypatch):
+    monkeypatch.setattr(forecast, "MODELS", {
+        "random_walk": forecast._random_walk, "trend": _trend, "fails": _fails, "diverges": _diverges,
+    })
+    y = pd.Series(np.arange(48.0), index=pd.date_range("2020-01-01", periods=48, freq="MS"))
+    fit, cone = fit_series(y)
+
+    assert fit["model"] == "trend"
+    # only models that fitted with finite forecasts are scored
+    assert set(fit["holdout_mae"]) == {"random_walk", "trend"}
+    assert fit["holdout_mae"]["trend"] == pytest.approx(0)
+    # the random walk stays at the last pre-holdout value (35): errors 1..12
+    assert fit["holdout_mae"]["random_walk"] == pytest.approx(6.5)
+    # refitted on the whole series
+    assert cone.index[0] == pd.Timestamp("2024-01-01")
+    np.testing.assert_allclose(cone["mean"], 47.0 + np.arange(1, HORIZON + 1))
+
+
+def _monthly(seed=0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2018-01-01", periods=48, freq="MS")
+    return {"prices": pd.DataFrame({
+        "a": 100 + rng.normal(0, 1, 48).cumsum(),
+        "b": np.linspace(1, 5, 48) + rng.normal(0, 0.1, 48),
+    }, index=idx)}
+
+
+def test_rebuild_refits_only_changed_series(tmp_path):
+    monthly = _monthly()
+    first = build_forecasts(monthly, workers=1, root=tmp_path)
+    assert sorted(first["refit"]) == ["prices/a", "prices/b"]
+    assert set(first["forecast"]["prices"].columns.get_level_values("column")) == {"a", "b"}
+    saved = read_models(tmp_path)
+
+    # same data: every series_hash matches, nothing is refitted or rewritten
+    again = build_forecasts(monthly, workers=1, root=tmp_path)
+    assert again["refit"] == []
+    assert read_models(tmp_path) == saved
+
+    changed = {"prices": monthly["prices"].assign(b=monthly["prices"]["b"] * 2)}
+    # until rebuilt, the changed series has no current forecast; the other one keeps its cone
+    stale = load_forecasts(changed, tmp_path)
+    assert set(stale["prices"].columns.get_level_values("column")) == {"a"}
+
+    rebuilt = build_forecasts(changed, workers=1, root=tmp_path)
+    assert rebuilt["refit"] == ["prices/b"]
+    models = read_models(tmp_path)
+    assert models["prices/a"] == saved["prices/a"]
+    assert models["prices/b"]["hash"] != saved["prices/b"]["hash"]
+    assert set(rebuilt["forecast"]["prices"].columns.get_level_values("column")) == {"a", "b"}
+
+    assert sorted(build_forecasts(changed, workers=1, force=True, root=tmp_path)["refit"]) == ["prices/a", "prices/b"]
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.fx_engine import TRADING_DAYS, realized_vol, rolling_mean, rolling_min
+
+
+def _matrix(n=400, k=3, seed=6):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(1.0, 0.5, size=(n, k))
+    x[rng.random((n, k)) < 0.1] = np.nan
+    x[50:90, 1] = np.nan     # a gap longer than the window
+    x[:, 2] = np.nan         # a currency with no data
+    return x
+
+
+@pytest.mark.parametrize("window, min_periods", [(1, None), (5, None), (21, 10), (21, None), (252, 126)])
+def test_rolling_mean_matches_pandas(window, min_periods):
+    x = _matrix()
+    expected = pd.DataFrame(x).rolling(window, min_periods=window if min_periods is None else min_periods).mean()
+    np.testing.assert_allclose(rolling_mean(x, window, min_periods), expected.to_numpy(), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("window", [1, 5, 252])
+def test_rolling_min_matches_pandas(window):
+    x = _matrix()
+    expected = pd.DataFrame(x).rolling(window, min_periods=1).min()
+    np.testing.assert_array_equal(rolling_min(x, window), expected.to_numpy())
+
+
+def test_realized_vol_matches_pandas():
+    x = _matrix() * 1e-4
+    x[10, 0] = -5e-3   # Garman-Klass terms can be negative: the window mean is floored at 0
+    window = 21
+    mean = pd.DataFrame(x).rolling(window, min_periods=window // 2).mean().clip(lower=0)
+    expected = np.sqrt(TRADING_DAYS * mean) * 100
+    np.testing.assert_allclose(realized_vol(x, window), expected.to_numpy(), rtol=1e-9, atol=1e-12)
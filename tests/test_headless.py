@@ -0,0 +1,39 @@
+import sys
+import threading
+import types
+
+from dashboard_analysis import headless
+
+
+def test_headless_run_does_not_capture_a_concurrent_session(monkeypatch):
+    session_calls = []
+    module = types.ModuleType("fake_tab")
+    module.st = types.SimpleNamespace(markdown=lambda body: session_calls.append(body))
+    rendering, session_done = threading.Event(), threading.Event()
+
+    def fake_tab(DATA):
+        module.st.markdown("headless")
+        rendering.set()
+        # A visitor's rerun of the same tab while the headless render is still running
+        session_done.wait(5)
+        module.st.markdown("headless, after")
+
+    def session():
+        rendering.wait(5)
+        module.st.markdown("visitor")
+        session_done.set()
+
+    module.fake_tab = fake_tab
+    monkeypatch.setitem(sys.modules, "fake_tab", module)
+    monkeypatch.setitem(headless.TAB_MODULES, "fake", ("fake_tab", "fake_tab"))
+
+    visitor = threading.Thread(target=session)
+    visitor.start()
+    blocks = headless.run_tab("fake", DATA={})
+    visitor.join()
+
+    assert [b["text"] for b in blocks] == ["headless", "headless, after"]
+    assert session_calls == ["visitor"]
+    # Outside a headless run the module talks to Streamlit again
+    module.st.markdown("later")
+    assert session_calls == ["visitor", "later"]
@@ -0,0 +1,39 @@
+import pytest
+
+from dashboard_analysis.import_time import BUDGETS, dashboard_imports, parse_importtime, report
+
+STDERR = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        200 | io
+noise that is not an import line
+import time:       300 |        300 |     json.decoder
+import time:        50 |        350 |   json
+import time:        10 |        360 | mypkg
+"""
+
+
+def test_parse_importtime_rows_and_depths():
+    assert parse_importtime(STDERR) == [
+        ("_io", 120, 120, 1),
+        ("io", 80, 200, 0),
+        ("json.decoder", 300, 300, 2),
+        ("json", 50, 350, 1),
+        ("mypkg", 10, 360, 0),
+    ]
+
+
+def test_dashboard_imports_top_level_only(tmp_path):
+    path = tmp_path / "app.py"
+    path.write_text(
+        "import os, sys\nfrom pathlib import Path\nfrom . import local\nimport os\n"
+        "def f():\n    import scipy\n",
+        encoding="utf-8",
+    )
+    assert dashboard_imports(path) == ["os", "sys", "pathlib"]
+
+
+@pytest.mark.parametrize("target", ["data_pipeline.alerts", "query_service"])
+def test_entry_points_keep_forbidden_modules_out(target):
+    result = report(target, repeat=1)
+    assert result["forbidden"] == [], BUDGETS[target]
+    assert result["modules"] > 0
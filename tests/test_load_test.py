@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from dashboard_analysis.load_test import compare, latency_stats
+
+
+def test_latency_stats_in_milliseconds():
+    seconds = np.arange(1, 101) / 1000
+    stats = latency_stats(list(seconds))
+    assert stats["count"] == 100
+    assert stats["mean_ms"] == pytest.approx(50.5)
+    assert stats["p50_ms"] == pytest.approx(np.percentile(seconds * 1000, 50), abs=0.05)
+    assert stats["p95_ms"] == pytest.approx(95.05, abs=0.05)
+    assert stats["max_ms"] == 100.0
+    assert latency_stats([]) == {"count": 0}
+
+
+def _report(commit, p95s):
+    return {
+        "commit": commit,
+        "levels": [{"sessions": s, "rerun": {"count": 10, "p95_ms": p} if p else {"count": 0}} for s, p in p95s.items()],
+    }
+
+
+def test_compare_flags_only_regressions_at_shared_levels():
+    base = _report("aaa", {1: 100.0, 5: 200.0, 10: 400.0, 20: None})
+    new = _report("bbb", {1: 119.0, 5: 260.0, 10: 300.0, 20: 900.0, 50: 5000.0})
+    assert compare(base, new) == ["5 sessions p95 200 -> 260 ms"]
+    assert compare(base, new, max_regression=0.35) == []
+    assert compare(base, new, max_regression=0.1) == ["1 sessions p95 100 -> 119 ms", "5 sessions p95 200 -> 260 ms"]
@@ -0,0 +1,46 @@
+import threading
+
+import pandas as pd
+
+from dashboard_analysis import memory_profile
+
+
+def _copy_here(df):
+    return df.copy()
+
+
+def test_overlapping_tracking_restores_copy_once_all_exit():
+    original = pd.DataFrame.copy
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    entered, release = threading.Barrier(2), threading.Event()
+    seen = {}
+
+    def worker(name, copies):
+        with memory_profile.track_copies() as records:
+            entered.wait()
+            for _ in range(copies):
+                _copy_here(df)
+            if name == "first":
+                release.wait()
+        seen[name] = len(records)
+
+    first = threading.Thread(target=worker, args=("first", 1))
+    second = threading.Thread(target=worker, args=("second", 2))
+    first.start(), second.start()
+    second.join()
+    # The second tracker left while the first is still inside: the patch stays for it
+    assert pd.DataFrame.copy is not original
+    release.set()
+    first.join()
+
+    assert seen == {"first": 1, "second": 2}
+    assert pd.DataFrame.copy is original
+
+
+def test_untracked_threads_are_not_recorded():
+    df = pd.DataFrame({"a": [1.0]})
+    with memory_profile.track_copies() as records:
+        other = threading.Thread(target=_copy_here, args=(df,))
+        other.start(), other.join()
+        _copy_here(df)
+    assert len(records) == 1
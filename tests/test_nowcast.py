@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.nowcast import HF_COLUMNS, MidasNowcaster, build_nowcaster, load_state, nowcast_panel, update_nowcaster
+
+
+def _data(fx_end, monthly_end, fx_start="2020-01-01", monthly_start="2019-01-01"):
+    rng = np.random.default_rng(1)
+    days = pd.bdate_range("2019-06-03", "2022-12-30")
+    walk = np.exp(np.cumsum(rng.normal(0, 0.004, (len(days), 3)), axis=0)) * [1200.0, 180.0, 10.0]
+    fx = pd.DataFrame(walk, index=days, columns=HF_COLUMNS).loc[fx_start:fx_end]
+
+    months = pd.date_range("2019-01-01", "2022-12-01", freq="MS")
+    steps = rng.normal(0, 1, (len(months), 3))
+    monthly = {
+        "bok_rate": pd.DataFrame({"base_rate": 1.5 + 0.25 * np.round(np.cumsum(steps[:, 0]) / 4)}, index=months),
+        "cpi": pd.DataFrame({"Total item": 100 + np.cumsum(0.2 + 0.1 * steps[:, 1])}, index=months),
+        "kospi": pd.DataFrame({"KOSPI_Index(End Of)": 2000 * np.exp(np.cumsum(0.03 * steps[:, 2]))}, index=months),
+    }
+    monthly = {name: df.loc[monthly_start:monthly_end] for name, df in monthly.items()}
+    return {"daily": {"fx": fx}, "monthly": monthly}
+
+
+def _assert_same(a, b):
+    assert a.last_daily == b.last_daily and a.current_month == b.current_month
+    assert a.month_means.keys() == b.month_means.keys()
+    for month in a.month_means:
+        np.testing.assert_array_equal(a.month_means[month], b.month_means[month])
+    np.testing.assert_allclose(a._sum, b._sum)
+    np.testing.assert_allclose(a._weight, b._weight)
+    for name in a.targets:
+        assert a.targets[name]["fitted_through"] == b.targets[name]["fitted_through"]
+        np.testing.assert_allclose(a.targets[name]["theta"], b.targets[name]["theta"], rtol=1e-9)
+        np.testing.assert_allclose(a.targets[name]["P"], b.targets[name]["P"], rtol=1e-9)
+    for name, frame in nowcast_panel(a).items():
+        pd.testing.assert_frame_equal(frame, nowcast_panel(b)[name])
+
+
+def test_incremental_update_matches_full_replay(tmp_path):
+    state = tmp_path / "nowcaster.pkl"
+    # Mid-month cut: the resumed nowcaster carries the partial sums of an open month
+    update_nowcaster(_data("2021-06-16", "2021-04-01"), state)
+    assert load_state(state).extends(_data("2022-03-09", "2022-01-01"))
+    update_nowcaster(_data("2022-03-09", "2022-01-01"), state)
+    resumed = update_nowcaster(_data("2022-12-30", "2022-11-01"), state)
+
+    full = build_nowcaster(_data("2022-12-30", "2022-11-01"))
+    _assert_same(resumed, full)
+    assert not nowcast_panel(resumed)["cpi"].empty
+
+
+def test_revised_history_replays(tmp_path):
+    state = tmp_path / "nowcaster.pkl"
+    update_nowcaster(_data("2021-06-16", "2021-04-01"), state)
+
+    revised = _data("2022-03-09", "2022-01-01")
+    revised["monthly"]["cpi"].iloc[5] += 1.0
+    assert not load_state(state).extends(revised)
+    replayed = update_nowcaster(revised, state)
+    _assert_same(replayed, build_nowcaster(revised))
+
+
+def test_fit_starts_where_a_target_history_precedes_fx():
+    # Monthly history from 2019-01, FX only from 2020-01: the months before are skipped
+    nowcaster = build_nowcaster(_data("2022-12-30", "2022-11-01"))
+    for spec in nowcaster.targets.values():
+        assert spec["fitted_through"] == pd.Timestamp("2022-11-01")
+        assert np.any(spec["theta"] != 0)
+
+
+def test_daily_rows_must_move_forward():
+    nowcaster = MidasNowcaster()
+    nowcaster.add_daily(pd.Timestamp("2024-01-03"), [1.0, 1.0, 1.0])
+    with pytest.raises(ValueError):
+        nowcaster.add_daily(pd.Timestamp("2024-01-03"), [1.0, 1.0, 1.0])
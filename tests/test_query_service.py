@@ -0,0 +1,84 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from wsgiref.util import setup_testing_defaults
+
+from data_pipeline import store
+from query_service import QueryError, make_app, parse_query
+
+BUCKETS = {"D": "daily", "M": "monthly"}
+
+
+@pytest.fixture
+def app(tmp_path):
+    days = pd.bdate_range("2023-01-02", "2023-12-29", name="date")
+    rng = np.random.default_rng(4)
+    daily = pd.DataFrame({"a": rng.normal(size=len(days)).cumsum(), "b, c": np.arange(len(days), dtype=float)}, index=days)
+    months = pd.date_range("2023-01-01", "2023-12-01", freq="MS", name="date")
+    monthly = pd.DataFrame({"rate": np.linspace(1, 2, 12)}, index=months)
+    store.publish_data({"daily": {"fx": daily}, "monthly": {"rate": monthly}}, BUCKETS, "v1", tmp_path)
+    return make_app(tmp_path), daily, monthly
+
+
+def get(app, path, query="", headers=None):
+    environ = {"PATH_INFO": path, "QUERY_STRING": query, **(headers or {})}
+    setup_testing_defaults(environ)
+    status = {}
+
+    def start_response(s, h):
+        status["status"], status["headers"] = s, dict(h)
+
+    body = b"".join(app(environ, start_response))
+    return status["status"], status["headers"], body
+
+
+def frame(body):
+    return pa.ipc.open_stream(io.BytesIO(body)).read_all().to_pandas().set_index("date")
+
+
+def test_parse_query():
+    query = parse_query({"QUERY_STRING": "start=2023-02&columns=a&columns=b,%20c&freq=M&agg=last"})
+    assert query["start"] == pd.Timestamp("2023-02-01") and query["end"] is None
+    assert query["columns"] == ["a", "b, c"]
+    assert (query["freq"], query["agg"], query["format"]) == ("M", "last", "arrow")
+    for bad in ("freq=W", "agg=mode", "format=xml", "start=soon"):
+        with pytest.raises(QueryError):
+            parse_query({"QUERY_STRING": bad})
+
+
+def test_projection_and_date_range_pushdown(app):
+    app, daily, _ = app
+    status, headers, body = get(app, "/datasets/fx", "columns=b,%20c&start=2023-03-01&end=2023-03-31")
+    assert status == "200 OK" and headers["ETag"] == '"v1"'
+    df = frame(body)
+    assert list(df.columns) == ["b, c"]
+    expected = daily.loc["2023-03-01":"2023-03-31", ["b, c"]]
+    np.testing.assert_array_equal(df["b, c"].to_numpy(), expected["b, c"].to_numpy())
+    assert pd.DatetimeIndex(df.index).equals(expected.index)
+
+
+def test_resample_from_the_finer_bucket_over_whole_periods(app):
+    app, daily, _ = app
+    # A window starting mid-quarter still aggregates the whole first quarter
+    _, _, body = get(app, "/datasets/fx", "columns=a&freq=Q&agg=last&start=2023-02-15&end=2023-12-31")
+    df = frame(body)
+    expected = daily[["a"]].resample("QS").last()
+    np.testing.assert_allclose(df["a"].to_numpy(), expected["a"].to_numpy())
+    assert pd.DatetimeIndex(df.index).equals(expected.index)
+
+    # A frequency the pipeline already has is served from its own bucket
+    _, _, body = get(app, "/datasets/rate", "freq=M&format=csv")
+    assert body.decode().splitlines()[:2] == ['"date","rate"', "2023-01-01,1"]
+
+
+def test_etag_and_errors(app):
+    app, _, _ = app
+    assert get(app, "/datasets/fx", headers={"HTTP_IF_NONE_MATCH": '"v1"'})[0] == "304 Not Modified"
+    assert get(app, "/datasets/fx", headers={"HTTP_IF_NONE_MATCH": '"v0"'})[0] == "200 OK"
+    assert get(app, "/datasets/nope")[0] == "404 Not Found"
+    assert get(app, "/datasets/fx", "columns=zzz")[0] == "400 Bad Request"
+    assert get(app, "/datasets/rate", "freq=D")[0] == "400 Bad Request"
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.schema import SCHEMAS, read_source
+
+FILE = "Transactions test MoM.csv"
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    monkeypatch.setitem(SCHEMAS, FILE, {"columns": ["date", "Trading Value", "Index"], "date_format": "%Y/%m"})
+    path = tmp_path / FILE
+
+    def write(text):
+        path.write_text(text, encoding="utf-8-sig")
+        return path
+    return write
+
+
+def test_thousands_separators_and_na_markers_cast_to_float(source):
+    path = source('date,Trading Value,Index\n2024/01,"1,234,567.5", 2500.1\n2024/02,-,"2,601"\n2024/03,..,\n')
+    df = read_source(path)
+
+    assert list(df.columns) == ["date", "Trading Value", "Index"]
+    assert df["Trading Value"].dtype == "float64" and df["Index"].dtype == "float64"
+    np.testing.assert_array_equal(df["Trading Value"].to_numpy(), [1234567.5, np.nan, np.nan])
+    np.testing.assert_array_equal(df["Index"].to_numpy(), [2500.1, 2601.0, np.nan])
+    assert df["date"].tolist() == list(pd.date_range("2024-01-01", periods=3, freq="MS"))
+
+
+@pytest.mark.parametrize("header, message", [
+    ("date,Trading Value", r"missing \['Index'\]"),
+    ("date,Trading Value,Index,Volume", r"unexpected \['Volume'\]"),
+    ("date,Index,Trading Value", "column order changed"),
+    ("date,Trading value,Index", r"missing \['Trading Value'\], unexpected \['Trading value'\]"),
+])
+def test_header_drift_fails_before_parsing(source, header, message):
+    path = source(f"{header}\nnot a date,x,y\n")
+    with pytest.raises(ValueError, match=message):
+        read_source(path)
+
+
+def test_non_numeric_values_and_wrong_dates_are_rejected(source):
+    with pytest.raises(ValueError, match="non-numeric value in column 'Index'"):
+        read_source(source("date,Trading Value,Index\n2024/01,1,n/a\n"))
+    with pytest.raises(ValueError, match="declared format"):
+        read_source(source("date,Trading Value,Index\n2024-01-05,1,2\n"))
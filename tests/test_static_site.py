@@ -0,0 +1,60 @@
+import http.client
+import threading
+
+import pytest
+
+from static_site import serve, write_plotly_js
+
+
+@pytest.fixture
+def server(tmp_path):
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "index.html").write_text("viewer")
+    (site / "v1").mkdir()
+    (site / "v1" / "manifest.json").write_text("{}")
+    (tmp_path / "secret.txt").write_text("secret")
+    srv = serve(site, port=0)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv.server_address[1]
+    srv.shutdown()
+
+
+def get(port, path, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("GET", path, headers=headers or {})
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def cache_control(port, path):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("GET", path)
+    return conn.getresponse().getheader("Cache-Control")
+
+
+def test_serves_site_files(server):
+    assert get(server, "/") == (200, b"viewer")
+
+
+@pytest.mark.parametrize("path", ["/../secret.txt", "/%2e%2e/secret.txt", "/..%2fsecret.txt", "/%2e%2e%2fsecret.txt"])
+def test_no_path_outside_the_site(server, path):
+    status, body = get(server, path)
+    assert status == 404
+    assert b"secret" not in body
+
+
+def test_only_versioned_paths_are_immutable(server):
+    assert cache_control(server, "/index.html") == "no-cache"
+    assert cache_control(server, "/") == "no-cache"
+    assert "immutable" in cache_control(server, "/v1/manifest.json")
+
+
+def test_plotly_bundle_is_named_by_its_content(tmp_path):
+    rel = write_plotly_js(tmp_path)
+    assert rel.startswith("assets/plotly-") and rel.endswith(".min.js")
+    assert (tmp_path / f"{rel}.gz").is_file()
+    # Rebuilding with the same plotly keeps the name (and does not rewrite the file)
+    mtime = (tmp_path / f"{rel}.gz").stat().st_mtime_ns
+    assert write_plotly_js(tmp_path) == rel
+    assert (tmp_path / f"{rel}.gz").stat().st_mtime_ns == mtime
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.units import FX_COLUMNS, column_units, normalize_units
+
+USD = FX_COLUMNS["USD"]
+
+
+def test_usd_millions_to_krw_trillions_at_the_nearest_fixing():
+    # Yearly rows dated Jan 1: before the year's first fixing, so the nearest one is used
+    fx = pd.DataFrame({USD: [0.0, 1100.0, 1200.0, 1300.0]},
+                      index=pd.to_datetime(["2020-01-01", "2020-01-02", "2020-12-30", "2021-01-04"]))
+    debt = pd.DataFrame({"Gross External Debt": [500_000.0, 550_000.0], "GDP": [1_600_000.0, 1_800_000.0],
+                         "Other": [7.0, 8.0]}, index=pd.to_datetime(["2020-01-01", "2021-01-01"]))
+
+    out = normalize_units("debt_gdp", debt, fx)
+
+    # USD 500,000 mn at 1,100 KRW/USD (the 0.00 holiday row is not a fixing) = KRW 550 tn;
+    # 2021-01-01 is nearer to 2020-12-30 (2 days) than to 2021-01-04 (3 days)
+    assert out.loc["2020-01-01", "Gross External Debt"] == pytest.approx(500_000 * 1100 / 1e6)
+    assert out.loc["2020-01-01", "GDP"] == pytest.approx(1760.0)
+    assert out.loc["2021-01-01", "Gross External Debt"] == pytest.approx(550_000 * 1200 / 1e6)
+    # Columns outside the rule keep their unit; the input frame is not modified
+    assert out["Other"].tolist() == [7.0, 8.0]
+    assert debt.loc["2020-01-01", "Gross External Debt"] == 500_000.0
+
+
+def test_scaling_without_conversion():
+    trading = ["KOSDAQ_Trading Value", "KOSDAQ_Trading Value (Daily Arg.)",
+               "KOSPI_Trading Value", "KOSPI_Trading Value (Daily Arg.)"]
+    df = pd.DataFrame({**{c: [2.5e12] for c in trading}, "KOSPI_Market Capitalization": [2.0e12]},
+                      index=pd.to_datetime(["2024-01-01"]))
+    out = normalize_units("kospi", df)
+    assert out["KOSPI_Trading Value"].iloc[0] == pytest.approx(2500.0)   # KRW thousand -> KRW tn
+    assert out["KOSPI_Market Capitalization"].iloc[0] == 2.0e12
+    assert normalize_units("cpi", df) is df
+
+
+def test_conversion_needs_fx_and_units_are_reported():
+    df = pd.DataFrame({"Gross External Debt": [1.0], "GDP": [2.0]}, index=pd.to_datetime(["2024-01-01"]))
+    with pytest.raises(ValueError, match="needs the daily FX frame"):
+        normalize_units("debt_gdp", df)
+    assert column_units("fiscal_balance", ["Balance"]) == {"Balance": {"source": "KRW bn", "target": "KRW tn"}}
+    assert column_units("debt_gdp", ["GDP"])["GDP"] == {"source": "USD mn", "target": "KRW tn"}
+    np.testing.assert_array_equal(normalize_units("fiscal_balance", df * 1000).to_numpy(), df.to_numpy())
@@ -0,0 +1,64 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from data_pipeline import vintage
+from data_pipeline.vintage import OPEN, diff_cells, frames_as_of, list_vintages, read_cells, record_vintage, to_cells
+
+
+def _frame(values, start="2020-01-01"):
+    index = pd.date_range(start, periods=len(next(iter(values.values()))), freq="MS", name="date")
+    return pd.DataFrame(values, index=index).rename_axis(columns="series")
+
+
+FIRST = _frame({"a": [1.0, 2.0, 3.0], "b": [10.0, None, 30.0]})
+# a: March revised; b: January withdrawn, February filled in; c: new column
+SECOND = _frame({"a": [1.0, 2.0, 3.5], "b": [None, 20.0, 30.0], "c": [7.0, 8.0, 9.0]})
+
+
+def test_diff_cells_closes_revised_and_withdrawn_opens_revised_and_new():
+    current = to_cells(FIRST)
+    close_keys, added = diff_cells(current, to_cells(SECOND), pd.Timestamp("2024-02-01"))
+
+    closed = set(zip(close_keys["date"].dt.strftime("%Y-%m"), close_keys["column"]))
+    opened = set(zip(added["date"].dt.strftime("%Y-%m"), added["column"]))
+    assert closed == {("2020-03", "a"), ("2020-01", "b")}
+    assert opened == {("2020-03", "a"), ("2020-02", "b"), ("2020-01", "c"), ("2020-02", "c"), ("2020-03", "c")}
+    assert (added["recorded_to"] == OPEN).all()
+
+
+def test_round_trip_as_of_each_vintage(tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        first = record_vintage({"x": FIRST}, "v1", "2024-01-01", root=tmp_path)
+        second = record_vintage({"x": SECOND}, "v2", "2024-02-01", root=tmp_path)
+
+    assert first["datasets"]["x"] == {"columns": ["a", "b"], "columns_name": "series", "superseded": 0, "written": 5}
+    assert second["datasets"]["x"]["superseded"] == 2
+    assert second["datasets"]["x"]["written"] == 5
+
+    pd.testing.assert_frame_equal(frames_as_of("2024-01-15", tmp_path)["x"], FIRST, check_freq=False)
+    pd.testing.assert_frame_equal(frames_as_of("2024-02-01", tmp_path)["x"], SECOND, check_freq=False)
+    with pytest.raises(ValueError):
+        frames_as_of("2023-12-31", tmp_path)
+
+    # Unchanged history is stored once: 5 cells, then 5 more for the revisions and additions
+    assert len(read_cells("x", tmp_path)) == 10
+
+
+def test_recording_a_known_version_is_a_no_op(tmp_path):
+    record_vintage({"x": FIRST}, "v1", "2024-01-01", root=tmp_path)
+    assert record_vintage({"x": SECOND}, "v1", "2024-02-01", root=tmp_path) is None
+    assert [v["version"] for v in list_vintages(tmp_path)] == ["v1"]
+
+
+def test_clock_set_back_keeps_vintage_times_increasing(tmp_path, monkeypatch):
+    record_vintage({"x": FIRST}, "v1", "2030-01-01", root=tmp_path)
+    with pytest.raises(ValueError):
+        record_vintage({"x": SECOND}, "v2", "2029-12-31", root=tmp_path)
+
+    # The wall clock (now) is before the last vintage: the default time moves past it
+    entry = record_vintage({"x": SECOND}, "v2", root=tmp_path)
+    assert pd.Timestamp(entry["recorded_at"]) == pd.Timestamp("2030-01-01 00:00:01")
+    pd.testing.assert_frame_equal(frames_as_of(entry["recorded_at"], tmp_path)["x"], SECOND, check_freq=False)